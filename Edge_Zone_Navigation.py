@@ -2,18 +2,30 @@
 bl_info = {
     "name": "Edge Zone Navigation (Roll & Pan) [3.3 Compat]",
     "author": "mantukin (IPD Workshop)",
-    "version": (1, 20, 3), # Version increment for pan fix
+    "version": (1, 21, 0), # Direct roll/pan engines
     "blender": (3, 3, 0), # Minimum Blender version
     "location": "View3D > Sidebar (N Panel) > View Tab > Edge Zones Panel, or View Menu",
-    "description": "Adds interactive zones on edges of the 3D View. Right-Click+Drag in zones to roll (right) or pan (left/bottom). Cursor warps. Remembers state. (Adapted for Blender 3.3+, uses view_pan)",
-    "warning": "Requires Blender 3.3+. Uses view_pan for panning.",
+    "description": "Adds interactive zones on edges of the 3D View. Right-Click+Drag in zones to roll (right) or pan (left/bottom). Cursor warps. Remembers state. (Adapted for Blender 3.3+, moves the view directly; view_roll/view_pan as fallback)",
+    "warning": "Requires Blender 3.3+.",
     "doc_url": "",
     "category": "3D View",
 }
 import bpy
 import gpu
+import blf
 import math # For radians
-from gpu_extras.batch import batch_for_shader
+import time
+import collections
+import array
+import json
+import mmap
+import os
+import struct
+import cProfile
+import pstats
+import tempfile
+from types import SimpleNamespace
+from mathutils import Quaternion
 from bpy.app.handlers import persistent
 
 # --- Constants ---
@@ -23,453 +35,1391 @@ DEFAULT_ZONE_THICKNESS = 25 # For pan zones
 DEFAULT_ROLL_SENSITIVITY = 2.50
 
 # --- Global Variables ---
-_global_op_instance = None
+_listeners = {} # window pointer -> running listener operator (see Listener Registry)
 _draw_handler_ref = None
 _shader = None
 
+# --- Logging ---
+# Errors on per-event and per-frame paths go to a ring buffer. stdout gets at most one line per message
+# key per LOG_RATE_INTERVAL, so a persistent fault can't flood the console at event rate.
+LOG_CAPACITY = 200
+LOG_RATE_INTERVAL = 5.0 # Seconds
+
+class EventLog:
+    """Ring buffer of (time, level, key, message) plus per-key occurrence counts."""
+    __slots__ = ("entries", "counts", "suppressed", "last_logged")
+
+    def __init__(self):
+        self.entries = collections.deque(maxlen=LOG_CAPACITY)
+        self.counts = {}; self.suppressed = {}; self.last_logged = {}
+
+    def clear(self):
+        self.entries.clear(); self.counts.clear(); self.suppressed.clear(); self.last_logged.clear()
+
+    def add(self, level, key, fmt, args):
+        self.counts[key] = self.counts.get(key, 0) + 1
+        now = time.time()
+        if level == 'DEBUG': # Buffer only, which bounds it already
+            self.entries.append((now, level, key, fmt % args if args else fmt)); return
+        last = self.last_logged.get(key)
+        if last is not None and now - last < LOG_RATE_INTERVAL:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1; return
+        self.last_logged[key] = now
+        message = fmt % args if args else fmt # Formatted only when it is kept
+        skipped = self.suppressed.pop(key, 0)
+        if skipped: message += f" ({skipped} more suppressed)"
+        self.entries.append((now, level, key, message))
+        print(f"Edge Zone Navigation [{level}]: {message}")
+
+    def format_lines(self):
+        return [f"{time.strftime('%H:%M:%S', time.localtime(t))} {level:<7} {key}: {message}" for t, level, key, message in self.entries]
+
+event_log = EventLog()
+
+def log_error(key, fmt, *args): event_log.add('ERROR', key, fmt, args)
+def log_warning(key, fmt, *args): event_log.add('WARNING', key, fmt, args)
+def _log_debug(key, fmt, *args): event_log.add('DEBUG', key, fmt, args)
+def _log_noop(*args): pass
+
+log_debug = _log_noop # Rebound by set_debug_logging(); while disabled a debug call costs one empty call
+
+def set_debug_logging(enabled):
+    global log_debug
+    log_debug = _log_debug if enabled else _log_noop
+
+# --- Instrumentation ---
+# Off by default. When off, modal() pays one flag check per event and the untimed draw callback is
+# installed; turning it on swaps in draw_callback_px_timed and starts filling the histograms.
+HISTOGRAM_BUCKETS = 24 # Bucket i counts values v with int(v).bit_length() == i, i.e. [2**(i-1), 2**i)
+
+class Histogram:
+    """Fixed log2-bucket histogram in a preallocated array; add() allocates nothing."""
+    __slots__ = ("buckets", "count", "maximum")
+
+    def __init__(self):
+        self.buckets = array.array('Q', bytes(8 * HISTOGRAM_BUCKETS))
+        self.count = 0; self.maximum = 0
+
+    def reset(self):
+        for index in range(HISTOGRAM_BUCKETS): self.buckets[index] = 0
+        self.count = 0; self.maximum = 0
+
+    def add(self, value):
+        value = int(value)
+        index = value.bit_length()
+        self.buckets[index if index < HISTOGRAM_BUCKETS else HISTOGRAM_BUCKETS - 1] += 1
+        self.count += 1
+        if value > self.maximum: self.maximum = value
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket reaching the given fraction of samples, capped at the maximum seen."""
+        if not self.count: return 0
+        target = fraction * self.count; seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target: return min((1 << index) - 1, self.maximum)
+        return self.maximum
+
+class LatencyMetrics:
+    """Event handler and draw times (microseconds) plus view operations and redraws per drag."""
+    __slots__ = ("enabled", "event_us", "draw_us", "view_ops_per_drag", "redraws_per_drag")
+
+    def __init__(self):
+        self.enabled = False
+        self.event_us = Histogram(); self.draw_us = Histogram()
+        self.view_ops_per_drag = Histogram(); self.redraws_per_drag = Histogram()
+
+    def reset(self):
+        for histogram in (self.event_us, self.draw_us, self.view_ops_per_drag, self.redraws_per_drag): histogram.reset()
+
+    def summary_lines(self):
+        def pct(h): return f"p50 {h.percentile(0.5)}  p95 {h.percentile(0.95)}  p99 {h.percentile(0.99)}  max {h.maximum}"
+        return (f"Event (us): {pct(self.event_us)}  n={self.event_us.count}",
+                f"Draw (us): {pct(self.draw_us)}  n={self.draw_us.count}",
+                f"View ops/drag: {pct(self.view_ops_per_drag)}",
+                f"Redraws/drag: {pct(self.redraws_per_drag)}")
+
+metrics = LatencyMetrics()
+
+def set_instrumentation(enabled):
+    """Turns timing on/off and installs the matching draw callback if one is installed."""
+    metrics.enabled = enabled
+    reinstall_draw_handler()
+
+# --- Profiling ---
+# On request, listener events and zone draws run under cProfile for a bounded time. The result is
+# written as .pstats and as collapsed stacks ("outer;inner;leaf microseconds" lines) for flamegraph
+# tools. cProfile keeps no stacks, so the collapsed file splits each function's time over its
+# callers in proportion to the time it spent under each of them.
+PROFILE_MAX_DEPTH = 64
+
+def default_output_folder():
+    """Folder for recordings and profiles. Not bpy.app.tempdir, which Blender deletes on quit."""
+    return os.path.join(tempfile.gettempdir(), "edge_zone_navigation")
+
+def collapse_stats(raw):
+    """Yields ('outer;...;leaf', microseconds) from pstats data (Stats.stats)."""
+    children = collections.defaultdict(list) # caller -> [(callee, callee time under this caller)]
+    for function, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        for caller, edge in callers.items(): children[caller].append((function, edge[3]))
+    folded = collections.Counter()
+
+    def label(function):
+        filename, line, name = function
+        return name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})" # "~" marks built-ins
+
+    def walk(function, share, path, stack):
+        _cc, _nc, self_time, _ct, _callers = raw[function]
+        stack = stack + (label(function),); path = path | {function}
+        weight = int(self_time * share * 1e6)
+        if weight: folded[";".join(stack)] += weight
+        if len(stack) >= PROFILE_MAX_DEPTH: return
+        for child, edge_time in children.get(function, ()):
+            child_time = raw[child][3]
+            if child not in path and child_time > 0: walk(child, share * min(edge_time / child_time, 1.0), path, stack)
+
+    for function, entry in raw.items():
+        if not entry[4]: walk(function, 1.0, frozenset(), ()) # Roots: entered while profiling started, e.g. _handle_event
+    return sorted(folded.items())
+
+class NavigationProfiler:
+    """cProfile around listener events and zone draws, stopped by a timer after 'duration' seconds."""
+    __slots__ = ("active", "profile", "folder", "started", "duration", "calls", "last_paths")
+
+    def __init__(self):
+        self.active = False; self.profile = None; self.folder = ""; self.started = 0.0; self.duration = 0.0
+        self.calls = 0; self.last_paths = ()
+
+    @property
+    def remaining(self): return max(0.0, self.duration - (time.perf_counter() - self.started)) if self.active else 0.0
+
+    def start(self, duration, folder):
+        if self.active: self.stop()
+        self.profile = cProfile.Profile(); self.folder = folder; self.duration = duration; self.calls = 0
+        self.started = time.perf_counter(); self.active = True
+        bpy.app.timers.register(_profile_timeout, first_interval=duration, persistent=True) # Loading a file drops non-persistent timers
+        reinstall_draw_handler()
+
+    def run(self, function, *args):
+        self.calls += 1
+        try: self.profile.enable()
+        except ValueError: return function(*args) # Another profiler is running (e.g. a debugger's)
+        try: return function(*args)
+        finally: self.profile.disable()
+
+    def stop(self):
+        """Stops profiling and writes the files. Returns their paths, or () if nothing was captured."""
+        if not self.active: return ()
+        self.active = False
+        if bpy.app.timers.is_registered(_profile_timeout): bpy.app.timers.unregister(_profile_timeout)
+        reinstall_draw_handler()
+        profile = self.profile; self.profile = None
+        try: stats = pstats.Stats(profile)
+        except TypeError: return () # No calls were profiled
+        os.makedirs(self.folder, exist_ok=True)
+        base = stem = os.path.join(self.folder, time.strftime("edge_zone_profile_%Y%m%d-%H%M%S")); n = 1
+        while os.path.exists(base + ".pstats"): n += 1; base = f"{stem}_{n}" # Two profiles within a second
+        stats.dump_stats(base + ".pstats")
+        with open(base + ".collapsed.txt", "w") as f: f.writelines(f"{stack} {weight}\n" for stack, weight in collapse_stats(stats.stats))
+        self.last_paths = (base + ".pstats", base + ".collapsed.txt")
+        return self.last_paths
+
+navigation_profiler = NavigationProfiler()
+
+def _profile_timeout():
+    try: paths = navigation_profiler.stop()
+    except OSError as e: log_error("profile", "Could not write profile: %s", e); return None
+    if paths: print(f"Edge Zone Navigation: Profile written to {paths[0]}")
+    return None
+
+# --- Zone Geometry Cache ---
+# Rects are (zone_type, xmin, ymin, xmax, ymax) in region pixels, listed in hit-test priority order.
+_prefs_revision = 0 # Bumped whenever a setting that shapes the zones changes
+_zone_geometry_cache = {} # region pointer -> ((width, height, prefs revision), rects)
+
+def bump_prefs_revision():
+    global _prefs_revision
+    _prefs_revision += 1
+    _zone_geometry_cache.clear(); _overlay_cache.clear()
+
+def compute_zone_rects(width, height, prefs):
+    """Builds the rects of all enabled zones for a region of the given size."""
+    if width <= 0 or height <= 0: return ()
+    rects = []
+    if prefs.enable_roll_zone and prefs.roll_zone_width > 0: # Right edge
+        xmin = max(width - prefs.roll_zone_width, 0)
+        rects.append(('ROLL', xmin, 0, width, height))
+    thickness = prefs.pan_zone_thickness
+    if thickness > 0:
+        if prefs.enable_pan_vertical_zone: # Left edge
+            rects.append(('PAN_V', 0, 0, min(thickness, width), height))
+        if prefs.enable_pan_horizontal_zone: # Bottom edge, starts after the left zone
+            xmin = min(thickness, width) if prefs.enable_pan_vertical_zone else 0
+            if xmin < width: rects.append(('PAN_H', xmin, 0, width, min(thickness, height)))
+    return tuple(rects)
+
+def get_zone_rects(region, prefs):
+    """Cached compute_zone_rects for a region; recomputed only on resize or preference changes."""
+    key = (region.width, region.height, _prefs_revision)
+    region_ptr = region.as_pointer()
+    entry = _zone_geometry_cache.get(region_ptr)
+    if entry is not None and entry[0] == key: return entry[1]
+    rects = compute_zone_rects(key[0], key[1], prefs)
+    _zone_geometry_cache[region_ptr] = (key, rects)
+    return rects
+
+def hit_test_zone(rects, x, y):
+    for rect in rects:
+        if rect[1] <= x < rect[3] and rect[2] <= y < rect[4]: return rect[0]
+    return 'NONE'
+
 # --- Drawing Shader ---
+_shader_pos_len = 2 # Components of the shader's "pos" attribute
+
 def get_shader():
-    global _shader
+    """Per-vertex color shader, so every zone goes into one batch and one draw call."""
+    global _shader, _shader_pos_len
     if _shader is None:
-        try: _shader = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
+        try: _shader = gpu.shader.from_builtin('2D_SMOOTH_COLOR'); _shader_pos_len = 2
         except Exception:
-            try: _shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            except Exception as e_legacy: print(f"Failed to get shader: {e_legacy}"); return None
+            try: _shader = gpu.shader.from_builtin('SMOOTH_COLOR'); _shader_pos_len = 3 # Blender 4.0+ names
+            except Exception as e_legacy: log_error("shader", "Failed to get shader: %s", e_legacy); return None
     return _shader
 
-def create_rect_batch(rect_verts):
-    shader = get_shader();
-    if not shader or not rect_verts: return None
-    indices = ((0, 1, 2), (0, 2, 3))
-    positions = [tuple(rect_verts['tl']), tuple(rect_verts['tr']), tuple(rect_verts['br']), tuple(rect_verts['bl'])]
-    for pos in positions:
-        if not all(isinstance(coord, (int, float)) and math.isfinite(coord) for coord in pos):
-            return None
-    try: return batch_for_shader(shader, 'TRIS', {"pos": positions}, indices=indices)
-    except Exception as e: print(f"Error creating batch: {e}"); return None
+# --- Zone Overlay Batch ---
+class ZoneOverlay:
+    """All zones of one region in a single position buffer; colors live in small per-state buffers."""
+    __slots__ = ("zone_rects", "pos_buffer", "index_buffer", "batches")
+    MAX_COLOR_STATES = 8 # Idle + one per highlighted zone, with headroom for color edits
+
+    def __init__(self, zone_rects, pos_buffer, index_buffer):
+        self.zone_rects = zone_rects; self.pos_buffer = pos_buffer; self.index_buffer = index_buffer
+        self.batches = {} # color state key -> GPUBatch sharing pos_buffer/index_buffer
+
+    def get_batch(self, highlight_zone, idle_color, active_color):
+        key = (highlight_zone, idle_color, active_color)
+        batch = self.batches.get(key)
+        if batch is None:
+            colors = []
+            for rect in self.zone_rects:
+                colors.extend((active_color if rect[0] == highlight_zone else idle_color,) * 4)
+            color_format = gpu.types.GPUVertFormat()
+            color_format.attr_add(id="color", comp_type='F32', len=4, fetch_mode='FLOAT')
+            color_buffer = gpu.types.GPUVertBuf(color_format, len(colors))
+            color_buffer.attr_fill("color", colors)
+            batch = gpu.types.GPUBatch(type='TRIS', buf=self.pos_buffer, elem=self.index_buffer)
+            batch.vertbuf_add(color_buffer)
+            if len(self.batches) >= self.MAX_COLOR_STATES: self.batches.clear()
+            self.batches[key] = batch
+        return batch
+
+def create_zone_overlay(zone_rects):
+    if not zone_rects or not get_shader(): return None
+    positions = []; indices = []
+    for rect in zone_rects:
+        _zone_type, xmin, ymin, xmax, ymax = rect
+        base = len(positions)
+        corners = ((xmin, ymax), (xmax, ymax), (xmax, ymin), (xmin, ymin)) # tl, tr, br, bl
+        positions.extend(corners if _shader_pos_len == 2 else [(x, y, 0.0) for x, y in corners])
+        indices.extend(((base, base + 1, base + 2), (base, base + 2, base + 3)))
+    try:
+        pos_format = gpu.types.GPUVertFormat()
+        pos_format.attr_add(id="pos", comp_type='F32', len=_shader_pos_len, fetch_mode='FLOAT')
+        pos_buffer = gpu.types.GPUVertBuf(pos_format, len(positions))
+        pos_buffer.attr_fill("pos", positions)
+        return ZoneOverlay(zone_rects, pos_buffer, gpu.types.GPUIndexBuf(type='TRIS', seq=indices))
+    except Exception as e: log_error("overlay", "Error creating zone overlay: %s", e); return None
+
+# --- Overlay Cache ---
+_overlay_cache = {} # region pointer -> ZoneOverlay (or None if it could not be built)
+
+def get_zone_overlay(region, zone_rects):
+    """Overlay for the region's zones, rebuilt only when the zone geometry changed (resize, zone settings)."""
+    region_ptr = region.as_pointer()
+    overlay = _overlay_cache.get(region_ptr)
+    if overlay is not None and overlay.zone_rects == zone_rects: return overlay
+    overlay = create_zone_overlay(zone_rects)
+    _overlay_cache[region_ptr] = overlay
+    return overlay
 
 # --- Draw Handler ---
-def draw_callback_px(op, context):
-    try: _ = op.bl_idname; is_op_valid = True
-    except (ReferenceError, AttributeError): is_op_valid = False
-    if not is_op_valid: return
-
+def is_navigation_active(window):
+    """True if RMB in a zone does something in this window: the keymap item is bound, or the window has a listener."""
+    return bool(_addon_keymaps) or (window is not None and window.as_pointer() in _listeners)
+
+def draw_callback_px():
+    """Draws the zones of the 3D View being redrawn; the zone being dragged (if any) uses the active color."""
+    context = bpy.context
+    if not is_navigation_active(context.window): # Runs for every 3D View: bail out before any other work
+        request_window_listener(context.window); return
     region = context.region; view3d = context.space_data
     if not region or not view3d or view3d.type != 'VIEW_3D' or region.type != 'WINDOW': return
 
-    try:
-        prefs = op.get_prefs(context)
-    except (ReferenceError, AttributeError): return
+    prefs = get_prefs_snapshot(context)
 
-    is_dragging = getattr(op, "is_dragging", False)
-    active_zone = getattr(op, "active_zone_type", 'NONE')
+    active_zone = 'NONE'
+    owner = _drag_owner
+    if owner is not None:
+        try: state = owner.state
+        except ReferenceError: state = None
+        if state is not None and state.is_dragging:
+            state.frame_pending = False # The last view update reaches the screen with this frame
+            if state.region_key == region.as_pointer(): active_zone = state.active_zone_type
 
-    try:
-        roll_zone_coords = op.get_roll_zone_rect_coords(context, prefs) if prefs.enable_roll_zone else None
-        pan_v_zone_coords = op.get_pan_v_zone_rect_coords(context, prefs) if prefs.enable_pan_vertical_zone else None
-        pan_h_zone_coords = op.get_pan_h_zone_rect_coords(context, prefs) if prefs.enable_pan_horizontal_zone else None
-    except (ReferenceError, AttributeError):
-        return
-
-    if not roll_zone_coords and not pan_v_zone_coords and not pan_h_zone_coords: return
+    try: zone_rects = get_zone_rects(region, prefs)
+    except (ReferenceError, AttributeError): return
+    if not zone_rects: return
 
     try:
         shader = get_shader()
-        if not shader: return
+        overlay = get_zone_overlay(region, zone_rects)
+        if not shader or not overlay: return
+        batch = overlay.get_batch(active_zone, prefs.zone_idle_rgba, prefs.zone_active_rgba)
         shader.bind(); gpu.state.blend_set('ALPHA')
-        opacity = prefs.zone_opacity
-
-        zones_to_draw = []
-        if roll_zone_coords: zones_to_draw.append(('ROLL', roll_zone_coords))
-        if pan_v_zone_coords: zones_to_draw.append(('PAN_V', pan_v_zone_coords))
-        if pan_h_zone_coords: zones_to_draw.append(('PAN_H', pan_h_zone_coords))
-
-        for zone_type, coords in zones_to_draw:
-            is_active_zone = is_dragging and active_zone == zone_type
-            base_color = prefs.zone_active_color if is_active_zone else prefs.zone_color
-            final_color = (base_color[0], base_color[1], base_color[2], opacity)
-            shader.uniform_float("color", final_color)
-            batch_zone = create_rect_batch(coords)
-            if batch_zone: batch_zone.draw(shader)
-
+        batch.draw(shader)
         gpu.state.blend_set('NONE')
     except ReferenceError:
         try: gpu.state.blend_set('NONE')
         except Exception: pass
     except Exception as e:
-        print(f"Error during drawing: {e}")
+        log_error("draw", "Error during drawing: %s", e)
         try: gpu.state.blend_set('NONE')
         except Exception: pass
 
+def draw_callback_px_timed():
+    """draw_callback_px with its time recorded, plus the metrics HUD if enabled."""
+    start = time.perf_counter()
+    draw_callback_px()
+    metrics.draw_us.add((time.perf_counter() - start) * 1e6)
+    context = bpy.context
+    if is_navigation_active(context.window) and get_prefs_snapshot(context).instrumentation_hud: draw_metrics_hud(context.region)
+
+def draw_callback_px_profiled():
+    navigation_profiler.run(draw_callback_px_timed if metrics.enabled else draw_callback_px)
+
+def draw_metrics_hud(region):
+    if region is None or region.type != 'WINDOW': return
+    font_id = 0
+    try: blf.size(font_id, 12)
+    except TypeError: blf.size(font_id, 12, 72) # Blender < 3.4 still takes a dpi argument
+    blf.color(font_id, 1.0, 1.0, 1.0, 0.9)
+    y = region.height - 60
+    for line in metrics.summary_lines() + (f"Warps: {drag_telemetry.warps}  View updates: {drag_telemetry.view_updates}",):
+        blf.position(font_id, 20, y, 0); blf.draw(font_id, line)
+        y -= 16
+
+def ensure_draw_handler():
+    """Adds the zone draw handler if it is not installed. Returns False if it could not be added."""
+    global _draw_handler_ref
+    if _draw_handler_ref is not None: return True
+    if navigation_profiler.active: callback = draw_callback_px_profiled
+    else: callback = draw_callback_px_timed if metrics.enabled else draw_callback_px
+    try:
+        _draw_handler_ref = bpy.types.SpaceView3D.draw_handler_add(callback, (), 'WINDOW', 'POST_PIXEL')
+    except Exception as e:
+        print(f"Error adding draw handler: {e}"); _draw_handler_ref = None
+        return False
+    return True
+
+def remove_draw_handler():
+    global _draw_handler_ref
+    if _draw_handler_ref is None: return
+    try: bpy.types.SpaceView3D.draw_handler_remove(_draw_handler_ref, 'WINDOW')
+    except (ValueError, RuntimeError): pass
+    _draw_handler_ref = None
+
+def reinstall_draw_handler():
+    """Swaps in the callback matching the current timing/profiling state, if a handler is installed."""
+    if _draw_handler_ref is not None:
+        remove_draw_handler(); ensure_draw_handler()
+
+# --- View Engines ---
+ROLL_AXIS_LOCAL = (0.0, 0.0, 1.0) # View-space Z, the axis view_roll turns around
+
+def apply_view_roll(region_3d, angle):
+    """Rolls the view by 'angle' radians with one quaternion multiply (same direction as view3d.view_roll)."""
+    rotation = region_3d.view_rotation @ Quaternion(ROLL_AXIS_LOCAL, angle)
+    rotation.normalize() # Avoid precision loss over long drags
+    region_3d.view_rotation = rotation
+
+def can_apply_view_directly(region_3d):
+    """Direct engines write RegionView3D; camera views still go through the view operators."""
+    if region_3d is None: return False
+    try: return region_3d.view_perspective != 'CAMERA'
+    except (ReferenceError, AttributeError): return False
+
+VIEW_PAN_STEP_PX = (32.0, 25.0) # Pixels one view3d.view_pan step moves the view (x, y)
+
+def apply_view_pan(region, region_3d, dx, dy):
+    """Moves the view center by (dx, dy) region pixels, measured at the depth of the view center.
+
+    Mirrors ED_view3d_win_to_delta, so it is correct for perspective and ortho views and
+    follows view_distance. Positive values move the view like PANRIGHT/PANUP.
+    """
+    width = region.width; height = region.height
+    if width <= 0 or height <= 0: return
+    persmat = region_3d.perspective_matrix
+    location = region_3d.view_location
+    row_w = persmat[3]
+    zfac = abs(row_w[0] * location[0] + row_w[1] * location[1] + row_w[2] * location[2] + row_w[3])
+    if zfac < 1.e-6: zfac = 1.0
+    persinv = persmat.inverted_safe()
+    fx = 2.0 * dx * zfac / width; fy = 2.0 * dy * zfac / height
+    region_3d.view_location = location + persinv.col[0].xyz * fx + persinv.col[1].xyz * fy
+
+def can_pan_view_directly(space_data, region_3d):
+    """Views locked to the 3D cursor or an object pan through a lock offset only view_pan can reach.
+    Quad views with Sync View on also need view_pan, which copies the new location to the other side views."""
+    if not can_apply_view_directly(region_3d): return False
+    try: return not (space_data.lock_cursor or space_data.lock_object or region_3d.show_sync_view)
+    except (ReferenceError, AttributeError): return False
+
+def uses_stepped_engine(zone_type, prefs, space_data, region_3d):
+    """True if a drag in 'zone_type' moves the view through view_roll/view_pan instead of writing it directly."""
+    if zone_type == 'ROLL': return prefs.roll_mode != 'DIRECT' or not can_apply_view_directly(region_3d)
+    if zone_type in {'PAN_V', 'PAN_H'}: return prefs.pan_mode != 'DIRECT' or not can_pan_view_directly(space_data, region_3d)
+    return False
+
+# --- Redraw Scheduling ---
+class RedrawScheduler:
+    """Collects redraw requests while an event is handled and tags the area at most once, only if dirty."""
+    __slots__ = ("dirty", "events_processed", "redraws_requested")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.dirty = False; self.events_processed = 0; self.redraws_requested = 0
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def flush(self, area):
+        """Call once per processed event. Returns True when a redraw was requested."""
+        self.events_processed += 1
+        if not self.dirty: return False
+        self.dirty = False
+        try: area.tag_redraw()
+        except (ReferenceError, AttributeError): return False
+        self.redraws_requested += 1
+        return True
+
+def tag_view3d_redraw(context):
+    """Tags every 3D View in every window, e.g. after zone settings changed."""
+    try: windows = context.window_manager.windows
+    except AttributeError: return
+    for window in windows:
+        if not window.screen: continue
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                try: area.tag_redraw()
+                except Exception: pass
+
+# --- Navigation LOD ---
+class NavigationLOD:
+    """Swaps in cheaper viewport settings for the length of a drag and puts the original values back."""
+    __slots__ = ("saved",)
+
+    def __init__(self):
+        self.saved = [] # (owner, attribute, original value) in the order they were changed
+
+    @property
+    def active(self): return bool(self.saved)
+
+    def _set(self, owner, attr, value):
+        try:
+            original = getattr(owner, attr)
+            if original == value: return
+            setattr(owner, attr, value)
+        except (AttributeError, TypeError, ValueError, ReferenceError, RuntimeError) as e:
+            log_error("lod_set", "Navigation LOD: could not set %s: %s", attr, e); return
+        self.saved.append((owner, attr, original))
+
+    def apply(self, context, prefs):
+        """Applies the settings enabled in the preferences; each one is restored independently."""
+        if self.saved: self.restore() # Never stack captures, the second one would save LOD values
+        scene = context.scene; space = context.space_data
+        if prefs.lod_simplify and scene is not None:
+            render = scene.render
+            try: levels = min(render.simplify_subdivision, prefs.lod_max_subdivision)
+            except (AttributeError, ReferenceError): levels = prefs.lod_max_subdivision
+            self._set(render, "use_simplify", True)
+            self._set(render, "simplify_subdivision", levels)
+        if space is None or space.type != 'VIEW_3D': return
+        if prefs.lod_hide_overlays:
+            self._set(space.overlay, "show_overlays", False)
+        if prefs.lod_solid_shading:
+            self._set(space.shading, "type", 'SOLID') # Also leaves wireframe shading
+            self._set(space.shading, "show_xray", False)
+
+    def restore(self):
+        """Puts back every value changed by apply(), last change first. Safe to call at any time."""
+        saved = self.saved; self.saved = []
+        for owner, attr, original in reversed(saved):
+            try: setattr(owner, attr, original)
+            except (AttributeError, TypeError, ValueError, ReferenceError, RuntimeError) as e:
+                log_warning("lod_restore", "Navigation LOD: could not restore %s: %s", attr, e) # e.g. the file was closed meanwhile
+
+navigation_lod = NavigationLOD()
+
 # --- Stop any running instance / Cleanup global variables ---
 def cleanup_previous_state():
     """Clears global variables and handlers from previous state."""
-    global _global_op_instance, _draw_handler_ref
+    global _drag_owner
+    remove_draw_handler()
+    navigation_lod.restore()
 
-    if _draw_handler_ref is not None:
-        try: bpy.types.SpaceView3D.draw_handler_remove(_draw_handler_ref, 'WINDOW')
-        except (ValueError, RuntimeError) as e: pass
-        _draw_handler_ref = None
+    for op in _listeners.values(): op.is_running = False # Their handlers exit on the next event, restoring the cursor
+    _listeners.clear(); _auto_start_windows.clear()
+    _drag_owner = None
 
-    if _global_op_instance is not None:
-        _global_op_instance = None
+    _zone_geometry_cache.clear(); _overlay_cache.clear()
 
-# --- Modal Operator ---
-class VIEW3D_OT_edge_zone_navigation(bpy.types.Operator):
-    bl_idname = "view3d.edge_zone_navigation"; bl_label = "Run Edge Zone Navigation (Roll/Pan)"; bl_options = {'REGISTER', 'UNDO'}
+# --- Drag State ---
+class DragState:
+    """Mutable per-listener drag state as plain attributes, so per-event updates skip the RNA layer."""
+    __slots__ = ("is_dragging", "active_zone_type", "start_mouse_x", "start_mouse_y",
+                 "last_mouse_region_x", "last_mouse_region_y", "accumulated_dx", "accumulated_dy", "cursor_was_hidden",
+                 "region_key", "view_ops", "redraws_at_start", "warp_pending", "warp_x", "warp_y", "pending_dx", "pending_dy", "frame_pending", "frame_pending_since")
 
-    _timer = None
-    is_running: bpy.props.BoolProperty(default=False, options={'SKIP_SAVE'})
-    is_dragging: bpy.props.BoolProperty(default=False, options={'SKIP_SAVE'})
-    start_mouse_x: bpy.props.IntProperty(default=0, options={'SKIP_SAVE'})
-    start_mouse_y: bpy.props.IntProperty(default=0, options={'SKIP_SAVE'})
-    accumulated_dx: bpy.props.FloatProperty(default=0.0, options={'SKIP_SAVE'})
-    accumulated_dy: bpy.props.FloatProperty(default=0.0, options={'SKIP_SAVE'})
-    last_mouse_region_x: bpy.props.IntProperty(default=0, options={'SKIP_SAVE'})
-    last_mouse_region_y: bpy.props.IntProperty(default=0, options={'SKIP_SAVE'})
-    cursor_was_hidden: bpy.props.BoolProperty(default=False, options={'SKIP_SAVE'})
-    active_zone_type: bpy.props.EnumProperty(
-        items=[
-            ('NONE', "None", "No zone active"),
-            ('ROLL', "Roll", "Roll zone active (right edge)"),
-            ('PAN_V', "Vertical Pan", "Vertical pan zone active (left edge)"),
-            ('PAN_H', "Horizontal Pan", "Horizontal pan zone active (bottom edge)")
-        ],
-        name="Active Zone", default='NONE', options={'SKIP_SAVE'}
-    )
-    def get_prefs(self, context):
-        try: return context.preferences.addons[__name__].preferences
-        except KeyError:
-            class DummyPrefs:
-                enable_roll_zone = True; enable_pan_vertical_zone = True; enable_pan_horizontal_zone = True
-                roll_zone_width = 365; pan_zone_thickness = 25
-                zone_color = (0.2, 0.2, 0.8); zone_active_color = (0.8, 0.2, 0.2)
-                zone_opacity = 0.15; hide_cursor_on_drag = True
-                invert_roll_direction = True; invert_pan_vertical = False; invert_pan_horizontal = False
-                roll_sensitivity = DEFAULT_ROLL_SENSITIVITY; roll_angle = DEFAULT_ROLL_ANGLE_DEGREES
-                pan_sensitivity = DEFAULT_PAN_SENSITIVITY
-                auto_start_listener = True
-            print("Warning: Could not find addon preferences, using fallback defaults.")
-            return DummyPrefs()
+    def __init__(self):
+        self.start_mouse_x = 0; self.start_mouse_y = 0
+        self.last_mouse_region_x = 0; self.last_mouse_region_y = 0
+        self.reset()
 
-    # --- Zone Coordinates Calculation ---
-    def get_roll_zone_rect_coords(self, context, prefs):
-        region = context.region
-        if not region: return None
-        width = region.width; height = region.height; zone_width_px = prefs.roll_zone_width
-        if width <= 0 or height <= 0 or zone_width_px <= 0: return None
-        xmin = width - zone_width_px; xmax = width; ymin = 0; ymax = height
-        if xmin < 0: xmin = 0; zone_width_px = width
-        if xmin >= xmax or ymin >= ymax: return None
-        return { 'tl': (xmin, ymax), 'tr': (xmax, ymax), 'br': (xmax, ymin), 'bl': (xmin, ymin),
-                 'width': zone_width_px, 'height': height, 'xmin': xmin, 'xmax': xmax, 'ymin': ymin, 'ymax': ymax }
-    def get_pan_v_zone_rect_coords(self, context, prefs): # Left zone
-        region = context.region
-        if not region: return None
-        width = region.width; height = region.height; zone_thickness_px = prefs.pan_zone_thickness
-        if width <= 0 or height <= 0 or zone_thickness_px <= 0: return None
-        xmin = 0; xmax = zone_thickness_px; ymin = 0; ymax = height
-        if xmax > width: xmax = width
-        if xmin >= xmax or ymin >= ymax: return None
-        return { 'tl': (xmin, ymax), 'tr': (xmax, ymax), 'br': (xmax, ymin), 'bl': (xmin, ymin),
-                 'width': zone_thickness_px, 'height': height, 'xmin': xmin, 'xmax': xmax, 'ymin': ymin, 'ymax': ymax }
-    def get_pan_h_zone_rect_coords(self, context, prefs): # Bottom zone
-        region = context.region
-        if not region: return None
-        width = region.width; height = region.height; zone_thickness_px = prefs.pan_zone_thickness
-        if width <= 0 or height <= 0 or zone_thickness_px <= 0: return None
-        xmin = 0; xmax = width; ymin = 0; ymax = zone_thickness_px
-        if prefs.enable_pan_vertical_zone: xmin = min(prefs.pan_zone_thickness, width)
+    def reset(self):
+        self.is_dragging = False; self.active_zone_type = 'NONE' # 'NONE', 'ROLL', 'PAN_V' or 'PAN_H'
+        self.region_key = 0 # Pointer of the region being dragged in; only it shows the active zone
+        self.view_ops = 0; self.redraws_at_start = 0
+        self.accumulated_dx = 0.0; self.accumulated_dy = 0.0
+        self.cursor_was_hidden = False
+        self.warp_pending = False; self.warp_x = 0; self.warp_y = 0 # Window coords of our last cursor_warp
+        self.pending_dx = 0; self.pending_dy = 0 # Motion not yet applied to the view (frame pacing)
+        self.frame_pending = False; self.frame_pending_since = 0.0 # A view update was made and not drawn yet
+
+class DragTelemetry:
+    """Counters over all zone drags: MOUSEMOVEs handled, cursor warps, and warp echoes dropped unprocessed."""
+    __slots__ = ("moves", "warps", "synthetic_dropped", "view_updates")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.moves = 0; self.warps = 0; self.synthetic_dropped = 0; self.view_updates = 0
+
+drag_telemetry = DragTelemetry()
+
+def cursor_needs_warp(zone_type, x, y, width, height, margin):
+    """True if a drag cursor at region (x, y) is within 'margin' of the edge along the drag axis or outside the region across it."""
+    if zone_type == 'PAN_H': along, along_size, across, across_size = x, width, y, height
+    else: along, along_size, across, across_size = y, height, x, width
+    if along < margin or along >= along_size - margin: return True
+    return across < 0 or across >= across_size
+
+def warp_target(zone_type, start_x, start_y, width, height, margin):
+    """Region point the drag cursor is warped back to: the drag start, moved along the drag axis out of the
+    'margin' band so that a drag starting near a corner does not warp again on the next move."""
+    if zone_type == 'PAN_H': along, size = start_x, width
+    else: along, size = start_y, height
+    along = min(max(along, margin), size - margin - 1) if size > 2 * margin else size // 2
+    return (along, start_y) if zone_type == 'PAN_H' else (start_x, along)
+
+# --- Frame Pacing ---
+# While a view update has not been drawn yet, further motion is only accumulated. The draw handler
+# clears DragState.frame_pending. POST_PIXEL handlers don't run with overlays off (Fast Navigate turns them
+# off too), so motion is not held in such views; the hold is also capped in case a frame is never drawn.
+COALESCE_MAX_HOLD = 1.0 / 30.0 # Seconds motion may be held back waiting for a frame
+
+def _commit_held_motion(op, context):
+    """Tick callback: applies held motion once the last update was drawn or the hold expired."""
+    state = op.state
+    if state is None or not state.is_dragging: op.release_ticks(context, "coalesce"); return
+    if state.frame_pending and time.perf_counter() - state.frame_pending_since < COALESCE_MAX_HOLD: return
+    op.release_ticks(context, "coalesce")
+    op.commit_motion(context, get_prefs_snapshot(context))
+
+_drag_owner = None # Operator whose zone drag is in progress (listener or keymap drag), read by the draw handler
+
+def apply_auto_lock_to_cursor(context, prefs):
+    if not prefs.auto_lock_to_cursor: return False
+    view3d = context.space_data
+    if view3d and view3d.type == 'VIEW_3D' and not view3d.lock_cursor:
+        view3d.lock_cursor = True; return True
+    return False
+
+# --- Listener Registry ---
+# One window-level listener per window (_listeners), each keeping a ListenerArea per 3D View it has seen.
+# Events reach only the listener of their window, so idle cost does not grow with the number of views.
+class ListenerArea:
+    """Per-area entry of a listener: the area, its WINDOW region lookup and the drag state used for drags in it."""
+    __slots__ = ("area", "state", "regions_key", "window_regions")
+
+    def __init__(self, area):
+        self.area = area; self.state = DragState()
+        self.regions_key = None; self.window_regions = () # ((xmin, ymin, xmax, ymax, region), ...), one per quad view quadrant
+
+    def _index_regions(self):
+        area = self.area
+        self.regions_key = (area.x, area.y, area.width, area.height, len(area.regions))
+        self.window_regions = tuple((r.x, r.y, r.x + r.width, r.y + r.height, r) for r in area.regions if r.type == 'WINDOW')
+
+    def _lookup(self, x, y):
+        try:
+            for xmin, ymin, xmax, ymax, region in self.window_regions:
+                if xmin <= x < xmax and ymin <= y < ymax:
+                    if region.x == xmin and region.y == ymin and region.width == xmax - xmin and region.height == ymax - ymin: return region
+                    return None # Stale rect
+        except ReferenceError: pass # Region freed
+        return None
+
+    def region_at(self, x, y):
+        """WINDOW region under window coords (x, y), i.e. the quadrant in quad view."""
+        area = self.area
+        if self.regions_key != (area.x, area.y, area.width, area.height, len(area.regions)): self._index_regions()
+        region = self._lookup(x, y)
+        if region is None: # Rects can go stale without the key changing (sidebar resize without region overlap)
+            self._index_regions(); region = self._lookup(x, y)
+        return region
+
+def get_listener(window):
+    if window is None: return None
+    return _listeners.get(window.as_pointer())
+
+# --- Zone Drag Logic ---
+class EdgeZoneDragMixin:
+    """Hit testing and roll/pan drag handling shared by the global listener and the keymap drag operator."""
+    _timer = None # Window timer, only present while something in _tick_callbacks needs TIMER events
+    _tick_callbacks = None
+    _redraw = None
+    state = None # DragState, created by _init_drag_runtime()
+    continuous_grab = False # True for operators Blender runs with a wrapping cursor grab: no warps needed
+
+    def _init_drag_runtime(self):
+        self.state = DragState()
+        self._redraw = RedrawScheduler()
+        self._timer = None; self._tick_callbacks = {} # Event-driven: no timer until something asks for ticks
 
-        if ymax > height: ymax = height
-        if xmin >= xmax or ymin >= ymax: return None
-        return { 'tl': (xmin, ymax), 'tr': (xmax, ymax), 'br': (xmax, ymin), 'bl': (xmin, ymin),
-                 'width': xmax - xmin, 'height': zone_thickness_px, 'xmin': xmin, 'xmax': xmax, 'ymin': ymin, 'ymax': ymax }
+    def get_prefs(self, context):
+        return get_prefs_snapshot(context)
 
     # --- Zone Check ---
     def get_active_zone(self, context, event, prefs):
-        x, y = event.mouse_region_x, event.mouse_region_y
-
-        if prefs.enable_roll_zone:
-            coords = self.get_roll_zone_rect_coords(context, prefs)
-            if coords and (coords['xmin'] <= x < coords['xmax'] and coords['ymin'] <= y < coords['ymax']):
-                return 'ROLL'
-
-        if prefs.enable_pan_vertical_zone:
-            coords = self.get_pan_v_zone_rect_coords(context, prefs)
-            if coords and (coords['xmin'] <= x < coords['xmax'] and coords['ymin'] <= y < coords['ymax']):
-                return 'PAN_V'
-
-        if prefs.enable_pan_horizontal_zone:
-            coords = self.get_pan_h_zone_rect_coords(context, prefs)
-            if coords and (coords['xmin'] <= x < coords['xmax'] and coords['ymin'] <= y < coords['ymax']):
-                return 'PAN_H'
-
-        return 'NONE'
+        region = context.region
+        if not region: return 'NONE'
+        return hit_test_zone(get_zone_rects(region, prefs), event.mouse_x - region.x, event.mouse_y - region.y)
 
     # --- Utility ---
     def _restore_cursor(self, context):
-        if self.cursor_was_hidden:
+        state = self.state
+        if state and state.cursor_was_hidden:
             try:
                 if context.window: context.window.cursor_modal_restore()
-                self.cursor_was_hidden = False
-            except Exception as e: print(f"Error restoring cursor: {e}")
-
-    # --- Modal Loop ---
-    def modal(self, context, event):
-        global _global_op_instance
-        if not self.is_running:
-             self._restore_cursor(context); self.cancel_modal(context); return {'CANCELLED'}
-        if not context.area or context.area.type != 'VIEW_3D':
-             self._restore_cursor(context); self.cancel_modal(context); return {'CANCELLED'}
-
-        prefs = self.get_prefs(context); area = context.area
-        
-        if prefs.auto_lock_to_cursor:
-            view3d = context.space_data
-            if view3d and view3d.type == 'VIEW_3D' and not view3d.lock_cursor:
-                view3d.lock_cursor = True
-        
-        area.tag_redraw()
+                state.cursor_was_hidden = False
+            except Exception as e: log_error("cursor_restore", "Error restoring cursor: %s", e)
+
+    # --- Periodic Ticks ---
+    TICK_INTERVAL = 1.0 / 60.0
+
+    def request_ticks(self, context, owner, callback):
+        """Calls callback(op, context) on every tick until release_ticks(owner); the timer exists only meanwhile."""
+        self._tick_callbacks[owner] = callback
+        if self._timer is None and context.window:
+            self._timer = context.window_manager.event_timer_add(self.TICK_INTERVAL, window=context.window)
+
+    def release_ticks(self, context, owner):
+        self._tick_callbacks.pop(owner, None)
+        if not self._tick_callbacks: self._remove_timer(context)
+
+    def _remove_timer(self, context):
+        if self._timer is None: return
+        try: context.window_manager.event_timer_remove(self._timer)
+        except (ValueError, RuntimeError, ReferenceError): pass
+        self._timer = None
+
+    def _dispatch_ticks(self, context):
+        if self._tick_callbacks: # TIMER events don't say whose timer fired; any tick is fine
+            for callback in tuple(self._tick_callbacks.values()): callback(self, context)
+
+    # --- Drag ---
+    def _view_changed(self):
+        self._redraw.mark_dirty(); self.state.view_ops += 1
+
+    def begin_drag(self, context, event, zone_type, prefs):
+        global _drag_owner
+        state = self.state
+        state.is_dragging = True
+        state.active_zone_type = zone_type
+        state.region_key = context.region.as_pointer()
+        state.view_ops = 0; state.redraws_at_start = self._redraw.redraws_requested
+        # Region coords from window coords: the listener may drag in an area other than its own
+        state.start_mouse_x = state.last_mouse_region_x = event.mouse_x - context.region.x
+        state.start_mouse_y = state.last_mouse_region_y = event.mouse_y - context.region.y
+        state.accumulated_dx = 0.0
+        state.accumulated_dy = 0.0
+        state.cursor_was_hidden = False
+        _drag_owner = self
+        self._redraw.mark_dirty() # Zone switches to its active color
+        apply_auto_lock_to_cursor(context, prefs)
+        if prefs.navigation_lod: navigation_lod.apply(context, prefs)
+        log_debug("drag", "%s drag started at %d, %d", zone_type, state.start_mouse_x, state.start_mouse_y)
+        if session_recorder.active: session_recorder.record(REC_PRESS, self, context, state.start_mouse_x, state.start_mouse_y)
+        if prefs.hide_cursor_on_drag:
+            try:
+                if context.window: context.window.cursor_modal_set('NONE'); state.cursor_was_hidden = True
+            except Exception as e: log_error("cursor_hide", "Error hiding cursor: %s", e)
+
+    def end_drag(self, context):
+        global _drag_owner
+        state = self.state
+        if state is None: return
+        self._restore_cursor(context)
+        if state.is_dragging:
+            log_debug("drag", "%s drag ended", state.active_zone_type)
+            if state.pending_dx or state.pending_dy: # Don't lose motion held back by frame pacing
+                try: self.commit_motion(context, get_prefs_snapshot(context))
+                except (ReferenceError, AttributeError): pass
+            if session_recorder.active: session_recorder.record(REC_RELEASE, self, context, state.last_mouse_region_x, state.last_mouse_region_y)
+            self.release_ticks(context, "coalesce")
+            self._redraw.mark_dirty()
+            if metrics.enabled:
+                metrics.view_ops_per_drag.add(state.view_ops)
+                metrics.redraws_per_drag.add(self._redraw.redraws_requested - state.redraws_at_start)
+        state.reset()
+        if _drag_owner is self:
+            navigation_lod.restore()
+            _drag_owner = None
+
+    def drag_move(self, context, event, prefs):
+        """Handles one MOUSEMOVE of an active drag: accumulates its motion, applies it (frame-paced) and warps the cursor."""
+        state = self.state
+        if state.warp_pending:
+            state.warp_pending = False
+            if abs(event.mouse_x - state.warp_x) <= 1 and abs(event.mouse_y - state.warp_y) <= 1:
+                drag_telemetry.synthetic_dropped += 1 # Echo of our own cursor_warp, carries no motion
+                if session_recorder.active: session_recorder.record(REC_MOVE, self, context, event.mouse_x - context.region.x, event.mouse_y - context.region.y, REC_FLAG_ECHO)
+                return
+        drag_telemetry.moves += 1
+        region = context.region
+        x = event.mouse_x - region.x; y = event.mouse_y - region.y
+        state.pending_dx += x - state.last_mouse_region_x
+        state.pending_dy += y - state.last_mouse_region_y
+        if not (prefs.coalesce_input and self._hold_motion(context)): self.commit_motion(context, prefs)
+        self._warp_if_needed(context, x, y, prefs)
+        if session_recorder.active: session_recorder.record(REC_MOVE, self, context, x, y)
+
+    def _hold_motion(self, context):
+        """True while the last view update is not drawn yet; arms a tick so held motion is applied without more events."""
+        state = self.state
+        if not state.frame_pending or time.perf_counter() - state.frame_pending_since >= COALESCE_MAX_HOLD: return False
+        try:
+            if not context.space_data.overlay.show_overlays: return False # No draw callback will signal the frame
+        except (ReferenceError, AttributeError): pass
+        self.request_ticks(context, "coalesce", _commit_held_motion)
+        return True
+
+    def commit_motion(self, context, prefs):
+        """Applies all accumulated motion to the view as one update."""
+        state = self.state
+        delta_x = state.pending_dx; delta_y = state.pending_dy
+        state.pending_dx = 0; state.pending_dy = 0
+        if not delta_x and not delta_y: return
+        was_dirty = self._redraw.dirty; self._redraw.dirty = False
+
+        # --- Roll Logic (Right Zone) ---
+        if state.active_zone_type == 'ROLL':
+            state.accumulated_dy += delta_y
+            sensitivity = prefs.roll_sensitivity
+            roll_angle_rad = prefs.roll_angle # Value is already in radians
+            if sensitivity <= 0: sensitivity = 1.0
+            region_3d = context.region_data
+
+            if prefs.roll_mode == 'DIRECT' and can_apply_view_directly(region_3d):
+                # Whole steps become one angle; the fractional remainder stays accumulated
+                steps = math.trunc(state.accumulated_dy / sensitivity)
+                if region_3d.lock_rotation: state.accumulated_dy = 0.0 # view_roll refuses locked views too
+                elif steps:
+                    state.accumulated_dy -= steps * sensitivity
+                    final_direction = -1 if prefs.invert_roll_direction else 1
+                    try: apply_view_roll(region_3d, final_direction * steps * roll_angle_rad); self._view_changed()
+                    except Exception as e: log_error("view_roll", "Error applying view roll: %s", e); state.accumulated_dy = 0
+            else:
+                while abs(state.accumulated_dy) >= sensitivity:
+                    base_direction = 1 if state.accumulated_dy > 0 else -1
+                    if base_direction > 0 : state.accumulated_dy -= sensitivity
+                    else: state.accumulated_dy += sensitivity
+                    final_direction = -base_direction if prefs.invert_roll_direction else base_direction
+                    try: bpy.ops.view3d.view_roll(angle=(final_direction * roll_angle_rad)); self._view_changed()
+                    except Exception as e: log_error("view_roll", "Error executing view_roll: %s", e); state.accumulated_dy = 0; break
+
+        # --- Vertical Pan Logic (Left Zone) ---
+        elif state.active_zone_type == 'PAN_V':
+            sensitivity = prefs.pan_sensitivity
+            if sensitivity <= 0: sensitivity = 1.0
+            region_3d = context.region_data
+
+            if prefs.pan_mode == 'DIRECT' and can_pan_view_directly(context.space_data, region_3d):
+                # Same distance per pixel as the stepped engine, without quantizing
+                if delta_y:
+                    gain = VIEW_PAN_STEP_PX[1] / sensitivity
+                    if prefs.invert_pan_vertical: gain = -gain
+                    try: apply_view_pan(context.region, region_3d, 0.0, delta_y * gain); self._view_changed()
+                    except Exception as e: log_error("view_pan", "Error applying view pan: %s", e)
+            else:
+                state.accumulated_dy += delta_y
+                while abs(state.accumulated_dy) >= sensitivity:
+                    base_direction = 1 if state.accumulated_dy > 0 else -1
+                    if base_direction > 0 : state.accumulated_dy -= sensitivity
+                    else: state.accumulated_dy += sensitivity
+
+                    pan_type = 'PANUP' if base_direction > 0 else 'PANDOWN'
+                    if prefs.invert_pan_vertical:
+                        pan_type = 'PANDOWN' if pan_type == 'PANUP' else 'PANUP'
+
+                    # *** CHANGE: Using view_pan like in space_view3d_3d_navigation.py ***
+                    try:
+                        bpy.ops.view3d.view_pan('INVOKE_REGION_WIN', type=pan_type); self._view_changed()
+                    except Exception as e:
+                        log_error("view_pan", "Error executing view_pan ('INVOKE_REGION_WIN', %s): %s", pan_type, e)
+                        state.accumulated_dy = 0 # Reset on error
+                        break # Exit while loop
+
+        # --- Horizontal Pan Logic (Bottom Zone) ---
+        elif state.active_zone_type == 'PAN_H':
+            sensitivity = prefs.pan_sensitivity
+            if sensitivity <= 0: sensitivity = 1.0
+            region_3d = context.region_data
+
+            if prefs.pan_mode == 'DIRECT' and can_pan_view_directly(context.space_data, region_3d):
+                if delta_x:
+                    gain = VIEW_PAN_STEP_PX[0] / sensitivity
+                    if prefs.invert_pan_horizontal: gain = -gain
+                    try: apply_view_pan(context.region, region_3d, delta_x * gain, 0.0); self._view_changed()
+                    except Exception as e: log_error("view_pan", "Error applying view pan: %s", e)
+            else:
+                state.accumulated_dx += delta_x
+                while abs(state.accumulated_dx) >= sensitivity:
+                    base_direction = 1 if state.accumulated_dx > 0 else -1
+                    if base_direction > 0 : state.accumulated_dx -= sensitivity
+                    else: state.accumulated_dx += sensitivity
+
+                    pan_type = 'PANRIGHT' if base_direction > 0 else 'PANLEFT'
+                    if prefs.invert_pan_horizontal:
+                        pan_type = 'PANLEFT' if pan_type == 'PANRIGHT' else 'PANRIGHT'
+
+                    # *** CHANGE: Using view_pan like in space_view3d_3d_navigation.py ***
+                    try:
+                         bpy.ops.view3d.view_pan('INVOKE_REGION_WIN', type=pan_type); self._view_changed()
+                    except Exception as e:
+                        log_error("view_pan", "Error executing view_pan ('INVOKE_REGION_WIN', %s): %s", pan_type, e)
+                        state.accumulated_dx = 0 # Reset on error
+                        break # Exit while loop
+
+        if self._redraw.dirty: # View changed: hold further motion until this frame is drawn
+            state.frame_pending = True; state.frame_pending_since = time.perf_counter()
+            drag_telemetry.view_updates += 1
+        else: self._redraw.dirty = was_dirty
+
+    def _warp_if_needed(self, context, x, y, prefs):
+        """Moves the cursor back toward the drag start once region coords (x, y) near the region edge (warp input mode)."""
+        state = self.state
+        state.last_mouse_region_x = x; state.last_mouse_region_y = y
+        if self.continuous_grab: return # Blender wraps the cursor and keeps reported coordinates unbounded
+        region = context.region
+        if region and context.window and cursor_needs_warp(state.active_zone_type, x, y, region.width, region.height, prefs.warp_margin):
+            target_x, target_y = warp_target(state.active_zone_type, state.start_mouse_x, state.start_mouse_y, region.width, region.height, prefs.warp_margin)
+            warp_x = region.x + target_x; warp_y = region.y + target_y
+            try:
+                context.window.cursor_warp(warp_x, warp_y)
+            except Exception as e: log_error("cursor_warp", "Error warping cursor: %s", e); return
+            # Next deltas are measured from the warp target; the MOUSEMOVE the warp generates is dropped
+            state.last_mouse_region_x = target_x; state.last_mouse_region_y = target_y
+            state.warp_pending = True; state.warp_x = warp_x; state.warp_y = warp_y
+            drag_telemetry.warps += 1
+            log_debug("warp", "Cursor warped at %d, %d", x, y)
+
+# --- Session Recorder ---
+# A recording is a JSON header (preferences, Blender version) followed by fixed-width little-endian
+# records, one per drag event: press, every move (warp echoes included) and release, each with the
+# view state that event left behind. Fixed-width records let replay memory-map the file and walk it
+# with struct.iter_unpack instead of parsing it.
+SESSION_MAGIC = b"EZNREC01"
+SESSION_HEADER = struct.Struct("<8sI") # magic, byte length of the JSON metadata that follows
+SESSION_RECORD = struct.Struct("<dBBBxiiHH4d3dd") # time, kind, zone, flags, region x/y, region size, rotation, location, distance
+REC_PRESS, REC_MOVE, REC_RELEASE = 0, 1, 2
+REC_ZONES = ('NONE', 'ROLL', 'PAN_V', 'PAN_H')
+REC_FLAG_GRAB = 1 # Recorded under continuous grab: no warps
+REC_FLAG_NO_VIEW = 2 # The view was not reachable; the view fields are zero and not checked on replay
+REC_FLAG_ECHO = 4 # MOUSEMOVE caused by our own cursor_warp; replays that warp for real should skip it
+REC_FLAG_STEPPED = 8 # The view was moved by view_roll/view_pan (stepped engine or a view that needs it); replay can't check it
+REPLAY_TOLERANCE = 1e-4
+
+class SessionRecorder:
+    """Packs drag events into a bytearray while active; stop() writes them to 'path'."""
+    __slots__ = ("active", "path", "buffer", "start_time", "meta")
+
+    def __init__(self):
+        self.active = False; self.path = ""; self.buffer = bytearray(); self.start_time = 0.0; self.meta = None
+
+    @property
+    def count(self): return len(self.buffer) // SESSION_RECORD.size
+
+    def start(self, path, prefs):
+        self.path = path; self.buffer = bytearray(); self.start_time = time.perf_counter()
+        self.meta = {"version": 1, "blender": getattr(bpy.app, "version_string", ""), "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                     "prefs": {name: getattr(prefs, name) for name in PREF_NAMES if isinstance(getattr(prefs, name), (bool, int, float, str))}}
+        self.active = True
+
+    def record(self, kind, op, context, x, y, flags=0):
+        state = op.state; region = context.region; region_3d = context.region_data
+        if op.continuous_grab: flags |= REC_FLAG_GRAB
+        if uses_stepped_engine(state.active_zone_type, get_prefs_snapshot(context), context.space_data, region_3d): flags |= REC_FLAG_STEPPED
+        try: view = (*region_3d.view_rotation, *region_3d.view_location, region_3d.view_distance)
+        except (AttributeError, ReferenceError): view = (0.0,) * 8; flags |= REC_FLAG_NO_VIEW
+        self.buffer += SESSION_RECORD.pack(time.perf_counter() - self.start_time, kind, REC_ZONES.index(state.active_zone_type), flags,
+                                           x, y, region.width, region.height, *view)
+
+    def stop(self):
+        """Writes the recording and returns the number of records; nothing is written if none were captured."""
+        if not self.active: return 0
+        self.active = False; count = self.count
+        if count:
+            meta = json.dumps(self.meta).encode()
+            with open(self.path, "wb") as f:
+                f.write(SESSION_HEADER.pack(SESSION_MAGIC, len(meta))); f.write(meta); f.write(self.buffer)
+        self.buffer = bytearray()
+        return count
+
+session_recorder = SessionRecorder()
+
+class SessionFile:
+    """Memory-mapped recording: 'meta' from the header and the packed records behind it."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f: self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, meta_size = SESSION_HEADER.unpack_from(self._map)
+        if magic != SESSION_MAGIC: self._map.close(); raise ValueError(f"{path} is not an Edge Zone Navigation recording")
+        start = SESSION_HEADER.size + meta_size
+        self.meta = json.loads(self._map[SESSION_HEADER.size:start])
+        size = (len(self._map) - start) // SESSION_RECORD.size * SESSION_RECORD.size # Ignore a torn last record
+        self._view = memoryview(self._map)[start:start + size]
+
+    def __len__(self): return len(self._view) // SESSION_RECORD.size
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    def records(self): return SESSION_RECORD.iter_unpack(self._view)
+
+    def close(self):
+        self._view.release(); self._map.close()
+
+class _ReplayRegion:
+    """Region of the recorded size at the window origin, so recorded region coords are the event coords."""
+    __slots__ = ("x", "y", "width", "height")
+    def __init__(self): self.x = 0; self.y = 0; self.width = 0; self.height = 0
+    def as_pointer(self): return 0 # Matches no real region, so no zone is highlighted by the replay
+
+class _ReplayWindow:
+    """Accepts cursor calls without moving the real cursor; warps are still decided and echoes dropped as recorded."""
+    def cursor_warp(self, x, y): pass
+    def cursor_modal_set(self, cursor): pass
+    def cursor_modal_restore(self): pass
+
+class ReplayResult:
+    __slots__ = ("events", "drags", "checked", "stepped", "rotation_error", "location_error", "seconds")
+
+    def __init__(self):
+        self.events = 0; self.drags = 0; self.checked = 0; self.stepped = 0; self.rotation_error = 0.0; self.location_error = 0.0; self.seconds = 0.0
+
+    def matches(self, tolerance=REPLAY_TOLERANCE): return self.rotation_error <= tolerance and self.location_error <= tolerance
+
+def replay_session(path, region_3d, space_data=None):
+    """Feeds a recording through the drag logic into region_3d and compares the view after every release.
+
+    Needs no window, so it runs in background Blender and under the headless stubs. Every drag starts
+    from its recorded view. Frame pacing is off: it changes when motion is applied, not the total.
+    Replay always uses the direct engines. Drags the recording moved with view_roll/view_pan
+    (REC_FLAG_STEPPED) are replayed but not checked, and counted in ReplayResult.stepped.
+    """
+    result = ReplayResult()
+    with SessionFile(path) as session:
+        prefs = PrefsSnapshot.from_defaults()
+        for name, value in session.meta.get("prefs", {}).items():
+            if name in PREF_NAMES: setattr(prefs, name, value)
+        prefs.coalesce_input = False; prefs.navigation_lod = False; prefs.hide_cursor_on_drag = False; prefs.auto_lock_to_cursor = False
+        prefs.roll_mode = 'DIRECT'; prefs.pan_mode = 'DIRECT'
+        region = _ReplayRegion(); event = SimpleNamespace(mouse_x=0, mouse_y=0)
+        if space_data is None: space_data = SimpleNamespace(type='VIEW_3D', lock_cursor=False, lock_object=None) # Free view, direct pan
+        context = SimpleNamespace(window=_ReplayWindow(), window_manager=None, area=None, region=region, region_data=region_3d,
+                                  space_data=space_data, scene=None)
+        drag = EdgeZoneDragMixin(); drag._init_drag_runtime(); stepped = False
+        start = time.perf_counter()
+        for _t, kind, zone, flags, x, y, width, height, *view in session.records():
+            result.events += 1
+            region.width = width; region.height = height; event.mouse_x = x; event.mouse_y = y
+            if kind == REC_PRESS:
+                if drag.state.is_dragging: drag.end_drag(context) # Release was not recorded
+                if not flags & REC_FLAG_NO_VIEW:
+                    region_3d.view_rotation = view[0:4]; region_3d.view_location = view[4:7]; region_3d.view_distance = view[7]
+                drag.continuous_grab = bool(flags & REC_FLAG_GRAB); stepped = bool(flags & REC_FLAG_STEPPED)
+                drag.begin_drag(context, event, REC_ZONES[zone], prefs); result.drags += 1
+            elif not drag.state.is_dragging: continue # Recording started mid-drag
+            elif kind == REC_MOVE: drag.drag_move(context, event, prefs); stepped |= bool(flags & REC_FLAG_STEPPED)
+            else:
+                drag.end_drag(context)
+                if flags & REC_FLAG_STEPPED or stepped: result.stepped += 1; continue
+                if flags & REC_FLAG_NO_VIEW: continue
+                rotation = region_3d.view_rotation; location = region_3d.view_location
+                error = min(max(abs(a - b) for a, b in zip(rotation, view[0:4])), max(abs(a + b) for a, b in zip(rotation, view[0:4]))) # q and -q are the same rotation
+                result.rotation_error = max(result.rotation_error, error)
+                result.location_error = max(result.location_error, max(abs(a - b) for a, b in zip(location, view[4:7])))
+                result.checked += 1
+        if drag.state.is_dragging: drag.end_drag(context)
+        result.seconds = time.perf_counter() - start
+    return result
 
-        # --- Event Handling ---
-        if event.type == 'RIGHTMOUSE':
-            if event.value == 'PRESS':
-                zone_hit = self.get_active_zone(context, event, prefs)
-                if zone_hit != 'NONE':
-                    self.is_dragging = True
-                    self.active_zone_type = zone_hit
-                    self.start_mouse_x = event.mouse_region_x
-                    self.start_mouse_y = event.mouse_region_y
-                    self.last_mouse_region_x = event.mouse_region_x
-                    self.last_mouse_region_y = event.mouse_region_y
-                    self.accumulated_dx = 0.0
-                    self.accumulated_dy = 0.0
-                    self.cursor_was_hidden = False
-                    if prefs.hide_cursor_on_drag:
-                        try:
-                            if context.window: context.window.cursor_modal_set('NONE'); self.cursor_was_hidden = True
-                        except Exception as e: print(f"Error hiding cursor: {e}")
-                    return {'RUNNING_MODAL'}
-                else:
-                    self.is_dragging = False
-                    self.active_zone_type = 'NONE'
-                    return {'PASS_THROUGH'}
+# --- Modal Operator ---
+class VIEW3D_OT_edge_zone_navigation(EdgeZoneDragMixin, bpy.types.Operator):
+    bl_idname = "view3d.edge_zone_navigation"; bl_label = "Run Edge Zone Navigation (Roll/Pan)"; bl_options = {'REGISTER', 'UNDO'}
 
-            elif event.value == 'RELEASE':
-                if self.is_dragging:
-                    self.is_dragging = False
-                    self.accumulated_dx = 0.0
-                    self.accumulated_dy = 0.0
-                    self.active_zone_type = 'NONE'
-                    self._restore_cursor(context)
-                    area.tag_redraw()
-                    return {'PASS_THROUGH'}
-                else:
-                    return {'PASS_THROUGH'}
+    is_running = False
+    window_key = 0 # Key of this listener in _listeners
+    areas = None # area pointer -> ListenerArea, synced with the window's 3D Views on RMB press
+    drag_area = None # Area of the current (or last) drag, where redraws go
+    drag_override = None # temp_override() arguments that put the drag's area/region in context
 
-        elif event.type == 'MOUSEMOVE':
-            if self.is_dragging:
-                delta_x = event.mouse_region_x - self.last_mouse_region_x
-                delta_y = event.mouse_region_y - self.last_mouse_region_y
-
-                warp_needed = False
-                warp_x = context.region.x + self.start_mouse_x
-                warp_y = context.region.y + self.start_mouse_y
-
-                # --- Roll Logic (Right Zone) ---
-                if self.active_zone_type == 'ROLL':
-                    self.accumulated_dy += delta_y
-                    sensitivity = prefs.roll_sensitivity
-                    roll_angle_rad = prefs.roll_angle # Value is already in radians
-                    if sensitivity <= 0: sensitivity = 1.0
-
-                    while abs(self.accumulated_dy) >= sensitivity:
-                        base_direction = 1 if self.accumulated_dy > 0 else -1
-                        if base_direction > 0 : self.accumulated_dy -= sensitivity
-                        else: self.accumulated_dy += sensitivity
-                        final_direction = -base_direction if prefs.invert_roll_direction else base_direction
-                        try: bpy.ops.view3d.view_roll(angle=(final_direction * roll_angle_rad))
-                        except Exception as e: print(f"Error executing view_roll: {e}"); self.accumulated_dy = 0; break
-                    warp_needed = True
-                    self.last_mouse_region_y = self.start_mouse_y
-
-                # --- Vertical Pan Logic (Left Zone) ---
-                elif self.active_zone_type == 'PAN_V':
-                    self.accumulated_dy += delta_y
-                    sensitivity = prefs.pan_sensitivity
-                    if sensitivity <= 0: sensitivity = 1.0
-
-                    while abs(self.accumulated_dy) >= sensitivity:
-                        base_direction = 1 if self.accumulated_dy > 0 else -1
-                        if base_direction > 0 : self.accumulated_dy -= sensitivity
-                        else: self.accumulated_dy += sensitivity
-
-                        pan_type = 'PANUP' if base_direction > 0 else 'PANDOWN'
-                        if prefs.invert_pan_vertical:
-                            pan_type = 'PANDOWN' if pan_type == 'PANUP' else 'PANUP'
-
-                        # *** CHANGE: Using view_pan like in space_view3d_3d_navigation.py ***
-                        try:
-                            bpy.ops.view3d.view_pan('INVOKE_REGION_WIN', type=pan_type)
-                        except Exception as e:
-                            print(f"Error executing view_pan ('INVOKE_REGION_WIN', {pan_type}): {e}")
-                            self.accumulated_dy = 0 # Reset on error
-                            break # Exit while loop
-                    warp_needed = True
-                    self.last_mouse_region_y = self.start_mouse_y
-
-                # --- Horizontal Pan Logic (Bottom Zone) ---
-                elif self.active_zone_type == 'PAN_H':
-                    self.accumulated_dx += delta_x
-                    sensitivity = prefs.pan_sensitivity
-                    if sensitivity <= 0: sensitivity = 1.0
-
-                    while abs(self.accumulated_dx) >= sensitivity:
-                        base_direction = 1 if self.accumulated_dx > 0 else -1
-                        if base_direction > 0 : self.accumulated_dx -= sensitivity
-                        else: self.accumulated_dx += sensitivity
-
-                        pan_type = 'PANRIGHT' if base_direction > 0 else 'PANLEFT'
-                        if prefs.invert_pan_horizontal:
-                            pan_type = 'PANLEFT' if pan_type == 'PANRIGHT' else 'PANRIGHT'
-
-                        # *** CHANGE: Using view_pan like in space_view3d_3d_navigation.py ***
-                        try:
-                             bpy.ops.view3d.view_pan('INVOKE_REGION_WIN', type=pan_type)
-                        except Exception as e:
-                            print(f"Error executing view_pan ('INVOKE_REGION_WIN', {pan_type}): {e}")
-                            self.accumulated_dx = 0 # Reset on error
-                            break # Exit while loop
-                    warp_needed = True
-                    self.last_mouse_region_x = self.start_mouse_x
-
-                # --- Execute Cursor Warp ---
-                if warp_needed and context.region and context.window:
-                    current_screen_x = event.mouse_x
-                    current_screen_y = event.mouse_y
-                    if abs(current_screen_x - warp_x) > 2 or abs(current_screen_y - warp_y) > 2:
-                        try:
-                            context.window.cursor_warp(warp_x, warp_y)
-                        except Exception as e: print(f"Error warping cursor: {e}")
-
-                    if self.active_zone_type == 'ROLL' or self.active_zone_type == 'PAN_V':
-                         self.last_mouse_region_y = self.start_mouse_y
-                    if self.active_zone_type == 'PAN_H':
-                         self.last_mouse_region_x = self.start_mouse_x
-
-                if self.active_zone_type != 'PAN_H': self.last_mouse_region_x = event.mouse_region_x
-                if self.active_zone_type != 'ROLL' and self.active_zone_type != 'PAN_V': self.last_mouse_region_y = event.mouse_region_y
-
-                return {'RUNNING_MODAL'}
+    # --- Modal Loop ---
+    def modal(self, context, event):
+        start = time.perf_counter() if metrics.enabled else 0.0
+        if navigation_profiler.active: result = navigation_profiler.run(self._handle_event, context, event)
+        else: result = self._handle_event(context, event)
+        area = self.drag_area if self.drag_area is not None else context.area
+        if self.is_running and area is not None:
+            self._redraw.flush(area)
+        if start: metrics.event_us.add((time.perf_counter() - start) * 1e6)
+        return result
+
+    def _handle_event(self, context, event):
+        if not self.is_running: # Stopped from outside (Stop button, listener mode switch): don't swallow this event
+             self.cancel_modal(context); return {'CANCELLED', 'PASS_THROUGH'}
+
+        if self.state.is_dragging:
+            if event.type == 'RIGHTMOUSE' and event.value == 'PRESS': self._end_drag_in_area(context) # Lost release
             else:
-                return {'PASS_THROUGH'}
+                try:
+                    with context.temp_override(**self.drag_override):
+                        return self._handle_drag_event(context, event)
+                except (TypeError, ReferenceError) as e: # Area or region freed mid-drag
+                    log_warning("drag_area_lost", "Drag area lost: %s", e)
+                    self.drag_override = None; self.drag_area = None; self.end_drag(context)
+                    return {'PASS_THROUGH'}
 
+        # --- Event Handling ---
+        if event.type == 'RIGHTMOUSE' and event.value == 'PRESS':
+            return self._try_begin_drag(context, event)
+        return {'PASS_THROUGH'} # Esc outside a drag belongs to Blender; the listener keeps running
+
+    def _handle_drag_event(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            self.drag_move(context, event, self.get_prefs(context))
+            return {'RUNNING_MODAL'}
+        elif event.type == 'RIGHTMOUSE' and event.value == 'RELEASE':
+            self.end_drag(context)
         elif event.type == 'TIMER':
-            pass
+            self._dispatch_ticks(context)
+        elif event.type == 'ESC':
+            self.end_drag(context) # Ends only the drag: nothing would restart a stopped listener
+            return {'RUNNING_MODAL'}
+        return {'PASS_THROUGH'}
 
-        elif event.type in {'ESC'}:
-            was_dragging = self.is_dragging
-            if was_dragging:
-                self._restore_cursor(context)
-            self.cancel_modal(context)
-            return {'CANCELLED'} if was_dragging else {'PASS_THROUGH'}
+    def _try_begin_drag(self, context, event):
+        window = context.window
+        if window is None or _drag_owner is not None: return {'PASS_THROUGH'}
+        entry = self.find_area(window, event.mouse_x, event.mouse_y)
+        if entry is None: return {'PASS_THROUGH'}
+        area = entry.area
+        region = entry.region_at(event.mouse_x, event.mouse_y) # Quadrant under the cursor in quad view
+        if region is None: return {'PASS_THROUGH'}
+        prefs = self.get_prefs(context)
+        zone_hit = hit_test_zone(get_zone_rects(region, prefs), event.mouse_x - region.x, event.mouse_y - region.y)
+        if zone_hit == 'NONE': return {'PASS_THROUGH'}
+
+        override = {"window": window, "area": area, "region": region}
+        with context.temp_override(**override):
+            if use_grab_drag(prefs, context) and start_grab_drag(): return {'RUNNING_MODAL'}
+            # Warp mode, Continuous Grab off in Blender's preferences, or the grab drag could not start
+            self.state = entry.state; self.drag_area = area; self.drag_override = override
+            self.begin_drag(context, event, zone_hit, prefs)
+        return {'RUNNING_MODAL'}
 
-        return {'PASS_THROUGH'}
+    def _end_drag_in_area(self, context):
+        if self.state is None or not self.state.is_dragging: return
+        try:
+            with context.temp_override(**self.drag_override): self.end_drag(context)
+        except (TypeError, ReferenceError): self.end_drag(context)
+
+    # --- Listener Registry ---
+    def find_area(self, window, x, y):
+        """Entry of the 3D View under window coords (x, y); adds and drops entries as areas come and go."""
+        screen = window.screen
+        if screen is None: return None
+        areas = self.areas; hit = None; present = 0
+        for area in screen.areas:
+            if area.type != 'VIEW_3D': continue
+            present += 1
+            area_key = area.as_pointer()
+            entry = areas.get(area_key)
+            if entry is None: entry = areas[area_key] = ListenerArea(area)
+            if hit is None and area.x <= x < area.x + area.width and area.y <= y < area.y + area.height: hit = entry
+        if present != len(areas): # Areas closed, joined or switched away: drop their entries
+            live = {area.as_pointer() for area in screen.areas if area.type == 'VIEW_3D'}
+            for area_key in [key for key in areas if key not in live]: del areas[area_key]
+        return hit
 
     # --- Operator Lifecycle ---
     def invoke(self, context, event):
-        global _global_op_instance, _draw_handler_ref
-        cleanup_previous_state()
+        if get_prefs_snapshot(context).listener_mode == 'KEYMAP':
+            self.report({'INFO'}, "Edge zones are handled by the RMB keymap, no listener needed"); return {'CANCELLED'}
 
-        if context.space_data.type != 'VIEW_3D':
+        if context.space_data.type != 'VIEW_3D' or context.window is None:
             self.report({'WARNING'}, "Active space is not a 3D View"); return {'CANCELLED'}
 
-        self.is_dragging = False
-        self.accumulated_dx = 0.0; self.accumulated_dy = 0.0
-        self.start_mouse_x = 0; self.start_mouse_y = 0
-        self.last_mouse_region_x = 0; self.last_mouse_region_y = 0
-        self.cursor_was_hidden = False
-        self.active_zone_type = 'NONE'
+        self.window_key = context.window.as_pointer()
+        previous = _listeners.get(self.window_key)
+        if previous is not None: previous.cancel_modal(context) # One listener per window
+
+        self._init_drag_runtime()
+        self.areas = {}; self.drag_area = None; self.drag_override = None
         self.is_running = True
-        _global_op_instance = self
+        _listeners[self.window_key] = self
 
-        if _draw_handler_ref is None:
-            try:
-                args = (self, context)
-                _draw_handler_ref = bpy.types.SpaceView3D.draw_handler_add(
-                    draw_callback_px, args, 'WINDOW', 'POST_PIXEL'
-                )
-            except Exception as e:
-                print(f"Error adding draw handler: {e}"); self.report({'ERROR'}, "Failed to add draw handler.")
-                self.is_running = False; _global_op_instance = None; _draw_handler_ref = None
-                return {'CANCELLED'}
+        if not ensure_draw_handler():
+            self.report({'ERROR'}, "Failed to add draw handler.")
+            self.is_running = False; del _listeners[self.window_key]
+            return {'CANCELLED'}
 
+        prefs = refresh_prefs_snapshot(context) # Catch settings changed without an update callback (e.g. reset to defaults)
         try:
-            prefs = self.get_prefs(context)
-            prefs.auto_start_listener = True
+            context.preferences.addons[__name__].preferences.auto_start_listener = True
+        except KeyError: pass
         except Exception as e:
             print(f"Warning: Could not set auto_start_listener on invoke: {e}")
+        if apply_auto_lock_to_cursor(context, prefs): self._redraw.mark_dirty()
 
-        wm = context.window_manager
-        self._timer = wm.event_timer_add(0.05, window=context.window)
-        wm.modal_handler_add(self)
+        context.window_manager.modal_handler_add(self)
         print("Edge Zone Navigation: Started.")
-        context.area.tag_redraw()
+        tag_view3d_redraw(context) # Zones appear in every 3D View of this window
         return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # Blender removed the handler (window closed, file loaded): clean up, then let auto-start decide
+        self.cancel_modal(context)
+        schedule_auto_start()
+
     def cancel_modal(self, context):
-        global _global_op_instance, _draw_handler_ref
-        if self.is_running and _global_op_instance == self:
-             self._restore_cursor(context)
-             wm = context.window_manager
-             if self._timer:
-                 try: wm.event_timer_remove(self._timer)
-                 except (ValueError, RuntimeError): pass
-                 self._timer = None
-
-             if _draw_handler_ref:
-                 try: bpy.types.SpaceView3D.draw_handler_remove(_draw_handler_ref, 'WINDOW')
-                 except (ValueError, RuntimeError): pass
-                 _draw_handler_ref = None
-
-             self.is_running = False
-             _global_op_instance = None
+        self._end_drag_in_area(context) # Restores cursor, held motion and LOD settings if a drag was in progress
+        if _listeners.get(self.window_key) is self:
+             if self._tick_callbacks: self._tick_callbacks.clear()
+             self._remove_timer(context)
+             del _listeners[self.window_key]; _auto_start_windows.discard(self.window_key)
+             if not _listeners: remove_draw_handler()
              print("Edge Zone Navigation: Stopped.")
-             if context.area:
-                 try: context.area.tag_redraw()
-                 except (ReferenceError, AttributeError): pass
+             tag_view3d_redraw(context)
+        self.is_running = False
 
-        self.is_dragging = False
-        self.accumulated_dx = 0.0; self.accumulated_dy = 0.0
-        self.cursor_was_hidden = False
-        self.active_zone_type = 'NONE'
+# --- Keymap Drag Operator ---
+class VIEW3D_OT_edge_zone_drag(EdgeZoneDragMixin, bpy.types.Operator):
+    """Started by the RMB keymap item: passes through outside the zones, runs modal only while dragging"""
+    bl_idname = "view3d.edge_zone_drag"; bl_label = "Edge Zone Drag"; bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        area = context.area; region = context.region
+        return area is not None and area.type == 'VIEW_3D' and region is not None and region.type == 'WINDOW'
+
+    def invoke(self, context, event):
+        if _drag_owner is not None: return {'PASS_THROUGH'}
+        prefs = self.get_prefs(context)
+        zone_hit = self.get_active_zone(context, event, prefs)
+        if zone_hit == 'NONE': return {'PASS_THROUGH'} # Let the regular RMB action (context menu, select) run
+
+        self._init_drag_runtime()
+        self.begin_drag(context, event, zone_hit, prefs)
+        context.window_manager.modal_handler_add(self)
+        self._redraw.flush(context.area)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        start = time.perf_counter() if metrics.enabled else 0.0
+        if navigation_profiler.active: result = navigation_profiler.run(self._handle_event, context, event)
+        else: result = self._handle_event(context, event)
+        if context.area: self._redraw.flush(context.area)
+        if start: metrics.event_us.add((time.perf_counter() - start) * 1e6)
+        return result
+
+    def _handle_event(self, context, event):
+        if not context.area or context.area.type != 'VIEW_3D':
+            self._finish(context); return {'CANCELLED'}
+
+        if event.type == 'MOUSEMOVE':
+            self.drag_move(context, event, self.get_prefs(context))
+            return {'RUNNING_MODAL'}
+        elif event.type == 'RIGHTMOUSE' and event.value == 'RELEASE':
+            self._finish(context); return {'FINISHED'}
+        elif event.type == 'ESC':
+            self._finish(context); return {'CANCELLED'}
+        elif event.type == 'TIMER':
+            self._dispatch_ticks(context)
+        return {'PASS_THROUGH'}
+
+    def _finish(self, context):
+        self.end_drag(context)
+        if self._tick_callbacks: self._tick_callbacks.clear()
+        self._remove_timer(context)
+
+    def cancel(self, context):
+        self._finish(context)
+
+class VIEW3D_OT_edge_zone_grab_drag(VIEW3D_OT_edge_zone_drag):
+    """Zone drag under Blender's continuous cursor grab: relative motion without cursor warps"""
+    bl_idname = "view3d.edge_zone_grab_drag"; bl_label = "Edge Zone Drag (Continuous Grab)"; bl_options = {'INTERNAL', 'BLOCKING', 'GRAB_CURSOR'}
+
+    continuous_grab = True
+
+    def invoke(self, context, event):
+        if not continuous_grab_available(context): # Keymap item bound while Continuous Grab was on: warp drag instead
+            result = bpy.ops.view3d.edge_zone_drag('INVOKE_DEFAULT')
+            return {'FINISHED'} if 'RUNNING_MODAL' in result else result
+        return super().invoke(context, event)
+
+def continuous_grab_available(context):
+    """Blender wraps a GRAB_CURSOR operator's cursor only with Preferences > Input > Continuous Grab on."""
+    try: return bool(context.preferences.inputs.use_mouse_continuous)
+    except AttributeError: return False
+
+def use_grab_drag(prefs, context=None):
+    """GRAB drag input, unless Blender would neither wrap nor warp the cursor; the warp drag is the fallback."""
+    return prefs.drag_input_mode == 'GRAB' and continuous_grab_available(context or bpy.context)
+
+def start_grab_drag():
+    """Hands the current RMB press over to the grab drag operator. Returns True if it is running."""
+    try: result = bpy.ops.view3d.edge_zone_grab_drag('INVOKE_DEFAULT')
+    except RuntimeError as e: log_error("grab_drag", "Error starting grab drag: %s", e); return False
+    return 'RUNNING_MODAL' in result
+
+def get_drag_operator_idname(prefs):
+    return (VIEW3D_OT_edge_zone_grab_drag if use_grab_drag(prefs) else VIEW3D_OT_edge_zone_drag).bl_idname
 
 # --- Addon Preferences ---
+def _on_prefs_update(self, context):
+    """Any setting changed: refresh the snapshot the modal loop and draw handler read."""
+    update_prefs_snapshot(self)
+
+def _on_zone_style_update(self, context):
+    """Zone appearance changed: the listener no longer redraws on every event, so ask for one."""
+    update_prefs_snapshot(self)
+    tag_view3d_redraw(context)
+
+def _on_listener_mode_update(self, context):
+    update_prefs_snapshot(self)
+    apply_listener_mode(self.listener_mode)
+    tag_view3d_redraw(context)
+
+def _on_drag_input_mode_update(self, context):
+    update_prefs_snapshot(self)
+    if self.listener_mode == 'KEYMAP': unregister_keymap(); register_keymap() # Bind RMB to the matching drag operator
+
+def _on_debug_logging_update(self, context):
+    update_prefs_snapshot(self)
+    set_debug_logging(self.debug_logging)
+
+def _on_instrumentation_update(self, context):
+    update_prefs_snapshot(self)
+    set_instrumentation(self.instrumentation)
+    tag_view3d_redraw(context)
+
+def _on_zone_geometry_update(self, context):
+    """Zone size or set of enabled zones changed: drop cached geometry, then redraw."""
+    update_prefs_snapshot(self)
+    bump_prefs_revision()
+    tag_view3d_redraw(context)
+
 class EdgeZoneNavigationPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
 
     # --- General ---
-    zone_color: bpy.props.FloatVectorProperty( name="Zone Color (Idle)", description="Base color (RGB) when inactive", subtype='COLOR', size=3, min=0.0, max=1.0, default=(0.2, 0.2, 0.8) )
-    zone_active_color: bpy.props.FloatVectorProperty( name="Zone Color (Active)", description="Base color (RGB) when RMB dragging in a zone", subtype='COLOR', size=3, min=0.0, max=1.0, default=(0.8, 0.2, 0.2) )
-    zone_opacity: bpy.props.FloatProperty( name="Zone Opacity", description="Opacity (alpha) of the activation zones", default=0.15, min=0.0, max=1.0, subtype='FACTOR' )
-    hide_cursor_on_drag: bpy.props.BoolProperty( name="Hide Cursor During Drag", description="Make the mouse cursor invisible while dragging in zones", default=True )
-    auto_start_listener: bpy.props.BoolProperty( name="Start Automatically", description="Automatically start the zone listener when Blender starts or loads a file (requires saving preferences)", default=True )
-    auto_lock_to_cursor: bpy.props.BoolProperty( name="Auto Lock View to 3D Cursor", description="Automatically enables 'Lock to 3D Cursor' for the view if it's not active", default=False )
+    zone_color: bpy.props.FloatVectorProperty( name="Zone Color (Idle)", description="Base color (RGB) when inactive", subtype='COLOR', size=3, min=0.0, max=1.0, default=(0.2, 0.2, 0.8), update=_on_zone_style_update )
+    zone_active_color: bpy.props.FloatVectorProperty( name="Zone Color (Active)", description="Base color (RGB) when RMB dragging in a zone", subtype='COLOR', size=3, min=0.0, max=1.0, default=(0.8, 0.2, 0.2), update=_on_zone_style_update )
+    zone_opacity: bpy.props.FloatProperty( name="Zone Opacity", description="Opacity (alpha) of the activation zones", default=0.15, min=0.0, max=1.0, subtype='FACTOR', update=_on_zone_style_update )
+    coalesce_input: bpy.props.BoolProperty( name="Frame-Paced Input", description="Apply mouse motion at most once per drawn frame, merging events that arrive in between", default=True, update=_on_prefs_update )
+    warp_margin: bpy.props.IntProperty( name="Warp Margin (px)", description="During a drag the cursor is moved back to its start point once it comes this close to the view edge. 0 only re-centers when it leaves the view", default=50, min=0, max=500, update=_on_prefs_update )
+    drag_input_mode: bpy.props.EnumProperty(
+        name="Drag Input",
+        description="How the cursor is kept from hitting the screen edge during a drag",
+        items=[
+            ('WARP', "Cursor Warp", "Move the cursor back to the drag start when it nears the view edge"),
+            ('GRAB', "Continuous Grab", "Let Blender wrap the cursor like its own view operators and read relative motion"),
+        ],
+        default='WARP', update=_on_drag_input_mode_update
+    )
+    hide_cursor_on_drag: bpy.props.BoolProperty( name="Hide Cursor During Drag", description="Make the mouse cursor invisible while dragging in zones", default=True, update=_on_prefs_update )
+    auto_start_listener: bpy.props.BoolProperty( name="Start Automatically", description="Automatically start the zone listener when Blender starts or loads a file (requires saving preferences)", default=True, update=_on_prefs_update )
+    listener_mode: bpy.props.EnumProperty(
+        name="Listener",
+        description="How right-clicks in the zones are detected",
+        items=[
+            ('MODAL', "Global Listener", "A modal operator running in the background sees every event in the window"),
+            ('KEYMAP', "RMB Keymap", "An RMB keymap item starts a drag only on presses inside a zone, no background cost"),
+        ],
+        default='MODAL', update=_on_listener_mode_update
+    )
+    auto_lock_to_cursor: bpy.props.BoolProperty( name="Auto Lock View to 3D Cursor", description="Automatically enables 'Lock to 3D Cursor' for the view if it's not active", default=False, update=_on_prefs_update )
+
+    debug_logging: bpy.props.BoolProperty( name="Debug Log", description="Also record drag and listener events in the addon log (View > Sidebar > Edge Zone Navigation)", default=False, update=_on_debug_logging_update )
+
+    instrumentation: bpy.props.BoolProperty( name="Measure Latency", description="Time event handling and zone drawing and collect per-drag counts, shown in the N-panel", default=False, update=_on_instrumentation_update )
+    instrumentation_hud: bpy.props.BoolProperty( name="Latency HUD", description="Show the latency percentiles in the viewport while measuring", default=False, update=_on_zone_style_update )
+    profile_duration: bpy.props.FloatProperty( name="Profile Duration (s)", description="How long Profile Navigation records before it writes its files", default=10.0, min=1.0, soft_max=120.0, max=3600.0, update=_on_prefs_update )
+    profile_folder: bpy.props.StringProperty( name="Profile Folder", description="Where profiles (.pstats and collapsed stacks) are written; empty uses the system temporary folder", default="", subtype='DIR_PATH', update=_on_prefs_update )
 
     # --- Roll Zone (Right) ---
-    enable_roll_zone: bpy.props.BoolProperty( name="Enable Roll Zone (Right Edge)", description="Enable the view roll zone on the right edge", default=True )
-    roll_zone_width: bpy.props.IntProperty( name="Roll Zone Width (px)", description="Width of the roll zone", default=400, min=5, max=600 )
-    invert_roll_direction: bpy.props.BoolProperty( name="Invert Roll Direction", description="Reverse the direction of view roll when dragging", default=True )
-    roll_sensitivity: bpy.props.FloatProperty( name="Roll Sensitivity (px/step)", description="Pixels of vertical drag per roll step. Lower is more sensitive.", default=2.5, min=1.0, soft_max=50.0, max=500.0 )
-    roll_angle: bpy.props.FloatProperty( name="Roll Angle (°/step)", description="Degrees the view rolls per step", default=DEFAULT_ROLL_ANGLE_DEGREES, min=math.radians(0.1), soft_max=math.radians(10.0), max=math.radians(45.0), subtype='ANGLE', unit='ROTATION' )
+    enable_roll_zone: bpy.props.BoolProperty( name="Enable Roll Zone (Right Edge)", description="Enable the view roll zone on the right edge", default=True, update=_on_zone_geometry_update )
+    roll_zone_width: bpy.props.IntProperty( name="Roll Zone Width (px)", description="Width of the roll zone", default=400, min=5, max=600, update=_on_zone_geometry_update )
+    invert_roll_direction: bpy.props.BoolProperty( name="Invert Roll Direction", description="Reverse the direction of view roll when dragging", default=True, update=_on_prefs_update )
+    roll_sensitivity: bpy.props.FloatProperty( name="Roll Sensitivity (px/step)", description="Pixels of vertical drag per roll step. Lower is more sensitive.", default=2.5, min=1.0, soft_max=50.0, max=500.0, update=_on_prefs_update )
+    roll_angle: bpy.props.FloatProperty( name="Roll Angle (°/step)", description="Degrees the view rolls per step", default=DEFAULT_ROLL_ANGLE_DEGREES, min=math.radians(0.1), soft_max=math.radians(10.0), max=math.radians(45.0), subtype='ANGLE', unit='ROTATION', update=_on_prefs_update )
+    roll_mode: bpy.props.EnumProperty(
+        name="Roll Engine",
+        description="How roll steps are applied to the view",
+        items=[
+            ('DIRECT', "Direct", "Compose all pending steps into the view rotation with a single update per event"),
+            ('STEPPED', "Stepped (Compatibility)", "Call view3d.view_roll once per step, as in earlier versions"),
+        ],
+        default='DIRECT', update=_on_prefs_update
+    )
+
+    # --- Fast Navigate ---
+    navigation_lod: bpy.props.BoolProperty( name="Fast Navigate", description="Use cheaper viewport settings while dragging in a zone and restore them on release", default=False, update=_on_prefs_update )
+    lod_simplify: bpy.props.BoolProperty( name="Simplify Scene", description="Turn on scene Simplify during the drag", default=True, update=_on_prefs_update )
+    lod_max_subdivision: bpy.props.IntProperty( name="Max Subdivision", description="Simplify subdivision level used during the drag", default=0, min=0, max=6, update=_on_prefs_update )
+    lod_hide_overlays: bpy.props.BoolProperty( name="Hide Overlays", description="Turn viewport overlays off during the drag", default=True, update=_on_prefs_update )
+    lod_solid_shading: bpy.props.BoolProperty( name="Solid Shading", description="Switch to solid shading without X-ray during the drag", default=True, update=_on_prefs_update )
 
     # --- Pan Zones (Left/Bottom) ---
-    enable_pan_vertical_zone: bpy.props.BoolProperty( name="Enable Pan Zone (Left Edge)", description="Enable the view pan zone on the left edge", default=True )
-    enable_pan_horizontal_zone: bpy.props.BoolProperty( name="Enable Pan Zone (Bottom Edge)", description="Enable the view pan zone on the bottom edge", default=True )
-    pan_zone_thickness: bpy.props.IntProperty( name="Pan Zone Thickness (px)", description="Thickness of the pan zones (width for left, height for bottom)", default=DEFAULT_ZONE_THICKNESS, min=5, max=600 )
-    invert_pan_vertical: bpy.props.BoolProperty( name="Invert Vertical Pan", description="Reverse the up/down pan direction", default=False )
-    invert_pan_horizontal: bpy.props.BoolProperty( name="Invert Horizontal Pan", description="Reverse the left/right pan direction", default=False )
-    pan_sensitivity: bpy.props.FloatProperty( name="Pan Sensitivity (px/step)", description="Pixels of drag per pan step. Lower is more sensitive.", default=DEFAULT_PAN_SENSITIVITY, min=1.0, soft_max=50.0, max=500.0 )
+    enable_pan_vertical_zone: bpy.props.BoolProperty( name="Enable Pan Zone (Left Edge)", description="Enable the view pan zone on the left edge", default=True, update=_on_zone_geometry_update )
+    enable_pan_horizontal_zone: bpy.props.BoolProperty( name="Enable Pan Zone (Bottom Edge)", description="Enable the view pan zone on the bottom edge", default=True, update=_on_zone_geometry_update )
+    pan_zone_thickness: bpy.props.IntProperty( name="Pan Zone Thickness (px)", description="Thickness of the pan zones (width for left, height for bottom)", default=DEFAULT_ZONE_THICKNESS, min=5, max=600, update=_on_zone_geometry_update )
+    invert_pan_vertical: bpy.props.BoolProperty( name="Invert Vertical Pan", description="Reverse the up/down pan direction", default=False, update=_on_prefs_update )
+    invert_pan_horizontal: bpy.props.BoolProperty( name="Invert Horizontal Pan", description="Reverse the left/right pan direction", default=False, update=_on_prefs_update )
+    pan_sensitivity: bpy.props.FloatProperty( name="Pan Sensitivity (px/step)", description="Pixels of drag per pan step. Lower is more sensitive.", default=DEFAULT_PAN_SENSITIVITY, min=1.0, soft_max=50.0, max=500.0, update=_on_prefs_update )
+    pan_mode: bpy.props.EnumProperty(
+        name="Pan Engine",
+        description="How pan movement is applied to the view",
+        items=[
+            ('DIRECT', "Direct", "Move the view center by the exact drag distance with a single update per event"),
+            ('STEPPED', "Stepped (Compatibility)", "Call view3d.view_pan once per step, as in earlier versions"),
+        ],
+        default='DIRECT', update=_on_prefs_update
+    )
     def draw(self, context):
         layout = self.layout
         col = layout.column(align=True)
@@ -482,8 +1432,17 @@ class EdgeZoneNavigationPreferences(bpy.types.AddonPreferences):
         sub.prop(self, "zone_active_color")
         sub.prop(self, "zone_opacity")
         sub.prop(self, "hide_cursor_on_drag")
-        sub.prop(self, "auto_start_listener")
+        sub.prop(self, "coalesce_input")
+        sub.prop(self, "drag_input_mode")
+        row = sub.row(); row.active = not use_grab_drag(self, context); row.prop(self, "warp_margin") # Also used when Continuous Grab is off
+        sub.prop(self, "listener_mode")
+        row = sub.row(); row.active = self.listener_mode == 'MODAL'; row.prop(self, "auto_start_listener")
         sub.prop(self, "auto_lock_to_cursor")
+        sub.prop(self, "debug_logging")
+        sub.prop(self, "instrumentation")
+        row = sub.row(); row.active = self.instrumentation; row.prop(self, "instrumentation_hud")
+        sub.prop(self, "profile_duration")
+        sub.prop(self, "profile_folder")
         sub.separator() # Small separator
 
         # --- Roll Zone Settings ---
@@ -496,6 +1455,7 @@ class EdgeZoneNavigationPreferences(bpy.types.AddonPreferences):
         sub.prop(self, "roll_zone_width")
         sub.prop(self, "roll_sensitivity")
         sub.prop(self, "roll_angle")
+        sub.prop(self, "roll_mode")
         sub.prop(self, "invert_roll_direction")
         sub.separator() # Small separator
 
@@ -511,6 +1471,7 @@ class EdgeZoneNavigationPreferences(bpy.types.AddonPreferences):
         sub.active = self.enable_pan_vertical_zone or self.enable_pan_horizontal_zone
         sub.prop(self, "pan_zone_thickness")
         sub.prop(self, "pan_sensitivity")
+        sub.prop(self, "pan_mode")
 
         # Inversion settings active only if corresponding zone is on
         sub_v = box.column(align=True)
@@ -521,6 +1482,64 @@ class EdgeZoneNavigationPreferences(bpy.types.AddonPreferences):
         sub_h.active = self.enable_pan_horizontal_zone
         sub_h.prop(self, "invert_pan_horizontal")
 
+        # --- Fast Navigate Settings ---
+        box = col.box()
+        box.prop(self, "navigation_lod")
+        sub = box.column(align=True)
+        sub.active = self.navigation_lod
+        sub.prop(self, "lod_simplify")
+        row = sub.row(); row.active = self.lod_simplify; row.prop(self, "lod_max_subdivision")
+        sub.prop(self, "lod_hide_overlays")
+        sub.prop(self, "lod_solid_shading")
+
+# --- Preferences Snapshot ---
+PREF_NAMES = tuple(EdgeZoneNavigationPreferences.__annotations__)
+
+class PrefsSnapshot:
+    """Plain copy of the addon preferences. The modal loop and draw handler read this instead of RNA."""
+    __slots__ = PREF_NAMES + ("zone_idle_rgba", "zone_active_rgba")
+
+    def update_from(self, source):
+        for name in PREF_NAMES:
+            value = getattr(source, name)
+            if not isinstance(value, (bool, int, float, str)): value = tuple(value) # Color arrays
+            setattr(self, name, value)
+        opacity = self.zone_opacity
+        self.zone_idle_rgba = (*self.zone_color[:3], opacity)
+        self.zone_active_rgba = (*self.zone_active_color[:3], opacity)
+        return self
+
+    @classmethod
+    def from_defaults(cls):
+        defaults = type("PrefsDefaults", (), {name: prop.keywords.get("default") for name, prop in EdgeZoneNavigationPreferences.__annotations__.items()})
+        return cls().update_from(defaults)
+
+_prefs_snapshot = None
+_prefs_snapshot_is_fallback = False # Defaults used because the addon prefs were not reachable yet; retried on next read
+
+def update_prefs_snapshot(prefs):
+    global _prefs_snapshot, _prefs_snapshot_is_fallback
+    if _prefs_snapshot is None or _prefs_snapshot_is_fallback: _prefs_snapshot = PrefsSnapshot()
+    _prefs_snapshot.update_from(prefs)
+    _prefs_snapshot_is_fallback = False
+
+def refresh_prefs_snapshot(context):
+    """Re-reads the addon preferences; falls back to the property defaults if the addon is not found."""
+    global _prefs_snapshot, _prefs_snapshot_is_fallback
+    try: prefs = context.preferences.addons[__name__].preferences
+    except (KeyError, AttributeError): prefs = None
+    if prefs is None:
+        if _prefs_snapshot is None or not _prefs_snapshot_is_fallback:
+            print("Warning: Could not find addon preferences, using fallback defaults.")
+            _prefs_snapshot = PrefsSnapshot.from_defaults(); _prefs_snapshot_is_fallback = True
+    else:
+        update_prefs_snapshot(prefs)
+    return _prefs_snapshot
+
+def get_prefs_snapshot(context=None):
+    if _prefs_snapshot is None or _prefs_snapshot_is_fallback: return refresh_prefs_snapshot(context or bpy.context)
+    return _prefs_snapshot
+
 # --- Panel ---
 class VIEW3D_PT_edge_zone_navigation_panel(bpy.types.Panel):
     bl_label = "Edge Zone Navigation"; bl_idname = "VIEW3D_PT_edge_zone_navigation_panel"
@@ -532,19 +1551,27 @@ class VIEW3D_PT_edge_zone_navigation_panel(bpy.types.Panel):
         except KeyError: layout.label(text="Error: Prefs not found.", icon='ERROR'); return
 
         col = layout.column()
-        global _global_op_instance
         op_idname = VIEW3D_OT_edge_zone_navigation.bl_idname
         stop_op_idname = "view3d.edge_zone_navigation_stop"
-        is_running = _global_op_instance is not None
+        listener = get_listener(context.window)
+        is_running = listener is not None
 
-        if is_running:
+        if prefs.listener_mode == 'KEYMAP':
+             col.label(text="Status: Active (RMB Keymap)")
+        elif is_running:
              col.operator(stop_op_idname, text="Stop Edge Zones", icon='PLUGIN')
              col.label(text="Status: Running (RMB Drag Edges)")
+             if len(_listeners) > 1: col.label(text=f"Listening in {len(_listeners)} windows")
+             redraw = listener._redraw
+             if redraw: col.label(text=f"Redraws: {redraw.redraws_requested} / {redraw.events_processed} events")
         else:
              col.operator(op_idname, text="Start Edge Zones", icon='PLUGIN')
              col.label(text="Status: Stopped")
+        if drag_telemetry.moves:
+            col.label(text=f"Drag Moves: {drag_telemetry.moves}, View Updates: {drag_telemetry.view_updates}")
+            col.label(text=f"Warps: {drag_telemetry.warps}, Dropped: {drag_telemetry.synthetic_dropped}")
 
-        col.label(text=f"Auto-Start: {'Enabled' if prefs.auto_start_listener else 'Disabled'}")
+        if prefs.listener_mode == 'MODAL': col.label(text=f"Auto-Start: {'Enabled' if prefs.auto_start_listener else 'Disabled'}")
         col.separator()
 
         # --- Quick Settings Box (Refined) ---
@@ -585,6 +1612,40 @@ class VIEW3D_PT_edge_zone_navigation_panel(bpy.types.Panel):
         # View Section
         q_col.label(text="View:")
         q_col.prop(prefs, "auto_lock_to_cursor", text="Auto Lock to Cursor")
+        q_col.prop(prefs, "navigation_lod", text="Fast Navigate")
+
+        # --- Performance ---
+        box = col.box()
+        row = box.row(); row.prop(prefs, "instrumentation", text="Measure Latency"); row.prop(prefs, "instrumentation_hud", text="HUD")
+        if prefs.instrumentation:
+            stats_col = box.column(align=True)
+            for line in metrics.summary_lines(): stats_col.label(text=line)
+            stats_col.label(text=f"Warps: {drag_telemetry.warps}, View Updates: {drag_telemetry.view_updates}")
+            box.operator(VIEW3D_OT_edge_zone_navigation_reset_stats.bl_idname, text="Reset", icon='LOOP_BACK')
+
+        # --- Recording ---
+        row = box.row(align=True)
+        if session_recorder.active:
+            row.operator(VIEW3D_OT_edge_zone_navigation_record.bl_idname, text=f"Stop Recording ({session_recorder.count})", icon='PAUSE')
+        else:
+            row.operator(VIEW3D_OT_edge_zone_navigation_record.bl_idname, text="Record", icon='REC')
+            row.operator(VIEW3D_OT_edge_zone_navigation_replay.bl_idname, text="Replay", icon='PLAY')
+        row = box.row(align=True)
+        if navigation_profiler.active:
+            row.operator(VIEW3D_OT_edge_zone_navigation_profile.bl_idname, text=f"Stop Profiling ({navigation_profiler.remaining:.0f} s left)", icon='PAUSE')
+        else:
+            row.operator(VIEW3D_OT_edge_zone_navigation_profile.bl_idname, text="Profile Navigation", icon='TIME')
+            row.prop(prefs, "profile_duration", text="")
+        if navigation_profiler.last_paths: box.label(text=os.path.basename(navigation_profiler.last_paths[0]), icon='FILE')
+
+        # --- Log ---
+        if event_log.counts:
+            box = col.box()
+            box.label(text=f"Log: {sum(event_log.counts.values())} messages, {len(event_log.entries)} kept", icon='TEXT')
+            for _, level, key, message in list(event_log.entries)[-3:]: box.label(text=message, icon='ERROR' if level == 'ERROR' else 'INFO')
+            row = box.row(align=True)
+            row.operator(VIEW3D_OT_edge_zone_navigation_log.bl_idname, text="Dump").action = 'DUMP'
+            row.operator(VIEW3D_OT_edge_zone_navigation_log.bl_idname, text="Clear").action = 'CLEAR'
 
         # Link to full settings remains below box
         col.separator() # Padding before "More Settings" button
@@ -596,110 +1657,280 @@ class VIEW3D_OT_edge_zone_navigation_stop(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        global _global_op_instance
-        return _global_op_instance is not None
+        return bool(_listeners)
 
     def execute(self, context):
-        global _global_op_instance
-        op_to_cancel = _global_op_instance
-        if op_to_cancel:
+        if _listeners:
             try:
                 prefs = context.preferences.addons[__name__].preferences
                 prefs.auto_start_listener = False
             except KeyError: pass
             except Exception as e: print(f"Error accessing prefs on stop: {e}")
-            try: op_to_cancel.cancel_modal(context)
-            except Exception as e:
-                print(f"Error calling cancel_modal on {op_to_cancel}: {e}")
-                cleanup_previous_state()
+            for op_to_cancel in list(_listeners.values()):
+                try: op_to_cancel.cancel_modal(context)
+                except Exception as e: print(f"Error calling cancel_modal on {op_to_cancel}: {e}")
         else:
             self.report({'WARNING'}, "Edge Zone Navigation was not running or reference lost.")
-            cleanup_previous_state()
-        _global_op_instance = None
-        for window in context.window_manager.windows:
-            for area in window.screen.areas:
-                if area.type == 'VIEW_3D':
-                    try: area.tag_redraw()
-                    except Exception: pass
+        cleanup_previous_state()
+        tag_view3d_redraw(context)
+        return {'FINISHED'}
+
+# --- Log Operator ---
+class VIEW3D_OT_edge_zone_navigation_log(bpy.types.Operator):
+    """Write the Edge Zone Navigation log to a text datablock and the console, or clear it"""
+    bl_idname = "view3d.edge_zone_navigation_log"; bl_label = "Edge Zone Navigation Log"; bl_options = {'REGISTER'}
+
+    action: bpy.props.EnumProperty( items=[('DUMP', "Dump", "Write the log to the 'Edge Zone Navigation Log' text"), ('CLEAR', "Clear", "Empty the log")], default='DUMP' )
+
+    def execute(self, context):
+        if self.action == 'CLEAR':
+            event_log.clear(); return {'FINISHED'}
+        lines = event_log.format_lines()
+        lines.append("")
+        lines.extend(f"{key}: {count}" for key, count in sorted(event_log.counts.items()))
+        text = bpy.data.texts.get("Edge Zone Navigation Log") or bpy.data.texts.new("Edge Zone Navigation Log")
+        text.clear(); text.write("\n".join(lines) + "\n")
+        print("\n".join(lines))
+        self.report({'INFO'}, f"Log written to text 'Edge Zone Navigation Log' ({len(event_log.entries)} entries)")
+        return {'FINISHED'}
+
+# --- Reset Statistics Operator ---
+class VIEW3D_OT_edge_zone_navigation_reset_stats(bpy.types.Operator):
+    """Clear the latency histograms and drag counters"""
+    bl_idname = "view3d.edge_zone_navigation_reset_stats"; bl_label = "Reset Edge Zone Statistics"; bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        metrics.reset(); drag_telemetry.reset()
+        tag_view3d_redraw(context)
+        return {'FINISHED'}
+
+# --- Session Recording Operators ---
+def get_session_path(filepath):
+    return bpy.path.abspath(filepath) if filepath else os.path.join(default_output_folder(), "edge_zone_session.eznrec")
+
+class VIEW3D_OT_edge_zone_navigation_record(bpy.types.Operator):
+    """Start or stop recording zone drags to a file for replay"""
+    bl_idname = "view3d.edge_zone_navigation_record"; bl_label = "Record Edge Zone Session"; bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty( name="File", description="Recording file; empty uses the temporary directory", default="", subtype='FILE_PATH' )
+
+    def execute(self, context):
+        if session_recorder.active:
+            try: count = session_recorder.stop()
+            except OSError as e: self.report({'ERROR'}, f"Cannot write {session_recorder.path}: {e}"); return {'CANCELLED'}
+            self.report({'INFO'}, f"Recorded {count} events to {session_recorder.path}" if count else "Nothing recorded")
+        else:
+            path = get_session_path(self.filepath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            session_recorder.start(path, get_prefs_snapshot(context))
+            self.report({'INFO'}, f"Recording zone drags to {session_recorder.path}")
+        return {'FINISHED'}
+
+class VIEW3D_OT_edge_zone_navigation_replay(bpy.types.Operator):
+    """Replay a recorded session in this view, check that every drag ends at the recorded view, then put the view back"""
+    bl_idname = "view3d.edge_zone_navigation_replay"; bl_label = "Replay Edge Zone Session"; bl_options = {'REGISTER'}
+
+    filepath: bpy.props.StringProperty( name="File", description="Recording file; empty uses the last one", default="", subtype='FILE_PATH' )
+
+    @staticmethod
+    def get_view(context):
+        """The 3D View's RegionView3D; the N-panel button runs in the sidebar region, which has no region_data."""
+        if context.region_data is not None: return context.region_data
+        space = context.space_data
+        return space.region_3d if space is not None and space.type == 'VIEW_3D' else None
+
+    @classmethod
+    def poll(cls, context):
+        return can_apply_view_directly(cls.get_view(context)) and not session_recorder.active and _drag_owner is None
+
+    def execute(self, context):
+        path = get_session_path(self.filepath or session_recorder.path)
+        region_3d = self.get_view(context)
+        saved = (region_3d.view_rotation.copy(), region_3d.view_location.copy(), region_3d.view_distance)
+        try: result = replay_session(path, region_3d) # Free-view stand-in: the direct engines even in a locked view
+        except (OSError, ValueError, struct.error) as e: self.report({'ERROR'}, f"Cannot replay {path}: {e}"); return {'CANCELLED'}
+        finally: region_3d.view_rotation, region_3d.view_location, region_3d.view_distance = saved
+        context.area.tag_redraw()
+        summary = (f"{result.drags} drags, {result.events} events in {result.seconds * 1000.0:.1f} ms; "
+                   f"max error rotation {result.rotation_error:.2e}, location {result.location_error:.2e}")
+        if result.stepped: summary += f"; {result.stepped} drags recorded with view_roll/view_pan not checked"
+        if result.matches(): self.report({'INFO'}, "Replay matches: " + summary)
+        else: self.report({'WARNING'}, "Replay differs: " + summary)
+        return {'FINISHED'}
+
+# --- Profiling Operator ---
+class VIEW3D_OT_edge_zone_navigation_profile(bpy.types.Operator):
+    """Profile zone navigation for a while, or stop and write the profile now"""
+    bl_idname = "view3d.edge_zone_navigation_profile"; bl_label = "Profile Edge Zone Navigation"; bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if navigation_profiler.active:
+            try: paths = navigation_profiler.stop()
+            except OSError as e: self.report({'ERROR'}, f"Could not write profile: {e}"); return {'CANCELLED'}
+            self.report({'INFO'}, f"Profile written to {paths[0]} and {os.path.basename(paths[1])}" if paths else "Nothing was profiled")
+        else:
+            prefs = get_prefs_snapshot(context)
+            folder = bpy.path.abspath(prefs.profile_folder) if prefs.profile_folder else default_output_folder()
+            navigation_profiler.start(prefs.profile_duration, folder)
+            self.report({'INFO'}, f"Profiling navigation for {prefs.profile_duration:.0f} s")
         return {'FINISHED'}
 
 # --- Menu Registration ---
 def menu_func_start(self, context):
     op_idname = VIEW3D_OT_edge_zone_navigation.bl_idname
-    global _global_op_instance; is_running = _global_op_instance is not None
-    if not is_running: self.layout.operator(op_idname, text="Start Edge Zone Navigation")
+    is_running = get_listener(context.window) is not None
+    if not is_running and get_prefs_snapshot(context).listener_mode == 'MODAL': self.layout.operator(op_idname, text="Start Edge Zone Navigation")
 def menu_func_stop(self, context):
     stop_op_idname = VIEW3D_OT_edge_zone_navigation_stop.bl_idname
-    global _global_op_instance; is_running = _global_op_instance is not None
+    is_running = bool(_listeners)
     if is_running: self.layout.operator(stop_op_idname, text="Stop Edge Zone Navigation")
 
+# --- Auto-Start ---
+# Restarts are driven by signals (file load, workspace/screen/editor changes, the listener being
+# cancelled by Blender). Each signal arms a short retry that backs off and stops for good once the
+# listener runs or the retries are used up, so nothing polls in the steady state.
+AUTO_START_FIRST_DELAY = 0.1
+AUTO_START_MAX_INTERVAL = 8.0
+_auto_start_interval = AUTO_START_FIRST_DELAY
+_msgbus_owner = object()
+
+def schedule_auto_start(delay=AUTO_START_FIRST_DELAY):
+    """Arms auto_start_handler with a fresh backoff."""
+    global _auto_start_interval
+    _auto_start_interval = delay
+    if bpy.app.timers.is_registered(auto_start_handler): bpy.app.timers.unregister(auto_start_handler)
+    bpy.app.timers.register(auto_start_handler, first_interval=delay)
+
+def _on_layout_change(*args):
+    schedule_auto_start() # Cheap when every window already listens: the first attempt finds nothing to do
+
+_auto_start_windows = set() # Window pointers a draw has already requested a listener for
+
+def request_window_listener(window):
+    """A new window sends no signal the auto-start listens to: the first draw of a 3D View in a window
+    without a listener arms one auto-start while listeners run elsewhere."""
+    if window is None or not _listeners: return
+    key = window.as_pointer()
+    if key in _auto_start_windows: return
+    _auto_start_windows.add(key)
+    prefs = get_prefs_snapshot()
+    if prefs.listener_mode == 'MODAL' and prefs.auto_start_listener: schedule_auto_start()
+
+def subscribe_layout_changes():
+    """Workspace/screen switches and editor type changes can bring a 3D View the listener can start in."""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for key in ((bpy.types.Window, "workspace"), (bpy.types.Window, "screen"),
+                (bpy.types.Area, "type"), (bpy.types.Area, "ui_type")):
+        bpy.msgbus.subscribe_rna(key=key, owner=_msgbus_owner, args=(), notify=_on_layout_change)
+
+# --- Keymap ---
+_addon_keymaps = [] # (keymap, keymap item) pairs added in KEYMAP listener mode
+
+def register_keymap():
+    if _addon_keymaps: return
+    kc = bpy.context.window_manager.keyconfigs.addon
+    if kc is None: return # Background mode has no addon keyconfig
+    km = kc.keymaps.new(name="3D View", space_type='VIEW_3D')
+    kmi = km.keymap_items.new(get_drag_operator_idname(get_prefs_snapshot()), 'RIGHTMOUSE', 'PRESS', head=True)
+    _addon_keymaps.append((km, kmi))
+
+def unregister_keymap():
+    for km, kmi in _addon_keymaps:
+        try: km.keymap_items.remove(kmi)
+        except (ReferenceError, RuntimeError): pass
+    _addon_keymaps.clear()
+
+def apply_listener_mode(mode, auto_start_delay=AUTO_START_FIRST_DELAY):
+    """Switches between the global modal listener and the RMB keymap operator."""
+    log_debug("listener_mode", "Listener mode %s", mode)
+    if mode == 'KEYMAP':
+        for op in list(_listeners.values()):
+            try: op.cancel_modal(bpy.context)
+            except Exception as e: print(f"Error stopping listener: {e}")
+        register_keymap()
+        ensure_draw_handler() # Zones are drawn without a running listener
+    else:
+        unregister_keymap()
+        if not _listeners: remove_draw_handler()
+        schedule_auto_start(auto_start_delay)
+
 # --- Load Handler ---
 @persistent
 def load_post_handler(dummy):
     cleanup_previous_state()
-    # The persistent timer will handle restarts. We just need to ensure it's registered.
-    if not bpy.app.timers.is_registered(auto_start_handler):
-        # Use a small delay to allow UI to build after file load
-        bpy.app.timers.register(auto_start_handler, first_interval=0.5)
-def auto_start_handler():
-    """Timer function to ensure the operator is running if auto-start is enabled."""
-    global _global_op_instance
+    subscribe_layout_changes() # Loading a file clears msgbus subscriptions
+    # Use a small delay to allow UI to build after file load
+    apply_listener_mode(get_prefs_snapshot().listener_mode, 0.5)
+
+def try_start_listener():
+    """Starts a listener in every window that has a 3D View but no listener. Returns True if none is left to start."""
+    all_started = True
+    for window in bpy.context.window_manager.windows:
+        if get_listener(window) is not None or window.screen is None: continue
+        context_override_dict = None
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                # Find a window region within the 3D view area
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        context_override_dict = {
+                            "window": window,
+                            "screen": window.screen,
+                            "area": area,
+                            "region": region,
+                            "space_data": area.spaces.active
+                        }
+                        break
+                if context_override_dict:
+                    break
+        if not context_override_dict: continue # No 3D View in this window (yet)
+
+        try:
+            # Use temp_override for a more robust context-safe operator call,
+            # which is better for timers running in the background.
+            with bpy.context.temp_override(**context_override_dict):
+                bpy.ops.view3d.edge_zone_navigation('INVOKE_DEFAULT')
+        except RuntimeError:
+            # This can happen if the context is not quite right (e.g., during a workspace switch).
+            pass
+        except Exception as e:
+            print(f"Edge Zone Navigation: Auto-start error: {e}")
+        if get_listener(window) is None: all_started = False
+    return all_started
 
+def auto_start_handler():
+    """Timer function: starts listeners if auto-start is enabled, retrying with exponential backoff."""
+    global _auto_start_interval
     try:
+        prefs = get_prefs_snapshot(bpy.context)
+        if prefs.listener_mode != 'MODAL' or not prefs.auto_start_listener: return None
         # Context can be incomplete during startup or screen changes
-        if not bpy.context.window or not bpy.context.screen:
-            return 1.0 # Try again in 1 sec
-
-        prefs = bpy.context.preferences.addons[__name__].preferences
-        is_running = _global_op_instance is not None
-
-        if prefs.auto_start_listener and not is_running:
-            context_override_dict = None
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    # Find a window region within the 3D view area
-                    for region in area.regions:
-                        if region.type == 'WINDOW':
-                            context_override_dict = {
-                                "window": bpy.context.window,
-                                "screen": bpy.context.screen,
-                                "area": area,
-                                "region": region,
-                                "space_data": area.spaces.active
-                            }
-                            break
-                    if context_override_dict:
-                        break
-            
-            if context_override_dict:
-                try:
-                    # Use temp_override for a more robust context-safe operator call,
-                    # which is better for timers running in the background.
-                    with bpy.context.temp_override(**context_override_dict):
-                        bpy.ops.view3d.edge_zone_navigation('INVOKE_DEFAULT')
-                except RuntimeError:
-                    # This can happen if the context is not quite right (e.g., during a workspace switch)
-                    # or if the operator is already running. The timer will simply try again.
-                    pass
-                except Exception as e:
-                    print(f"Edge Zone Navigation: Auto-start timer error: {e}")
-
+        if bpy.context.window_manager and try_start_listener(): return None # Every window listens, stop polling
     except (AttributeError, KeyError):
-        # This can happen if prefs are not ready on startup. The timer will retry.
+        # This can happen if prefs are not ready on startup. Retry below.
         pass
 
-    return 1.0 # Reschedule to run again in 1 second.
+    if _auto_start_interval >= AUTO_START_MAX_INTERVAL: return None # Wait for the next layout change or file load
+    _auto_start_interval = min(_auto_start_interval * 2.0, AUTO_START_MAX_INTERVAL)
+    return _auto_start_interval
 
 # --- Registration/Unregistration ---
 classes = (
     EdgeZoneNavigationPreferences,
     VIEW3D_OT_edge_zone_navigation,
     VIEW3D_OT_edge_zone_navigation_stop,
+    VIEW3D_OT_edge_zone_navigation_log,
+    VIEW3D_OT_edge_zone_navigation_reset_stats,
+    VIEW3D_OT_edge_zone_drag,
+    VIEW3D_OT_edge_zone_grab_drag,
+    VIEW3D_OT_edge_zone_navigation_record,
+    VIEW3D_OT_edge_zone_navigation_replay,
+    VIEW3D_OT_edge_zone_navigation_profile,
     VIEW3D_PT_edge_zone_navigation_panel,
 )
 def register():
-    global _shader, _draw_handler_ref
-    _shader = None; _draw_handler_ref = None
+    global _shader, _draw_handler_ref, _prefs_snapshot
+    _shader = None; _draw_handler_ref = None; _prefs_snapshot = None; _addon_keymaps.clear()
 
     for cls in classes:
         try: bpy.utils.register_class(cls)
@@ -713,14 +1944,22 @@ def register():
     if load_post_handler not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(load_post_handler)
 
-    if not bpy.app.timers.is_registered(auto_start_handler):
-        bpy.app.timers.register(auto_start_handler, first_interval=0.5)
+    subscribe_layout_changes()
+    set_debug_logging(get_prefs_snapshot().debug_logging)
+    set_instrumentation(get_prefs_snapshot().instrumentation)
+    apply_listener_mode(get_prefs_snapshot().listener_mode, 0.5)
 def unregister():
-    global _shader, _global_op_instance, _draw_handler_ref
+    global _shader, _draw_handler_ref, _prefs_snapshot
     cleanup_previous_state()
+    unregister_keymap()
+    try: session_recorder.stop() # Keep what was recorded so far
+    except OSError as e: print(f"Warning: Could not write session recording: {e}")
+    try: navigation_profiler.stop()
+    except OSError as e: print(f"Warning: Could not write profile: {e}")
 
     if bpy.app.timers.is_registered(auto_start_handler):
         bpy.app.timers.unregister(auto_start_handler)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
 
     if load_post_handler in bpy.app.handlers.load_post:
         try: bpy.app.handlers.load_post.remove(load_post_handler)
@@ -735,7 +1974,8 @@ def unregister():
         try: bpy.utils.unregister_class(cls)
         except RuntimeError as e: print(f"Warning: Could not unregister class '{cls.__name__}': {e}")
 
-    _shader = None; _global_op_instance = None; _draw_handler_ref = None
+    _shader = None; _draw_handler_ref = None; _prefs_snapshot = None
+    _overlay_cache.clear(); set_debug_logging(False); metrics.enabled = False
 
 if __name__ == "__main__":
     print("--- Running Addon Registration Test ---")
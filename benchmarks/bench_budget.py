@@ -0,0 +1,136 @@
+"""Operator-call and redraw budget per navigation session, checked against benchmarks/budgets.json.
+
+Replays synthetic sessions (bench_hot_path's event streams under several preference sets) and any
+recordings given with --session through the listener's modal() and draw_callback_px under the
+headless stubs. Synthetic sessions draw a frame every bench_hot_path.EVENTS_PER_FRAME events;
+recordings draw one every 1/60 s of recorded time. For each session it counts:
+view_roll and view_pan operator calls, cursor_warp calls, tag_redraw calls and GPU batch creations.
+These counts do not depend on how fast or busy the machine is, unlike wall time.
+
+    python benchmarks/bench_budget.py                  # check; exit status 1 if a count is over budget
+    python benchmarks/bench_budget.py --update         # store the current counts as the budgets
+    python benchmarks/bench_budget.py --session a.eznrec --session b.eznrec
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "headless"))
+
+from harness import ADDON_PATH, Harness, load_addon # noqa: E402
+from bpy._runtime import context, stats # noqa: E402
+import bench_hot_path # noqa: E402
+
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets.json")
+FRAME_INTERVAL = 1.0 / 60.0
+SYNTHETIC_EVENTS = 2000
+
+COUNTERS = {
+    "view_roll": ("ops.view3d.view_roll",),
+    "view_pan": ("ops.view3d.view_pan",),
+    "cursor_warp": ("window.cursor_warp",),
+    "tag_redraw": ("area.tag_redraw", "region.tag_redraw"),
+    "batch_create": ("gpu.batch_create",),
+}
+PREF_SETS = {
+    "": {},
+    "stepped": {"roll_mode": 'STEPPED', "pan_mode": 'STEPPED'},
+    "unpaced": {"coalesce_input": False},
+    "grab": {"drag_input_mode": 'GRAB'},
+    "keymap": {"listener_mode": 'KEYMAP'},
+}
+SYNTHETIC_SESSIONS = [
+    ("idle_hover", ""), ("roll_drag", ""), ("diagonal_pan", ""), ("warp_storm", ""),
+    ("roll_drag", "stepped"), ("diagonal_pan", "stepped"), ("roll_drag", "unpaced"),
+    ("warp_storm", "grab"), ("roll_drag", "keymap"),
+]
+
+def count_calls(calls):
+    return {name: sum(calls.get(key, 0) for key in keys) for name, keys in COUNTERS.items()}
+
+def _start(prefs_overrides, size=(1920, 1080)):
+    h = Harness(size=size)
+    prefs = context.preferences.addons[h.addon.__name__].preferences
+    for key, value in prefs_overrides.items(): setattr(prefs, key, value)
+    h.advance(1.0) # Auto-start the listener (MODAL mode)
+    return h
+
+def run_synthetic(scenario, pref_set):
+    make_stream, overrides = bench_hot_path.SCENARIOS[scenario]
+    with contextlib.redirect_stdout(io.StringIO()):
+        h = _start(dict(overrides, **PREF_SETS[pref_set])); stats.clear()
+        bench_hot_path._replay(h, make_stream(h, SYNTHETIC_EVENTS)) # One frame per EVENTS_PER_FRAME events
+        calls = stats.snapshot(); h.unregister()
+    return count_calls(calls)
+
+def read_recording(path):
+    """Metadata and (time, kind, flags, x, y, width, height) records of a recording."""
+    addon = load_addon(ADDON_PATH)
+    with addon.SessionFile(path) as session:
+        return session.meta, [(t, kind, flags, x, y, w, h) for t, kind, _zone, flags, x, y, w, h, *_view in session.records()]
+
+def run_recording(path):
+    """Replays a recording through the harness event dispatch. The window is the size of the first recorded region."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        meta, records = read_recording(path)
+        if not records: return None
+        prefs = {key: value for key, value in meta.get("prefs", {}).items() if key != "auto_start_listener"}
+        h = _start(prefs, size=records[0][5:7]); stats.clear()
+        addon = h.addon; next_frame = records[0][0] + FRAME_INTERVAL
+        for t, kind, flags, x, y, _w, _h in records:
+            if flags & addon.REC_FLAG_ECHO: continue # The harness delivers the echoes of its own warps
+            while t >= next_frame: h.draw(); next_frame += FRAME_INTERVAL
+            if kind == addon.REC_PRESS: h.press(x, y)
+            elif kind == addon.REC_MOVE: h.move(x, y)
+            else: h.release(x, y)
+        h.draw()
+        calls = stats.snapshot(); h.unregister()
+    return count_calls(calls)
+
+def collect(session_paths):
+    results = {}
+    for scenario, pref_set in SYNTHETIC_SESSIONS:
+        results[f"{scenario}:{pref_set}" if pref_set else scenario] = run_synthetic(scenario, pref_set)
+    for path in session_paths:
+        counts = run_recording(path)
+        if counts is not None: results[os.path.basename(path)] = counts
+    return results
+
+def check(results, budgets, slack):
+    """Returns one line per session and the number of counters over budget."""
+    lines = []; over = 0
+    for name, counts in results.items():
+        budget = budgets.get(name)
+        if budget is None: lines.append(f"{name:<24} {counts}  (no budget)"); continue
+        failures = [f"{key} {value} > {budget.get(key, 0)}" for key, value in counts.items() if value > budget.get(key, 0) * (1.0 + slack)]
+        over += len(failures)
+        lines.append(f"{name:<24} {counts}" + ("  OVER BUDGET: " + ", ".join(failures) if failures else "  ok"))
+    return lines, over
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--session", action="append", default=[], help="Recording to include (repeatable)")
+    parser.add_argument("--budgets", default=BUDGETS_PATH, help="Budget file")
+    parser.add_argument("--update", action="store_true", help="Write the current counts as the new budgets")
+    parser.add_argument("--slack", type=float, default=0.0, help="Relative increase over a budget that still passes")
+    args = parser.parse_args(argv)
+    results = collect(args.session)
+    if args.update:
+        budgets = {}
+        if os.path.exists(args.budgets):
+            with open(args.budgets) as f: budgets = json.load(f)
+        budgets.update(results)
+        with open(args.budgets, "w") as f: json.dump(budgets, f, indent=1, sort_keys=True); f.write("\n")
+        print(f"Wrote {len(results)} budgets to {args.budgets}")
+        return 0
+    with open(args.budgets) as f: budgets = json.load(f)
+    lines, over = check(results, budgets, args.slack)
+    print("\n".join(lines))
+    print(f"{over} counter(s) over budget" if over else "All sessions within budget")
+    return 1 if over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Per-event cost of drag-state updates: RNA properties vs the addon's plain DragState object.
+
+The listener used to keep its drag state in operator properties; every MOUSEMOVE read and
+wrote several of them through RNA. This replays the same per-event reads/writes against an
+RNA PropertyGroup with the old properties and against DragState.
+
+Run inside Blender:
+    blender --background --factory-startup --python benchmarks/bench_drag_state.py
+"""
+import importlib.util
+import os
+import sys
+import timeit
+
+try:
+    import bpy
+except ImportError:
+    sys.exit("bench_drag_state.py needs bpy: run it with 'blender --background --python'.")
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Edge_Zone_Navigation.py")
+EVENTS = 200_000
+
+def load_addon_module():
+    spec = importlib.util.spec_from_file_location("Edge_Zone_Navigation", ADDON_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class BENCH_PG_rna_drag_state(bpy.types.PropertyGroup):
+    """The drag-state properties exactly as the operator declared them before DragState."""
+    is_dragging: bpy.props.BoolProperty(default=False)
+    start_mouse_x: bpy.props.IntProperty(default=0)
+    start_mouse_y: bpy.props.IntProperty(default=0)
+    accumulated_dx: bpy.props.FloatProperty(default=0.0)
+    accumulated_dy: bpy.props.FloatProperty(default=0.0)
+    last_mouse_region_x: bpy.props.IntProperty(default=0)
+    last_mouse_region_y: bpy.props.IntProperty(default=0)
+    cursor_was_hidden: bpy.props.BoolProperty(default=False)
+    active_zone_type: bpy.props.EnumProperty(items=[('NONE', "None", ""), ('ROLL', "Roll", ""),
+                                                    ('PAN_V', "Vertical Pan", ""), ('PAN_H', "Horizontal Pan", "")])
+
+def roll_mousemove(state, x, y):
+    """State traffic of one MOUSEMOVE during a roll drag (warp back to the start point)."""
+    if state.is_dragging:
+        delta_y = y - state.last_mouse_region_y
+        if state.active_zone_type == 'ROLL':
+            state.accumulated_dy += delta_y
+            while abs(state.accumulated_dy) >= 2.5:
+                state.accumulated_dy -= 2.5 if state.accumulated_dy > 0 else -2.5
+            state.last_mouse_region_y = state.start_mouse_y
+        if state.active_zone_type != 'PAN_H': state.last_mouse_region_x = x
+
+def begin_drag(state):
+    state.is_dragging = True; state.active_zone_type = 'ROLL'
+    state.start_mouse_x = state.last_mouse_region_x = 1800
+    state.start_mouse_y = state.last_mouse_region_y = 500
+
+def measure(state):
+    begin_drag(state)
+    seconds = min(timeit.repeat(lambda: roll_mousemove(state, 1800, 503), number=EVENTS, repeat=5))
+    return seconds / EVENTS * 1e9
+
+def main():
+    addon = load_addon_module()
+    bpy.utils.register_class(BENCH_PG_rna_drag_state)
+    bpy.types.WindowManager.bench_drag_state = bpy.props.PointerProperty(type=BENCH_PG_rna_drag_state)
+    try:
+        rna_ns = measure(bpy.context.window_manager.bench_drag_state)
+        plain_ns = measure(addon.DragState())
+    finally:
+        del bpy.types.WindowManager.bench_drag_state
+        bpy.utils.unregister_class(BENCH_PG_rna_drag_state)
+    print(f"RNA properties : {rna_ns:8.1f} ns/event")
+    print(f"DragState      : {plain_ns:8.1f} ns/event ({rna_ns / plain_ns:.1f}x faster)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Hot-path cost of the listener under plain CPython, using the headless bpy/gpu stubs.
+
+Drives synthetic event streams through the modal listener and the draw callback and reports,
+per scenario: time per event, allocations (tracemalloc) and the bpy.ops / warp / redraw calls
+the addon made. Numbers are relative: the stubs are not Blender, but the addon code is the same.
+
+Run with any Python 3.7+:
+    python benchmarks/bench_hot_path.py [--events N] [--repeat N] [--scenario NAME ...]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "headless"))
+
+from harness import Harness # noqa: E402
+from bpy._runtime import context, stats # noqa: E402
+
+EVENTS_PER_FRAME = 4 # Mouse events Blender typically delivers between two viewport redraws
+
+def _stream_idle_hover(h, events):
+    """Cursor wanders over the view and across zone edges with no button held."""
+    region = h.window_region(); w, h_ = region.width, region.height
+    for i in range(events):
+        x = (i * 37) % w; y = (i * 53) % h_
+        yield ('MOUSEMOVE', x, y)
+
+def _stream_roll_drag(h, events):
+    """One long vertical drag in the right-edge roll zone."""
+    region = h.window_region(); x = region.width - 20; y = region.height // 2
+    yield ('PRESS', x, y)
+    for i in range(events):
+        y += 3 if (i // 100) % 2 == 0 else -3
+        yield ('MOUSEMOVE', x, y)
+    yield ('RELEASE', x, y)
+
+def _stream_diagonal_pan(h, events):
+    """Alternating drags in the left (vertical) and bottom (horizontal) pan zones, moving diagonally."""
+    region = h.window_region(); half = max(events // 2, 1)
+    for start in ((20, region.height // 2), (region.width // 2, 20)):
+        x, y = start
+        yield ('PRESS', x, y)
+        for i in range(half):
+            x += 2; y += 2
+            if i % 150 == 149: x, y = start
+            yield ('MOUSEMOVE', x, y)
+        yield ('RELEASE', x, y)
+
+def _stream_warp_storm(h, events):
+    """Fast roll drag with a large warp margin, so nearly every move re-centers the cursor."""
+    region = h.window_region(); x = region.width - 20; y = region.height // 2
+    yield ('PRESS', x, y)
+    for i in range(events):
+        y += 40 if i % 2 == 0 else -25
+        yield ('MOUSEMOVE', x, y)
+    yield ('RELEASE', x, y)
+
+def _stream_roll_and_pan(h, events):
+    """A roll drag in one direction, then a vertical and a horizontal pan drag; ends on a rotated, moved view.
+    Moves are relative to the cursor, so a warp is followed the way a real mouse would."""
+    region = h.window_region(); third = max(events // 3, 1); window = h.window
+    for x, y, dx, dy in ((region.width - 20, region.height // 2, 0, 3), (20, region.height // 2, 0, 2), (region.width // 2, 20, 2, 0)):
+        yield ('PRESS', x, y)
+        for _ in range(third):
+            if window.grab_owner is None: x, y = window.cursor_position
+            x += dx; y += dy
+            yield ('MOUSEMOVE', x, y)
+        yield ('RELEASE', x, y)
+
+SCENARIOS = {
+    "idle_hover": (_stream_idle_hover, {}),
+    "roll_drag": (_stream_roll_drag, {}),
+    "diagonal_pan": (_stream_diagonal_pan, {}),
+    "warp_storm": (_stream_warp_storm, {"warp_margin": 500}),
+    "roll_and_pan": (_stream_roll_and_pan, {}),
+}
+
+def _prepare(overrides):
+    with contextlib.redirect_stdout(io.StringIO()): # Keep the addon's "Started." lines out of the report
+        h = Harness()
+        prefs = context.preferences.addons[h.addon.__name__].preferences
+        for key, value in overrides.items(): setattr(prefs, key, value)
+        h.advance(1.0) # Auto-start the listener
+    return h
+
+def _quiet(function):
+    with contextlib.redirect_stdout(io.StringIO()): return function()
+
+def _replay(h, stream):
+    """Sends the stream, drawing a frame every EVENTS_PER_FRAME events like a busy viewport would."""
+    count = 0
+    for kind, x, y in stream:
+        if kind == 'MOUSEMOVE': h.move(x, y)
+        elif kind == 'PRESS': h.press(x, y)
+        else: h.release(x, y)
+        count += 1
+        if count % EVENTS_PER_FRAME == 0: h.draw()
+    return count
+
+def run_scenario(name, events, repeat):
+    make_stream, overrides = SCENARIOS[name]
+    best = None
+    for _ in range(repeat):
+        h = _prepare(overrides); stats.clear()
+        start = time.perf_counter(); count = _replay(h, make_stream(h, events)); elapsed = time.perf_counter() - start
+        calls = stats.snapshot(); _quiet(h.unregister)
+        if best is None or elapsed < best[0]: best = (elapsed, count, calls)
+    elapsed, count, calls = best
+    # Allocations are measured on a separate pass: tracemalloc slows everything down
+    h = _prepare(overrides)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    _replay(h, make_stream(h, events))
+    after = tracemalloc.take_snapshot(); peak = tracemalloc.get_traced_memory()[1]; tracemalloc.stop()
+    _quiet(h.unregister)
+    diffs = after.compare_to(before, "filename")
+    allocated = sum(d.size_diff for d in diffs if d.size_diff > 0)
+    blocks = sum(d.count_diff for d in diffs if d.count_diff > 0)
+    return {"name": name, "events": count, "us_per_event": elapsed / count * 1e6, "retained_bytes": allocated,
+            "retained_blocks": blocks, "peak_bytes": peak, "calls": calls}
+
+def format_result(result):
+    calls = result["calls"]
+    ops = {k[4:]: v for k, v in calls.items() if k.startswith("ops.")}
+    lines = [f"{result['name']:<14} {result['events']:>7} events  {result['us_per_event']:8.2f} us/event  "
+             f"retained {result['retained_bytes'] / 1024:8.1f} KiB in {result['retained_blocks']} blocks  "
+             f"peak {result['peak_bytes'] / 1024:8.1f} KiB"]
+    lines.append(f"{'':<14} bpy.ops calls: {sum(ops.values())} " + (str(ops) if ops else ""))
+    other = {k: calls[k] for k in ("window.cursor_warp", "area.tag_redraw", "region.tag_redraw", "rv3d.view_rotation_set",
+                                   "rv3d.view_location_set", "gpu.batch_create", "gpu.batch_draw", "modal.calls") if k in calls}
+    lines.append(f"{'':<14} {other}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000, help="Mouse events per scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario; the fastest is reported")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Run only these scenarios")
+    args = parser.parse_args(argv)
+    for name in args.scenario or SCENARIOS:
+        print(format_result(run_scenario(name, args.events, args.repeat)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""One benchmark job inside a real Blender process; started by run_blender_matrix.py.
+
+Times, for one configuration (mesh size and preference set):
+- register()/unregister() of Edge_Zone_Navigation.py
+- keyconfig_import_from_data() for Blender_keybindigs_like_exocad.py
+- entering/leaving Fast Navigate on a generated heavy mesh (scene re-evaluation included)
+- scripted roll and pan drags through the addon's drag code against the startup file's 3D View
+
+Background Blender has no windows and does not draw, so drags measure the addon's per-event
+cost on real RNA and mathutils, not frame time. Run directly:
+    blender --background --factory-startup --python benchmarks/blender_bench_job.py -- --config '{"mesh_segments": 64}' --output job.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+import traceback
+from types import SimpleNamespace
+
+import bpy
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+ADDON_PATH = os.path.join(ROOT, "Edge_Zone_Navigation.py")
+KEYCONFIG_PATH = os.path.join(ROOT, "Blender_keybindigs_like_exocad.py")
+EVENTS_PER_FRAME = 4 # Mouse events between two viewport redraws, as in bench_hot_path.py
+
+def load_module(path, name):
+    """Imports a file under 'name' (not __main__, so the keyconfig file does not import itself)."""
+    sys.modules.pop(name, None)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def summarize(samples):
+    """Seconds -> microseconds summary; the matrix runner compares medians."""
+    us = [s * 1e6 for s in samples]
+    return {"min_us": min(us), "median_us": statistics.median(us), "mean_us": statistics.fmean(us), "samples": len(us)}
+
+# --- Register / Keyconfig ---
+def bench_register(addon, repeat):
+    register = []; unregister = []
+    for _ in range(repeat):
+        start = time.perf_counter(); addon.register(); register.append(time.perf_counter() - start)
+        start = time.perf_counter(); addon.unregister(); unregister.append(time.perf_counter() - start)
+    return {"register": summarize(register), "unregister": summarize(unregister)}
+
+def bench_keyconfig_import(repeat):
+    from bl_keymap_utils.io import keyconfig_import_from_data
+    keyconfigs = bpy.context.window_manager.keyconfigs
+    data = load_module(KEYCONFIG_PATH, "Blender_keybindigs_like_exocad")
+    name = "Blender_keybindigs_like_exocad"; keywords = {}
+    if bpy.app.version >= (2, 92, 0): keywords["keyconfig_version"] = data.keyconfig_version
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter(); keyconfig = keyconfig_import_from_data(name, data.keyconfig_data, **keywords)
+        samples.append(time.perf_counter() - start)
+        keyconfigs.remove(keyconfig)
+    return summarize(samples)
+
+# --- Scene ---
+def build_heavy_mesh(segments, subdivision_levels):
+    """UV sphere with 'segments' rings/segments and a Subdivision modifier, linked to the scene."""
+    import bmesh
+    mesh = bpy.data.meshes.new("BenchMesh")
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=max(segments // 2, 3), radius=1.0)
+    bm.to_mesh(mesh); bm.free()
+    obj = bpy.data.objects.new("BenchMesh", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    modifier = obj.modifiers.new("Subdivision", 'SUBSURF'); modifier.levels = subdivision_levels
+    bpy.context.view_layer.update()
+    return obj, len(mesh.polygons)
+
+def find_view3d():
+    """The startup file's 3D View: area, its WINDOW region and space. Screens exist even in background mode."""
+    for screen in bpy.data.screens:
+        for area in screen.areas:
+            if area.type != 'VIEW_3D': continue
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if region is not None: return area, region, area.spaces.active
+    raise RuntimeError("No 3D View in the startup file")
+
+def make_prefs(addon, overrides):
+    prefs = addon.PrefsSnapshot.from_defaults()
+    for key, value in overrides.items(): setattr(prefs, key, value)
+    prefs.hide_cursor_on_drag = False # No window to set a cursor on
+    return prefs
+
+def bench_lod(addon, context, prefs, repeat):
+    """Fast Navigate enter/leave including the depsgraph update it causes on the heavy mesh."""
+    view_layer = bpy.context.view_layer; enter = []; leave = []
+    for _ in range(repeat):
+        start = time.perf_counter(); addon.navigation_lod.apply(context, prefs); view_layer.update(); enter.append(time.perf_counter() - start)
+        start = time.perf_counter(); addon.navigation_lod.restore(); view_layer.update(); leave.append(time.perf_counter() - start)
+    return {"enter": summarize(enter), "leave": summarize(leave)}
+
+# --- Drags ---
+VIEW_ERROR_KEYS = ("view_roll", "view_pan")
+
+def view_errors(addon): return sum(addon.event_log.counts.get(key, 0) for key in VIEW_ERROR_KEYS)
+
+def run_drag(addon, context, prefs, zone_type, moves):
+    """One scripted drag through begin_drag/drag_move/end_drag; returns (seconds, view updates, view errors)."""
+    drag = addon.EdgeZoneDragMixin(); drag._init_drag_runtime()
+    region = context.region
+    x = region.x + (region.width - 20 if zone_type == 'ROLL' else 20 if zone_type == 'PAN_V' else region.width // 2)
+    y = region.y + (20 if zone_type == 'PAN_H' else region.height // 2)
+    event = SimpleNamespace(mouse_x=x, mouse_y=y)
+    errors_before = view_errors(addon)
+    start = time.perf_counter()
+    drag.begin_drag(context, event, zone_type, prefs)
+    for i in range(moves):
+        step = 3 if (i // 100) % 2 == 0 else -3
+        if zone_type == 'PAN_H': event.mouse_x += step
+        else: event.mouse_y += step
+        drag.drag_move(context, event, prefs)
+        if i % EVENTS_PER_FRAME == EVENTS_PER_FRAME - 1: drag.state.frame_pending = False # A frame was drawn
+    drag.commit_motion(context, prefs) # Held motion, with this job's prefs rather than end_drag's snapshot
+    view_ops = drag.state.view_ops
+    drag.end_drag(context)
+    elapsed = time.perf_counter() - start
+    return elapsed, view_ops, view_errors(addon) - errors_before
+
+def bench_drags(addon, context, prefs, moves, repeat):
+    results = {}
+    for zone_type in ('ROLL', 'PAN_V', 'PAN_H'):
+        samples = []; errors = 0; view_ops = 0
+        for _ in range(repeat):
+            elapsed, view_ops, failed = run_drag(addon, context, prefs, zone_type, moves)
+            samples.append(elapsed / moves); errors += failed
+        results[zone_type.lower()] = dict(summarize(samples), view_ops=view_ops, errors=errors) # Time is per event
+    return results
+
+@contextlib.contextmanager
+def view_override(area, region):
+    """temp_override (Blender 3.2+) into the 3D View; without it the stepped engines report view errors."""
+    try: override = bpy.context.temp_override(area=area, region=region); override.__enter__()
+    except (AttributeError, TypeError, RuntimeError): override = None
+    try: yield
+    finally:
+        if override is not None: override.__exit__(None, None, None)
+
+def run(config):
+    repeat = config.get("repeat", 5)
+    addon = load_module(ADDON_PATH, "Edge_Zone_Navigation")
+    result = {"blender": bpy.app.version_string, "config": config}
+    result["register"] = bench_register(addon, repeat)
+    try: result["keyconfig_import"] = bench_keyconfig_import(repeat)
+    except Exception as e: result["keyconfig_import"] = {"error": str(e)}
+
+    addon.register()
+    try:
+        obj, faces = build_heavy_mesh(config.get("mesh_segments", 64), config.get("subdivision_levels", 2))
+        result["mesh_faces"] = faces
+        area, region, space = find_view3d()
+        context = SimpleNamespace(window=None, area=area, region=region, space_data=space, region_data=space.region_3d,
+                                  scene=bpy.context.scene, window_manager=bpy.context.window_manager, preferences=bpy.context.preferences)
+        prefs = make_prefs(addon, config.get("prefs", {}))
+        result["lod"] = bench_lod(addon, context, prefs, repeat)
+        with view_override(area, region): # Lets the stepped engines' view operators run
+            result["drag"] = bench_drags(addon, context, prefs, config.get("moves", 2000), repeat)
+    finally:
+        addon.unregister()
+    return result
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="blender_bench_job.py")
+    parser.add_argument("--config", default="{}", help="Job configuration as JSON")
+    parser.add_argument("--output", help="Write the result JSON here instead of stdout")
+    args = parser.parse_args(argv)
+    try: result = run(json.loads(args.config))
+    except Exception: result = {"blender": bpy.app.version_string, "config": json.loads(args.config), "error": traceback.format_exc()}
+    text = json.dumps(result, indent=1)
+    if args.output:
+        with open(args.output, "w") as f: f.write(text)
+    else: print(text)
+
+main()
@@ -0,0 +1,8 @@
+"""blf stand-in: records text draws so HUD code runs headless."""
+from bpy._runtime import stats
+
+def size(fontid, size, *dpi): stats.bump("blf.size")
+def color(fontid, r, g, b, a): pass
+def position(fontid, x, y, z): pass
+def draw(fontid, text): stats.bump("blf.draw")
+def dimensions(fontid, text): return (len(text) * 7.0, 12.0)
@@ -0,0 +1,5 @@
+"""Headless stand-in for the parts of bpy used by the Edge Zone Navigation addon."""
+from . import props, types, utils, app, ops, msgbus, data, path
+from ._runtime import context, stats
+
+__all__ = ("data", "path", "props", "types", "utils", "app", "ops", "msgbus", "context", "stats")
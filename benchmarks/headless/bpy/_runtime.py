@@ -0,0 +1,222 @@
+"""Fake window-manager runtime: windows, areas, regions, events and a modal handler stack."""
+from contextlib import contextmanager
+from mathutils import Matrix, Quaternion, Vector
+
+class Stats(dict):
+    """Counts expensive calls (operators, warps, redraws, batches) made by the code under test."""
+    def bump(self, key, amount=1): self[key] = self.get(key, 0) + amount
+    def snapshot(self): return dict(self)
+
+stats = Stats()
+current_event = None # Event being dispatched, used for INVOKE_* operator calls
+
+class _Pointer:
+    _next_ptr = 0x1000
+    def __init__(self):
+        _Pointer._next_ptr += 0x100
+        self._ptr = _Pointer._next_ptr
+    def as_pointer(self): return self._ptr
+
+class RegionView3D(_Pointer):
+    """Keeps view rotation/location/distance and derives the matrices the way Blender does."""
+    def __init__(self, perspective='PERSP', lens_factor=1.0):
+        super().__init__()
+        self._rotation = Quaternion(); self._location = Vector((0.0, 0.0, 0.0))
+        self.view_distance = 10.0; self.view_perspective = perspective
+        self.lock_rotation = False; self.show_sync_view = False; self.is_perspective = perspective != 'ORTHO'
+        self.lens_factor = lens_factor; self.aspect = 1.0
+    @property
+    def view_rotation(self): return self._rotation.copy()
+    @view_rotation.setter
+    def view_rotation(self, value): self._rotation = Quaternion(tuple(value)); stats.bump("rv3d.view_rotation_set")
+    @property
+    def view_location(self): return self._location.copy()
+    @view_location.setter
+    def view_location(self, value): self._location = Vector(tuple(value)); stats.bump("rv3d.view_location_set")
+    @property
+    def view_matrix(self):
+        rot_inv = self._rotation.inverted().to_matrix().to_4x4()
+        trans = Matrix.Identity(4)
+        for i in range(3): trans._rows[i][3] = -self._location[i]
+        view = rot_inv @ trans
+        view._rows[2][3] -= self.view_distance
+        return view
+    @property
+    def window_matrix(self):
+        if self.view_perspective == 'ORTHO':
+            s = 1.0 / (self.view_distance * self.lens_factor)
+            return Matrix(((s, 0, 0, 0), (0, s * self.aspect, 0, 0), (0, 0, -0.001, 0), (0, 0, 0, 1)))
+        f = 1.0 / self.lens_factor
+        return Matrix(((f, 0, 0, 0), (0, f * self.aspect, 0, 0), (0, 0, -1.0002, -0.2), (0, 0, -1, 0)))
+    @property
+    def perspective_matrix(self): return self.window_matrix @ self.view_matrix
+
+class Overlay:
+    def __init__(self):
+        self.show_overlays = True; self.show_wireframes = False; self.show_floor = True
+        self.show_outline_selected = True; self.show_extras = True
+
+class Shading:
+    def __init__(self):
+        self.type = 'SOLID'; self.show_xray = False; self.show_shadows = False
+        self.show_cavity = False; self.use_dof = False
+
+class SpaceView3D(_Pointer):
+    type = 'VIEW_3D'
+    def __init__(self, region_3d):
+        super().__init__()
+        self.region_3d = region_3d; self.lock_cursor = False; self.lock_object = None
+        self.overlay = Overlay(); self.shading = Shading(); self.region_quadviews = []
+
+class Region(_Pointer):
+    def __init__(self, area, type='WINDOW', x=0, y=0, width=1920, height=1080, data=None):
+        super().__init__()
+        self.area = area; self.type = type; self.x = x; self.y = y
+        self.width = width; self.height = height; self.data = data
+    def tag_redraw(self): stats.bump("region.tag_redraw")
+
+class _Spaces(list):
+    @property
+    def active(self): return self[0] if self else None
+
+class Area(_Pointer):
+    def __init__(self, type='VIEW_3D', x=0, y=0, width=1920, height=1080, quad=False, perspective='PERSP', sidebar=False):
+        super().__init__()
+        self.type = type; self.x = x; self.y = y; self.width = width; self.height = height
+        self.regions = []; self.spaces = _Spaces(); self.redraws = 0
+        if type == 'VIEW_3D':
+            rv3d = RegionView3D(perspective)
+            space = SpaceView3D(rv3d); self.spaces.append(space)
+            self.regions.append(Region(self, 'HEADER', x, y + height - 26, width, 26))
+            if quad:
+                hw = width // 2; hh = height // 2
+                for qx, qy in ((0, 0), (hw, 0), (0, hh), (hw, hh)):
+                    data = rv3d if (qx, qy) == (hw, hh) else RegionView3D('ORTHO')
+                    if data is not rv3d: space.region_quadviews.append(data)
+                    self.regions.append(Region(self, 'WINDOW', x + qx, y + qy, width - hw if qx else hw, height - hh if qy else hh, data))
+                space.region_quadviews.append(rv3d)
+            else:
+                self.regions.append(Region(self, 'WINDOW', x, y, width, height, rv3d))
+            ui_width = 200 if sidebar else 0 # A hidden sidebar keeps its region, with no size
+            self.regions.append(Region(self, 'UI', x + width - ui_width, y, ui_width, height))
+    def tag_redraw(self): self.redraws += 1; stats.bump("area.tag_redraw")
+
+class Screen(_Pointer):
+    def __init__(self, areas=(), name="Layout"):
+        super().__init__()
+        self.areas = list(areas); self.name = name
+
+class WorkSpace(_Pointer):
+    def __init__(self, name="Layout"):
+        super().__init__(); self.name = name
+
+class Window(_Pointer):
+    def __init__(self, screen, x=0, y=0, width=1920, height=1080):
+        super().__init__()
+        self.screen = screen; self.workspace = WorkSpace(); self.x = x; self.y = y
+        self.width = width; self.height = height; self.cursor = None
+        self.cursor_position = (0, 0); self.pending_events = []; self.grab_owner = None
+    def cursor_warp(self, x, y):
+        """Blender moves the OS cursor; the move comes back as a MOUSEMOVE at (x, y)."""
+        stats.bump("window.cursor_warp")
+        self.cursor_position = (x, y)
+        self.pending_events.append(Event('MOUSEMOVE', 'NOTHING', x, y, synthetic=True))
+    def cursor_modal_set(self, cursor): self.cursor = cursor; stats.bump("window.cursor_modal_set")
+    def cursor_modal_restore(self): self.cursor = None; stats.bump("window.cursor_modal_restore")
+
+class Event:
+    """A window-space event. Region coordinates are filled in by the dispatcher."""
+    __slots__ = ("type", "value", "mouse_x", "mouse_y", "mouse_region_x", "mouse_region_y",
+                 "mouse_prev_x", "mouse_prev_y", "shift", "ctrl", "alt", "oskey", "is_repeat", "synthetic")
+    def __init__(self, type, value='NOTHING', mouse_x=0, mouse_y=0, synthetic=False):
+        self.type = type; self.value = value; self.mouse_x = mouse_x; self.mouse_y = mouse_y
+        self.mouse_region_x = mouse_x; self.mouse_region_y = mouse_y
+        self.mouse_prev_x = mouse_x; self.mouse_prev_y = mouse_y
+        self.shift = self.ctrl = self.alt = self.oskey = self.is_repeat = False; self.synthetic = synthetic
+
+class Timer:
+    def __init__(self, time_step, window):
+        self.time_step = time_step; self.window = window; self.time_duration = 0.0
+
+class KeyMapItem:
+    def __init__(self, idname, type, value, **modifiers):
+        self.idname = idname; self.type = type; self.value = value; self.active = True
+        self.shift = modifiers.get("shift", False); self.ctrl = modifiers.get("ctrl", False)
+        self.alt = modifiers.get("alt", False); self.oskey = modifiers.get("oskey", False)
+        self.head = modifiers.get("head", False)
+
+class _KeyMapItems(list):
+    def new(self, idname, type, value, **kw):
+        kmi = KeyMapItem(idname, type, value, **kw)
+        if kw.get("head"): self.insert(0, kmi)
+        else: self.append(kmi)
+        return kmi
+    def remove(self, item): list.remove(self, item)
+
+class KeyMap:
+    def __init__(self, name, space_type='EMPTY', region_type='WINDOW'):
+        self.name = name; self.space_type = space_type; self.region_type = region_type
+        self.keymap_items = _KeyMapItems()
+
+class _KeyMaps(dict):
+    def new(self, name, space_type='EMPTY', region_type='WINDOW', **kw):
+        km = self.get(name)
+        if km is None: km = self[name] = KeyMap(name, space_type, region_type)
+        return km
+    def find(self, name, **kw): return self.get(name)
+
+class KeyConfig:
+    def __init__(self, name): self.name = name; self.keymaps = _KeyMaps()
+
+class KeyConfigs:
+    def __init__(self):
+        self.addon = KeyConfig("Blender addon"); self.user = KeyConfig("Blender user")
+        self.default = KeyConfig("Blender"); self.active = self.default
+
+class WindowManager:
+    def __init__(self):
+        self.windows = []; self.timers = []; self.handlers = [] # (window, op, area, region)
+        self.keyconfigs = KeyConfigs()
+    def event_timer_add(self, time_step, window=None):
+        timer = Timer(time_step, window); self.timers.append(timer); stats.bump("wm.event_timer_add"); return timer
+    def event_timer_remove(self, timer):
+        if timer not in self.timers: raise ValueError("timer not found")
+        self.timers.remove(timer)
+    def modal_handler_add(self, op):
+        ctx = context
+        self.handlers.insert(0, (ctx.window, op, ctx.area, ctx.region)); return True
+
+class _Addon:
+    def __init__(self, module, preferences): self.module = module; self.preferences = preferences
+
+class Preferences:
+    def __init__(self):
+        self.addons = {}
+        self.inputs = type("Inputs", (), {"use_mouse_continuous": True})()
+
+class Scene:
+    def __init__(self):
+        self.render = type("Render", (), {"use_simplify": False, "simplify_subdivision": 6})()
+
+class Context:
+    """Mutable bpy.context; temp_override swaps members the way Blender does."""
+    def __init__(self):
+        self.window_manager = WindowManager(); self.preferences = Preferences(); self.scene = Scene()
+        self.window = None; self.area = None; self.region = None
+    @property
+    def screen(self): return self.window.screen if self.window else None
+    @property
+    def space_data(self): return self.area.spaces.active if self.area else None
+    @property
+    def region_data(self): return self.region.data if self.region else None
+    @contextmanager
+    def temp_override(self, **members):
+        saved = {k: getattr(self, k) for k in ("window", "area", "region")}
+        for key in ("window", "area", "region"):
+            if key in members: setattr(self, key, members[key])
+        try: yield self
+        finally:
+            for key, value in saved.items(): setattr(self, key, value)
+    def copy(self): return {"window": self.window, "area": self.area, "region": self.region}
+
+context = Context()
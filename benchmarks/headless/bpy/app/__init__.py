@@ -0,0 +1,8 @@
+"""bpy.app: version info, handlers and a virtual-clock timer queue."""
+import tempfile
+from . import handlers, timers
+
+version = (3, 6, 0)
+version_string = "3.6.0 (headless stub)"
+background = True
+tempdir = tempfile.gettempdir()
@@ -0,0 +1,7 @@
+"""bpy.app.handlers: plain lists plus the persistent decorator."""
+load_pre = []; load_post = []; save_pre = []; save_post = []
+depsgraph_update_post = []
+
+def persistent(func):
+    func._bpy_persistent = True
+    return func
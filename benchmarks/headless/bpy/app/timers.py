@@ -0,0 +1,29 @@
+"""bpy.app.timers on a virtual clock; bpy.app.timers.advance() runs whatever is due."""
+_clock = [0.0]
+_queue = {} # function -> due time
+
+def register(function, first_interval=0.0, persistent=False):
+    _queue[function] = _clock[0] + first_interval
+
+def unregister(function):
+    if function not in _queue: raise ValueError("Error: function is not registered")
+    del _queue[function]
+
+def is_registered(function): return function in _queue
+
+def now(): return _clock[0]
+
+def advance(seconds):
+    """Moves the virtual clock forward, running due timers in order. Returns how many ran."""
+    end = _clock[0] + seconds; ran = 0
+    while True:
+        due = [(t, f) for f, t in _queue.items() if t <= end]
+        if not due: break
+        t, function = min(due, key=lambda item: item[0])
+        _clock[0] = max(_clock[0], t); del _queue[function]; ran += 1
+        interval = function()
+        if interval is not None: _queue[function] = _clock[0] + interval
+    _clock[0] = end
+    return ran
+
+def clear(): _queue.clear(); _clock[0] = 0.0
@@ -0,0 +1,14 @@
+"""bpy.data: only the text datablocks the log dump writes to."""
+
+class Text:
+    def __init__(self, name): self.name = name; self.body = ""
+    def clear(self): self.body = ""
+    def write(self, text): self.body += text
+    def as_string(self): return self.body
+
+class _Texts(dict):
+    def new(self, name):
+        text = self[name] = Text(name)
+        return text
+
+texts = _Texts()
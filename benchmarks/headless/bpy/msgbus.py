@@ -0,0 +1,14 @@
+"""bpy.msgbus: subscriptions are recorded; publish_rna() notifies them like an RNA change would."""
+_subscriptions = [] # (key, owner, args, notify)
+
+def subscribe_rna(key, owner, args, notify, options=set()):
+    _subscriptions.append((key, owner, tuple(args), notify))
+
+def clear_by_owner(owner):
+    _subscriptions[:] = [s for s in _subscriptions if s[1] is not owner]
+
+def publish_rna(key):
+    for sub_key, _owner, args, notify in list(_subscriptions):
+        if sub_key == key: notify(*args)
+
+def subscriptions(): return list(_subscriptions)
@@ -0,0 +1,73 @@
+"""bpy.ops dispatcher: counts every call and emulates the built-in view operators the addon uses."""
+from mathutils import Quaternion
+from . import _runtime
+from ._runtime import stats, context
+
+_operators = {} # "category.name" -> registered Operator subclass
+VIEW_PAN_STEPS = {'PANRIGHT': (-32, 0), 'PANLEFT': (32, 0), 'PANUP': (0, -25), 'PANDOWN': (0, 25)}
+
+def _register_operator(cls): _operators[cls.bl_idname] = cls
+def _unregister_operator(cls): _operators.pop(cls.bl_idname, None)
+
+def _win_to_delta(region, rv3d, dx, dy):
+    persmat = rv3d.perspective_matrix
+    loc = rv3d.view_location
+    row = persmat[3]
+    zfac = abs(row[0] * loc[0] + row[1] * loc[1] + row[2] * loc[2] + row[3]) or 1.0
+    inv = persmat.inverted_safe()
+    fx = 2.0 * dx * zfac / region.width; fy = 2.0 * dy * zfac / region.height
+    return inv.col[0].xyz * fx + inv.col[1].xyz * fy
+
+def _view_roll(angle=0.0, type='ANGLE'):
+    rv3d = context.region_data
+    if rv3d is None: raise RuntimeError("view3d.view_roll: context is incorrect")
+    rotation = rv3d.view_rotation @ Quaternion((0.0, 0.0, 1.0), angle); rotation.normalize()
+    rv3d.view_rotation = rotation
+    return {'FINISHED'}
+
+def _view_pan(type='PANLEFT'):
+    rv3d = context.region_data; region = context.region
+    if rv3d is None or region is None: raise RuntimeError("view3d.view_pan: context is incorrect")
+    x, y = VIEW_PAN_STEPS[type]
+    rv3d.view_location = rv3d.view_location - _win_to_delta(region, rv3d, x, y)
+    return {'FINISHED'}
+
+_builtins = {"view3d.view_roll": _view_roll, "view3d.view_pan": _view_pan}
+
+def call(idname, *args, **kwargs):
+    stats.bump(f"ops.{idname}")
+    execution_context = args[0] if args and isinstance(args[0], str) else 'EXEC_DEFAULT'
+    builtin = _builtins.get(idname)
+    if builtin is not None: return builtin(**kwargs)
+    cls = _operators.get(idname)
+    if cls is None: raise AttributeError(f"Calling operator \"bpy.ops.{idname}\" error, could not be found")
+    op = cls()
+    for key, value in kwargs.items(): setattr(op, key, value)
+    if execution_context.startswith('INVOKE') and hasattr(op, "invoke"):
+        event = _runtime.current_event or _runtime.Event('NONE')
+        result = op.invoke(context, event)
+    elif hasattr(op, "execute"):
+        result = op.execute(context)
+    else:
+        raise RuntimeError(f"Operator bpy.ops.{idname}.poll() failed, context is incorrect")
+    if 'RUNNING_MODAL' in result and 'GRAB_CURSOR' in getattr(cls, "bl_options", ()) and context.window:
+        context.window.grab_owner = op
+    return result
+
+class _Caller:
+    __slots__ = ("idname",)
+    def __init__(self, idname): self.idname = idname
+    def __call__(self, *args, **kwargs): return call(self.idname, *args, **kwargs)
+    def poll(self):
+        cls = _operators.get(self.idname)
+        poll = getattr(cls, "poll", None)
+        return True if poll is None else bool(poll(context))
+
+class _Category:
+    __slots__ = ("name",)
+    def __init__(self, name): self.name = name
+    def __getattr__(self, name): return _Caller(f"{self.name}.{name}")
+
+def __getattr__(name):
+    if name.startswith("__"): raise AttributeError(name)
+    return _Category(name)
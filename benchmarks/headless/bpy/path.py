@@ -0,0 +1,5 @@
+"""bpy.path: paths are used as given; there is no .blend file to make '//' relative to."""
+import os
+
+def abspath(path, start=None, library=None):
+    return os.path.abspath(path[2:] if path.startswith("//") else path)
@@ -0,0 +1,32 @@
+"""bpy.props: returns deferred definitions that bpy.utils.register_class turns into descriptors."""
+
+class _PropertyDeferred:
+    __slots__ = ("function", "keywords")
+    def __init__(self, function, keywords): self.function = function; self.keywords = keywords
+    @property
+    def default(self):
+        kw = self.keywords
+        if "default" in kw:
+            value = kw["default"]
+            if self.function == "EnumProperty" and isinstance(value, set): return set(value)
+            return tuple(value) if isinstance(value, list) else value
+        if self.function == "EnumProperty":
+            items = kw.get("items", ())
+            return items[0][0] if items and not callable(items) else ''
+        return {"BoolProperty": False, "IntProperty": 0, "FloatProperty": 0.0, "StringProperty": "",
+                "FloatVectorProperty": (0.0,) * kw.get("size", 3)}.get(self.function)
+    def __repr__(self): return f"<_PropertyDeferred {self.function} {self.keywords}>"
+
+def _make(name):
+    def prop(**keywords): return _PropertyDeferred(name, keywords)
+    prop.__name__ = name
+    return prop
+
+BoolProperty = _make("BoolProperty")
+IntProperty = _make("IntProperty")
+FloatProperty = _make("FloatProperty")
+FloatVectorProperty = _make("FloatVectorProperty")
+EnumProperty = _make("EnumProperty")
+StringProperty = _make("StringProperty")
+PointerProperty = _make("PointerProperty")
+CollectionProperty = _make("CollectionProperty")
@@ -0,0 +1,59 @@
+"""bpy.types: base classes plus the few RNA structs the addon references by name."""
+from ._runtime import stats, Window, Area # Window and Area are the msgbus keys of the addon's layout subscriptions
+
+class bpy_struct:
+    pass
+
+class Operator(bpy_struct):
+    bl_idname = ""; bl_label = ""; bl_options = {'REGISTER'}
+    def __init__(self):
+        self.reports = []
+        self.properties = self
+    def report(self, type, message): self.reports.append((set(type), message))
+
+class AddonPreferences(bpy_struct):
+    bl_idname = ""
+    layout = None
+
+class Panel(bpy_struct):
+    bl_label = ""; layout = None
+
+class Menu(bpy_struct):
+    layout = None
+    _draw_funcs = None
+    @classmethod
+    def append(cls, func):
+        if cls._draw_funcs is None: cls._draw_funcs = []
+        cls._draw_funcs.append(func)
+    @classmethod
+    def prepend(cls, func): cls.append(func)
+    @classmethod
+    def remove(cls, func):
+        if cls._draw_funcs and func in cls._draw_funcs: cls._draw_funcs.remove(func)
+
+class VIEW3D_MT_view(Menu):
+    _draw_funcs = None
+
+class SpaceView3D(bpy_struct):
+    """Draw handlers run for every WINDOW region of every 3D View when the harness draws."""
+    _draw_handlers = []
+    @classmethod
+    def draw_handler_add(cls, callback, args, region_type, draw_type):
+        handle = (callback, tuple(args), region_type, draw_type)
+        cls._draw_handlers.append(handle); stats.bump("draw_handler_add"); return handle
+    @classmethod
+    def draw_handler_remove(cls, handle, region_type):
+        if handle not in cls._draw_handlers: raise ValueError("handler not found")
+        cls._draw_handlers.remove(handle)
+
+class Object(bpy_struct):
+    pass
+
+class Scene(bpy_struct):
+    pass
+
+class WorkSpace(bpy_struct):
+    pass
+
+class LayerObjects(bpy_struct):
+    pass
@@ -0,0 +1,42 @@
+"""bpy.utils.register_class/unregister_class with property descriptors and update callbacks."""
+from . import types as _types
+from .props import _PropertyDeferred
+from ._runtime import context, _Addon
+
+_registered = {}
+
+class _RNAProperty:
+    """Data descriptor standing in for an RNA property; calls update(self, context) on assignment."""
+    def __init__(self, name, deferred): self.name = name; self.deferred = deferred
+    def __get__(self, instance, owner):
+        if instance is None: return self
+        return instance.__dict__.get(self.name, self.deferred.default)
+    def __set__(self, instance, value):
+        if isinstance(value, list): value = tuple(value)
+        instance.__dict__[self.name] = value
+        update = self.deferred.keywords.get("update")
+        if update is not None: update(instance, context)
+
+def register_class(cls):
+    key = getattr(cls, "bl_idname", None) or cls.__name__
+    if cls.__name__ in _registered: raise ValueError(f"register_class(...): already registered as a subclass '{cls.__name__}'")
+    for base in reversed(cls.__mro__):
+        for name, annotation in getattr(base, "__annotations__", {}).items():
+            if isinstance(annotation, _PropertyDeferred): setattr(cls, name, _RNAProperty(name, annotation))
+    _registered[cls.__name__] = cls
+    if issubclass(cls, _types.AddonPreferences):
+        context.preferences.addons[cls.bl_idname] = _Addon(cls.bl_idname, cls())
+    if issubclass(cls, _types.Operator):
+        from . import ops
+        ops._register_operator(cls)
+
+def unregister_class(cls):
+    if _registered.get(cls.__name__) is not cls: raise RuntimeError(f"unregister_class(...): missing bl_rna attribute from '{cls.__name__}'")
+    del _registered[cls.__name__]
+    if issubclass(cls, _types.AddonPreferences):
+        context.preferences.addons.pop(cls.bl_idname, None)
+    if issubclass(cls, _types.Operator):
+        from . import ops
+        ops._unregister_operator(cls)
+
+def is_registered(cls): return _registered.get(cls.__name__) is cls
@@ -0,0 +1,2 @@
+"""Headless stand-in for gpu: shaders, state and buffer types that only count what they are asked to do."""
+from . import shader, state, types
@@ -0,0 +1,21 @@
+from bpy._runtime import stats
+
+_BUILTINS = {
+    '2D_UNIFORM_COLOR': {"pos": 2}, 'UNIFORM_COLOR': {"pos": 3},
+    '2D_FLAT_COLOR': {"pos": 2, "color": 4}, '2D_SMOOTH_COLOR': {"pos": 2, "color": 4},
+    'FLAT_COLOR': {"pos": 3, "color": 4}, 'SMOOTH_COLOR': {"pos": 3, "color": 4},
+}
+
+class GPUShader:
+    def __init__(self, name): self.name = name; self.attrs = _BUILTINS[name]; self.uniforms = {}
+    def bind(self): stats.bump("gpu.shader_bind")
+    def uniform_float(self, name, value): self.uniforms[name] = tuple(value) if hasattr(value, "__iter__") else value; stats.bump("gpu.uniform")
+    def format_calc(self):
+        from .types import GPUVertFormat
+        fmt = GPUVertFormat()
+        for name, length in self.attrs.items(): fmt.attr_add(id=name, comp_type='F32', len=length, fetch_mode='FLOAT')
+        return fmt
+
+def from_builtin(name, config='DEFAULT'):
+    if name not in _BUILTINS: raise ValueError(f"from_builtin: unknown shader {name!r}")
+    return GPUShader(name)
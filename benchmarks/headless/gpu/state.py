@@ -0,0 +1,3 @@
+_state = {"blend": 'NONE'}
+def blend_set(mode): _state["blend"] = mode
+def blend_get(): return _state["blend"]
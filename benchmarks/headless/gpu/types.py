@@ -0,0 +1,33 @@
+from bpy._runtime import stats
+
+class GPUVertFormat:
+    def __init__(self): self.attrs = {}
+    def attr_add(self, id, comp_type, len, fetch_mode): self.attrs[id] = len
+
+class GPUVertBuf:
+    def __init__(self, format, len):
+        self.format = format; self.len = len; self.data = {}; stats.bump("gpu.vertbuf_create")
+    def attr_fill(self, id, data):
+        if id not in self.format.attrs: raise ValueError(f"attr_fill: unknown attribute {id!r}")
+        data = [tuple(d) if hasattr(d, "__iter__") else (d,) for d in data]
+        if len(data) != self.len or any(len(d) > self.format.attrs[id] for d in data):
+            raise ValueError(f"attr_fill: data does not match attribute {id!r}")
+        self.data[id] = data
+
+class GPUIndexBuf:
+    def __init__(self, type, seq): self.type = type; self.seq = [tuple(s) for s in seq]
+
+class GPUBatch:
+    def __init__(self, type, buf, elem=None):
+        self.type = type; self.buffers = [buf]; self.elem = elem; self.draws = 0; stats.bump("gpu.batch_create")
+    def vertbuf_add(self, buf):
+        if self.draws: raise RuntimeError("vertbuf_add: batch already drawn")
+        self.buffers.append(buf)
+    def draw(self, shader=None):
+        names = set()
+        for buf in self.buffers: names.update(buf.data)
+        if shader is not None:
+            missing = set(shader.attrs) - names
+            if missing: raise RuntimeError(f"GPUBatch.draw: missing attributes {missing}")
+        self.draws += 1; stats.bump("gpu.batch_draw")
+    def program_set(self, shader): pass
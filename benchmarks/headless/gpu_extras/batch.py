@@ -0,0 +1,11 @@
+from gpu.types import GPUBatch, GPUIndexBuf, GPUVertBuf
+from bpy._runtime import stats
+
+def batch_for_shader(shader, type, content, *, indices=None):
+    fmt = shader.format_calc()
+    lengths = {len(v) for v in content.values()}
+    if len(lengths) != 1: raise ValueError("batch_for_shader: attribute lengths differ")
+    vbo = GPUVertBuf(fmt, lengths.pop())
+    for name, data in content.items(): vbo.attr_fill(name, data)
+    stats.bump("gpu_extras.batch_for_shader")
+    return GPUBatch(type, vbo, GPUIndexBuf(type='TRIS', seq=indices) if indices is not None else None)
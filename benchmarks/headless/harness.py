@@ -0,0 +1,195 @@
+"""Drives the addon under the headless stubs: builds windows/areas, dispatches events, runs draw handlers.
+
+The stub packages (bpy, gpu, gpu_extras, mathutils, blf) live next to this file; put this directory
+first on sys.path before importing it.
+"""
+import importlib.util
+import os
+import sys
+
+import bpy
+from bpy import _runtime
+from bpy._runtime import Area, Event, Screen, Window, context, stats
+
+class UILayout:
+    """Accepts any layout call so panel/preferences draw() code can run."""
+    def __init__(self): self.calls = []
+    def __getattr__(self, name):
+        if name.startswith("__"): raise AttributeError(name)
+        def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return UILayout()
+        return call
+    def __setattr__(self, name, value):
+        if name == "calls": object.__setattr__(self, name, value)
+
+def reset_runtime():
+    from bpy import utils, types, msgbus, ops
+    from bpy.app import timers, handlers
+    context.__init__(); stats.clear(); _runtime.current_event = None
+    utils._registered.clear(); ops._operators.clear()
+    types.SpaceView3D._draw_handlers.clear(); types.VIEW3D_MT_view._draw_funcs = None
+    timers.clear(); msgbus._subscriptions.clear()
+    for name in ("load_pre", "load_post", "save_pre", "save_post", "depsgraph_update_post"):
+        getattr(handlers, name).clear()
+
+def load_addon(path, name="Edge_Zone_Navigation"):
+    sys.modules.pop(name, None)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "Edge_Zone_Navigation.py")
+
+class Harness:
+    def __init__(self, addon_path=ADDON_PATH, layout='single', size=(1920, 1080), register=True, windows=1):
+        reset_runtime()
+        self.wm = context.window_manager
+        for index in range(windows):
+            self.add_window(layout, size)
+        context.window = self.wm.windows[0]
+        self.addon = load_addon(addon_path)
+        if register: self.addon.register()
+
+    def add_window(self, layout='single', size=(1920, 1080)):
+        width, height = size
+        if layout == 'single':
+            areas = [Area('VIEW_3D', 0, 0, width, height)]
+        elif layout == 'quad':
+            areas = [Area('VIEW_3D', 0, 0, width, height, quad=True)]
+        elif layout == 'split':
+            half = width // 2
+            areas = [Area('VIEW_3D', 0, 0, half, height), Area('VIEW_3D', half, 0, width - half, height)]
+        elif layout == 'mixed':
+            areas = [Area('OUTLINER', 0, 0, 300, height), Area('VIEW_3D', 300, 0, width - 300, height)]
+        else:
+            raise ValueError(layout)
+        window = Window(Screen(areas), 0, 0, width, height)
+        self.wm.windows.append(window)
+        return window
+
+    @property
+    def window(self): return context.window
+
+    def view3d_area(self, index=0, window=None):
+        window = window or context.window
+        return [a for a in window.screen.areas if a.type == 'VIEW_3D'][index]
+
+    def window_region(self, area=None, index=0):
+        area = area or self.view3d_area()
+        return [r for r in area.regions if r.type == 'WINDOW'][index]
+
+    # --- Timers ---
+    def advance(self, seconds):
+        """Runs bpy.app.timers and delivers TIMER events for every window-manager timer."""
+        ran = bpy.app.timers.advance(seconds)
+        for timer in list(self.wm.timers):
+            self.send(Event('TIMER', 'NOTHING', *context.window.cursor_position), window=timer.window)
+        return ran
+
+    def start_listener(self, area=None):
+        area = area or self.view3d_area(); region = self.window_region(area)
+        with context.temp_override(window=context.window, area=area, region=region):
+            return bpy.ops.view3d.edge_zone_navigation('INVOKE_DEFAULT')
+
+    # --- Events ---
+    def _region_at(self, window, x, y):
+        for area in window.screen.areas:
+            if area.x <= x < area.x + area.width and area.y <= y < area.y + area.height:
+                for region in reversed(area.regions):
+                    if region.x <= x < region.x + region.width and region.y <= y < region.y + region.height:
+                        if region.type in {'WINDOW', 'UI', 'HEADER'}: return area, region
+                return area, None
+        return None, None
+
+    def send(self, event, window=None):
+        """Dispatches one event like wm_handlers_do: modal handlers first, then keymaps. Returns True if handled."""
+        window = window or context.window
+        context.window = window
+        window.cursor_position = (event.mouse_x, event.mouse_y)
+        _runtime.current_event = event
+        handled = self._dispatch(window, event)
+        while window.pending_events: # Synthetic events, e.g. from cursor_warp
+            pending = window.pending_events.pop(0)
+            window.cursor_position = (pending.mouse_x, pending.mouse_y)
+            _runtime.current_event = pending
+            self._dispatch(window, pending)
+        _runtime.current_event = None
+        return handled
+
+    def _dispatch(self, window, event):
+        for handler in list(self.wm.handlers):
+            h_window, op, area, region = handler
+            if h_window is not window or handler not in self.wm.handlers: continue
+            if area is not None and area not in window.screen.areas: area = None; region = None
+            event.mouse_region_x = event.mouse_x - (region.x if region else 0)
+            event.mouse_region_y = event.mouse_y - (region.y if region else 0)
+            with context.temp_override(window=window, area=area, region=region):
+                stats.bump("modal.calls")
+                result = op.modal(context, event)
+            if 'FINISHED' in result or 'CANCELLED' in result:
+                if handler in self.wm.handlers: self.wm.handlers.remove(handler)
+                if window.grab_owner is op: window.grab_owner = None
+            if 'PASS_THROUGH' not in result: return True
+        return self._dispatch_keymaps(window, event)
+
+    def _dispatch_keymaps(self, window, event):
+        area, region = self._region_at(window, event.mouse_x, event.mouse_y)
+        if area is None or region is None or area.type != 'VIEW_3D' or region.type != 'WINDOW': return False
+        event.mouse_region_x = event.mouse_x - region.x; event.mouse_region_y = event.mouse_y - region.y
+        keymap = self.wm.keyconfigs.addon.keymaps.get("3D View")
+        if keymap is None: return False
+        for kmi in list(keymap.keymap_items):
+            if not kmi.active or kmi.type != event.type or kmi.value not in {event.value, 'ANY'}: continue
+            cls = bpy.ops._operators.get(kmi.idname)
+            if cls is None: continue
+            with context.temp_override(window=window, area=area, region=region):
+                poll = getattr(cls, "poll", None)
+                if poll is not None and not poll(context): continue
+                stats.bump("keymap.invoke")
+                result = bpy.ops.call(kmi.idname, 'INVOKE_DEFAULT')
+            if 'PASS_THROUGH' not in result: return True
+        return False
+
+    def event(self, type, value='NOTHING', x=0, y=0, window=None):
+        return self.send(Event(type, value, x, y), window=window)
+
+    def move(self, x, y, window=None): return self.event('MOUSEMOVE', 'NOTHING', x, y, window)
+    def press(self, x, y, type='RIGHTMOUSE', window=None): return self.event(type, 'PRESS', x, y, window)
+    def release(self, x, y, type='RIGHTMOUSE', window=None): return self.event(type, 'RELEASE', x, y, window)
+
+    def drag(self, start, deltas, type='RIGHTMOUSE', window=None):
+        """Press at start, move by each (dx, dy) relative to the current cursor, release."""
+        window = window or context.window
+        x, y = start
+        self.press(x, y, type, window)
+        for dx, dy in deltas:
+            if window.grab_owner is None: x, y = window.cursor_position
+            x += dx; y += dy
+            self.move(x, y, window)
+        self.release(x, y, type, window)
+
+    # --- Drawing ---
+    def draw(self, window=None):
+        """Runs POST_PIXEL draw handlers for every WINDOW region of every 3D View, like one redraw."""
+        window = window or context.window
+        count = 0
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D': continue
+            for region in area.regions:
+                if region.type != 'WINDOW': continue
+                for callback, args, region_type, draw_type in list(bpy.types.SpaceView3D._draw_handlers):
+                    with context.temp_override(window=window, area=area, region=region):
+                        stats.bump("draw.callback"); count += 1
+                        callback(*args)
+        return count
+
+    def draw_panel(self, cls_name="VIEW3D_PT_edge_zone_navigation_panel"):
+        cls = getattr(self.addon, cls_name)
+        panel = cls(); panel.layout = UILayout()
+        panel.draw(context)
+        return panel.layout
+
+    def unregister(self): self.addon.unregister()
@@ -0,0 +1,101 @@
+"""Minimal pure-Python mathutils subset."""
+import math
+
+class Vector:
+    __slots__ = ("_v",)
+    def __init__(self, seq=(0.0, 0.0, 0.0)): self._v = [float(c) for c in seq]
+    def __len__(self): return len(self._v)
+    def __getitem__(self, i): return self._v[i]
+    def __setitem__(self, i, v): self._v[i] = float(v)
+    def __iter__(self): return iter(self._v)
+    def __repr__(self): return f"Vector({tuple(self._v)})"
+    def __add__(self, o): return Vector(a + b for a, b in zip(self._v, o))
+    def __sub__(self, o): return Vector(a - b for a, b in zip(self._v, o))
+    def __mul__(self, k): return Vector(a * k for a in self._v)
+    __rmul__ = __mul__
+    def __neg__(self): return Vector(-a for a in self._v)
+    def __eq__(self, o):
+        try: return len(o) == len(self._v) and all(a == b for a, b in zip(self._v, o))
+        except TypeError: return NotImplemented
+    x = property(lambda s: s._v[0]); y = property(lambda s: s._v[1])
+    z = property(lambda s: s._v[2]); w = property(lambda s: s._v[3])
+    @property
+    def xyz(self): return Vector(self._v[:3])
+    @property
+    def length(self): return math.sqrt(sum(a * a for a in self._v))
+    def copy(self): return Vector(self._v)
+    def to_4d(self): return Vector((self._v + [0.0, 0.0, 0.0])[:3] + [1.0])
+    def to_tuple(self): return tuple(self._v)
+
+class Quaternion:
+    __slots__ = ("w", "x", "y", "z")
+    def __init__(self, seq=(1.0, 0.0, 0.0, 0.0), angle=None):
+        if angle is None:
+            self.w, self.x, self.y, self.z = (float(c) for c in seq)
+        else:
+            ax, ay, az = seq; n = math.sqrt(ax * ax + ay * ay + az * az) or 1.0
+            s = math.sin(angle / 2.0) / n
+            self.w, self.x, self.y, self.z = math.cos(angle / 2.0), ax * s, ay * s, az * s
+    def __iter__(self): return iter((self.w, self.x, self.y, self.z))
+    def __getitem__(self, i): return (self.w, self.x, self.y, self.z)[i]
+    def __len__(self): return 4
+    def __repr__(self): return f"Quaternion(({self.w}, {self.x}, {self.y}, {self.z}))"
+    def __matmul__(self, o):
+        if isinstance(o, Quaternion):
+            w1, x1, y1, z1 = self; w2, x2, y2, z2 = o
+            return Quaternion((w1*w2 - x1*x2 - y1*y2 - z1*z2, w1*x2 + x1*w2 + y1*z2 - z1*y2,
+                               w1*y2 - x1*z2 + y1*w2 + z1*x2, w1*z2 + x1*y2 - y1*x2 + z1*w2))
+        return self.to_matrix() @ Vector(o)
+    def normalize(self):
+        n = math.sqrt(self.w ** 2 + self.x ** 2 + self.y ** 2 + self.z ** 2) or 1.0
+        self.w /= n; self.x /= n; self.y /= n; self.z /= n
+    def normalized(self):
+        q = self.copy(); q.normalize(); return q
+    def copy(self): return Quaternion((self.w, self.x, self.y, self.z))
+    def inverted(self): return Quaternion((self.w, -self.x, -self.y, -self.z))
+    def to_matrix(self):
+        w, x, y, z = self
+        return Matrix(((1 - 2*(y*y + z*z), 2*(x*y - z*w), 2*(x*z + y*w)),
+                       (2*(x*y + z*w), 1 - 2*(x*x + z*z), 2*(y*z - x*w)),
+                       (2*(x*z - y*w), 2*(y*z + x*w), 1 - 2*(x*x + y*y))))
+
+class _Columns:
+    __slots__ = ("_m",)
+    def __init__(self, m): self._m = m
+    def __getitem__(self, j): return Vector(row[j] for row in self._m._rows)
+
+class Matrix:
+    __slots__ = ("_rows",)
+    def __init__(self, rows=((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))):
+        self._rows = [[float(c) for c in r] for r in rows]
+    @classmethod
+    def Identity(cls, n): return cls([[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)])
+    def __getitem__(self, i): return Vector(self._rows[i])
+    def __len__(self): return len(self._rows)
+    def __iter__(self): return (Vector(r) for r in self._rows)
+    @property
+    def col(self): return _Columns(self)
+    def copy(self): return Matrix(self._rows)
+    def __matmul__(self, o):
+        if isinstance(o, Matrix):
+            cols = list(zip(*o._rows))
+            return Matrix([[sum(a * b for a, b in zip(r, c)) for c in cols] for r in self._rows])
+        return Vector(sum(a * b for a, b in zip(r, o)) for r in self._rows)
+    def to_4x4(self):
+        n = len(self._rows); m = Matrix.Identity(4)
+        for i in range(min(n, 4)):
+            for j in range(min(n, 4)): m._rows[i][j] = self._rows[i][j]
+        return m
+    def inverted_safe(self):
+        n = len(self._rows)
+        a = [r[:] + [1.0 if i == j else 0.0 for j in range(n)] for i, r in enumerate(self._rows)]
+        for c in range(n):
+            p = max(range(c, n), key=lambda r: abs(a[r][c]))
+            if abs(a[p][c]) < 1e-12: return Matrix.Identity(n)
+            a[c], a[p] = a[p], a[c]
+            pv = a[c][c]; a[c] = [v / pv for v in a[c]]
+            for r in range(n):
+                if r != c and a[r][c]:
+                    f = a[r][c]; a[r] = [v - f * w for v, w in zip(a[r], a[c])]
+        return Matrix([r[n:] for r in a])
+    inverted = inverted_safe
@@ -0,0 +1,71 @@
+"""Headless replay of Edge Zone Navigation recordings, and synthetic recordings to replay.
+
+Replays a recording (made with the panel's Record button, or with --record here) through the
+addon's drag code under the headless stubs. It reports the time per event and the largest
+difference from the recorded views. Replay uses the direct engines; drags recorded with view_roll/
+view_pan (stepped engine, camera or locked views) are replayed but not checked. Exit status is 1 if a
+drag does not end at its recorded view, or if no drag could be checked.
+
+    python benchmarks/replay_session.py session.eznrec [--repeat N]
+    python benchmarks/replay_session.py --record session.eznrec [--scenario roll_and_pan] [--events N] [--engine STEPPED]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "headless"))
+
+from harness import Harness # noqa: E402
+from bpy._runtime import RegionView3D, context # noqa: E402
+import bench_hot_path # noqa: E402
+
+def record(path, scenario, events, overrides):
+    """Runs a bench_hot_path scenario with the recorder on and writes the recording to 'path'."""
+    make_stream, scenario_overrides = bench_hot_path.SCENARIOS[scenario]
+    with contextlib.redirect_stdout(io.StringIO()):
+        h = Harness()
+        prefs = context.preferences.addons[h.addon.__name__].preferences
+        for key, value in dict(scenario_overrides, **overrides).items(): setattr(prefs, key, value)
+        h.advance(1.0)
+        h.addon.session_recorder.start(path, h.addon.get_prefs_snapshot(context))
+        bench_hot_path._replay(h, make_stream(h, events))
+        count = h.addon.session_recorder.stop()
+        h.unregister()
+    return count
+
+def replay(path, repeat):
+    """Best of 'repeat' replays into a fresh view; returns the ReplayResult."""
+    with contextlib.redirect_stdout(io.StringIO()): h = Harness()
+    best = None
+    for _ in range(repeat):
+        result = h.addon.replay_session(path, RegionView3D())
+        if best is None or result.seconds < best.seconds: best = result
+    with contextlib.redirect_stdout(io.StringIO()): h.unregister()
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Recording file")
+    parser.add_argument("--record", action="store_true", help="Write a synthetic recording to 'path' first")
+    parser.add_argument("--scenario", default="roll_and_pan", choices=sorted(name for name in bench_hot_path.SCENARIOS if name != "idle_hover"))
+    parser.add_argument("--events", type=int, default=2000, help="Mouse events in the synthetic recording")
+    parser.add_argument("--drag-input", choices=("WARP", "GRAB"), default="WARP", help="Drag input mode while recording")
+    parser.add_argument("--engine", choices=("DIRECT", "STEPPED"), default="DIRECT", help="Roll and pan engine while recording")
+    parser.add_argument("--repeat", type=int, default=3, help="Replays; the fastest is reported")
+    args = parser.parse_args(argv)
+    if args.record:
+        count = record(args.path, args.scenario, args.events, {"drag_input_mode": args.drag_input, "roll_mode": args.engine, "pan_mode": args.engine})
+        print(f"Recorded {count} events ({args.scenario}) to {args.path}")
+    result = replay(args.path, args.repeat)
+    per_event = result.seconds / result.events * 1e6 if result.events else 0.0
+    print(f"{result.drags} drags, {result.events} events, {per_event:.2f} us/event; {result.checked} drags checked, "
+          f"max error rotation {result.rotation_error:.2e}, location {result.location_error:.2e}")
+    if result.stepped: print(f"{result.stepped} drags recorded with view_roll/view_pan were not checked")
+    if not result.checked: print("No drag could be checked"); return 1
+    print("Replay matches the recording" if result.matches() else "Replay DIFFERS from the recording")
+    return 0 if result.matches() else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
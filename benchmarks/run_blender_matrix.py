@@ -0,0 +1,158 @@
+"""Runs blender_bench_job.py in background Blender over a matrix of configurations, in parallel.
+
+The matrix is every Blender found (PATH or --blender) x mesh size x preference set. Each job is a
+separate 'blender --background --factory-startup' process; a process pool keeps up to --jobs of
+them running at once. Results go to one JSON file, optionally compared against an earlier one:
+
+    python benchmarks/run_blender_matrix.py --output results.json
+    python benchmarks/run_blender_matrix.py --output new.json --baseline results.json --threshold 0.15
+
+Exit status is 1 if any median got slower than the baseline by more than the threshold.
+"""
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+JOB_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blender_bench_job.py")
+
+PREF_SETS = {
+    "default": {},
+    "stepped": {"roll_mode": 'STEPPED', "pan_mode": 'STEPPED'},
+    "fast_navigate": {"navigation_lod": True},
+    "unpaced": {"coalesce_input": False},
+}
+MESH_SEGMENTS = (32, 128, 512) # UV sphere segments; with level 2 subdivision, about 8k to 2M faces
+
+def find_blenders():
+    """'blender' plus versioned executables like 'blender-3.6' or 'blender4.1' on PATH, one per real file."""
+    found = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        for path in glob.glob(os.path.join(directory, "blender*")):
+            name = os.path.basename(path)
+            if not re.fullmatch(r"blender(-?[\d.]+)?(\.exe)?", name, re.IGNORECASE): continue
+            if os.path.isfile(path) and os.access(path, os.X_OK): found.setdefault(os.path.realpath(path), path)
+    return sorted(found.values())
+
+def blender_version(executable):
+    try: output = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=60).stdout
+    except (OSError, subprocess.SubprocessError): return None
+    match = re.search(r"Blender (\d+\.\d+(?:\.\d+)?)", output)
+    return match.group(1) if match else None
+
+def run_job(job):
+    """Runs one configuration in its own Blender process (called in a pool worker)."""
+    fd, output = tempfile.mkstemp(suffix=".json", prefix="ezn_bench_"); os.close(fd)
+    command = [job["executable"], "--background", "--factory-startup", "--python", JOB_SCRIPT,
+               "--", "--config", json.dumps(job["config"]), "--output", output]
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=job["timeout"])
+        with open(output) as f: result = json.load(f)
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        result = {"error": f"{type(e).__name__}: {e}"}
+        completed = None
+    finally:
+        try: os.remove(output)
+        except OSError: pass
+    if completed is not None and completed.returncode != 0 and "error" not in result:
+        result["error"] = f"exit status {completed.returncode}: {completed.stderr[-2000:]}"
+    result.update(key=job["key"], blender_path=job["executable"], wall_s=time.perf_counter() - start)
+    return result
+
+def build_jobs(blenders, mesh_sizes, pref_names, args):
+    jobs = []
+    for executable, version in blenders:
+        for segments in mesh_sizes:
+            for pref_name in pref_names:
+                config = {"mesh_segments": segments, "subdivision_levels": args.subdivision_levels, "prefs": PREF_SETS[pref_name],
+                          "pref_set": pref_name, "moves": args.moves, "repeat": args.repeat}
+                jobs.append({"key": f"{version}|{segments}|{pref_name}", "executable": executable, "config": config, "timeout": args.timeout})
+    return jobs
+
+# --- Baseline ---
+def flatten_metrics(result, prefix=""):
+    """{'drag': {'roll': {'median_us': 3.1}}} -> {'drag.roll': 3.1}: every median in a job result."""
+    metrics = {}
+    for name, value in result.items():
+        if not isinstance(value, dict) or name == "config": continue
+        if "median_us" in value: metrics[prefix + name] = value["median_us"]
+        else: metrics.update(flatten_metrics(value, prefix + name + "."))
+    return metrics
+
+def compare(results, baseline, threshold):
+    """Returns (lines, regression count) comparing medians of jobs with the same key."""
+    previous = {r["key"]: flatten_metrics(r) for r in baseline.get("results", []) if "key" in r}
+    lines = []; regressions = 0
+    for result in results:
+        old = previous.get(result["key"])
+        if old is None: lines.append(f"{result['key']}: not in baseline"); continue
+        for name, value in sorted(flatten_metrics(result).items()):
+            if name not in old or old[name] <= 0: continue
+            ratio = value / old[name]
+            flag = ""
+            if ratio > 1.0 + threshold: flag = "  REGRESSION"; regressions += 1
+            elif ratio < 1.0 - threshold: flag = "  faster"
+            lines.append(f"{result['key']:<28} {name:<24} {old[name]:12.2f} -> {value:12.2f} us  x{ratio:5.2f}{flag}")
+    return lines, regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blender", action="append", help="Blender executable (repeatable); default: every blender on PATH")
+    parser.add_argument("--mesh-sizes", default=",".join(map(str, MESH_SEGMENTS)), help="Comma-separated UV sphere segment counts")
+    parser.add_argument("--subdivision-levels", type=int, default=2, help="Viewport levels of the mesh's Subdivision modifier")
+    parser.add_argument("--prefs", default=",".join(PREF_SETS), help=f"Comma-separated preference sets from: {', '.join(PREF_SETS)}")
+    parser.add_argument("--moves", type=int, default=2000, help="Mouse moves per scripted drag")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement inside each job")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Blender processes running at once")
+    parser.add_argument("--timeout", type=float, default=900.0, help="Seconds before a job is killed")
+    parser.add_argument("--output", default="blender_bench.json", help="Result JSON file")
+    parser.add_argument("--baseline", help="Earlier result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    pref_names = [name.strip() for name in args.prefs.split(",") if name.strip()]
+    unknown = [name for name in pref_names if name not in PREF_SETS]
+    if unknown: parser.error(f"unknown preference sets: {', '.join(unknown)}")
+    mesh_sizes = [int(size) for size in args.mesh_sizes.split(",") if size.strip()]
+
+    blenders = []
+    for executable in args.blender or find_blenders():
+        executable = shutil.which(executable) or executable
+        version = blender_version(executable)
+        if version is None: print(f"Skipping {executable}: not a working Blender", file=sys.stderr); continue
+        blenders.append((executable, version))
+    if not blenders: sys.exit("No Blender found: put it on PATH or pass --blender.")
+
+    jobs = build_jobs(blenders, mesh_sizes, pref_names, args)
+    print(f"{len(jobs)} jobs on {min(args.jobs, len(jobs))} processes: " + ", ".join(f"Blender {v}" for _, v in blenders))
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for result in pool.map(run_job, jobs):
+            results.append(result)
+            status = f"ERROR {result['error'].splitlines()[-1]}" if "error" in result else f"{result['wall_s']:.1f} s"
+            print(f"  {result['key']:<28} {status}")
+
+    report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "host": platform.node(), "cpu_count": os.cpu_count(),
+              "python": platform.python_version(), "results": results}
+    with open(args.output, "w") as f: json.dump(report, f, indent=1)
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f: baseline = json.load(f)
+        lines, regressions = compare(results, baseline, args.threshold)
+        print("\n".join(lines))
+        print(f"{regressions} regression(s) over {args.threshold:.0%}")
+        if regressions: return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Fast Navigate (NavigationLOD) puts every viewport setting back however a zone drag ends.
+
+Runs the addon under the headless stubs in benchmarks/headless:
+    python -m pytest tests
+"""
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "benchmarks", "headless"))
+
+from harness import Harness # noqa: E402
+from bpy._runtime import context # noqa: E402
+
+ORIGINAL = {"show_overlays": True, "shading": 'MATERIAL', "show_xray": True, "use_simplify": False, "simplify_subdivision": 6}
+
+class _BrokenOwner:
+    """Setting that can be read but no longer written, like RNA data freed by a file load."""
+    value = 1
+    def __setattr__(self, name, value): raise ReferenceError("StructRNA has been removed")
+
+class NavigationLODTest(unittest.TestCase):
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.h = Harness()
+            prefs = context.preferences.addons[self.h.addon.__name__].preferences
+            prefs.navigation_lod = True; prefs.coalesce_input = False
+            self.h.advance(1.0) # Auto-start the listener
+        self.addon = self.h.addon
+        self.space = self.h.view3d_area().spaces.active; self.render = context.scene.render
+        self.space.shading.type = ORIGINAL["shading"]; self.space.shading.show_xray = ORIGINAL["show_xray"]
+        self.roll_zone = (self.h.window_region().width - 20, self.h.window_region().height // 2)
+
+    def tearDown(self):
+        with contextlib.redirect_stdout(io.StringIO()): self.h.unregister()
+
+    def settings(self):
+        return {"show_overlays": self.space.overlay.show_overlays, "shading": self.space.shading.type, "show_xray": self.space.shading.show_xray,
+                "use_simplify": self.render.use_simplify, "simplify_subdivision": self.render.simplify_subdivision}
+
+    def begin_drag(self):
+        x, y = self.roll_zone
+        self.h.press(x, y); self.h.move(x, y + 10)
+        self.assertTrue(self.addon.navigation_lod.active)
+        self.assertEqual(self.settings(), {"show_overlays": False, "shading": 'SOLID', "show_xray": False, "use_simplify": True, "simplify_subdivision": 0})
+
+    def assert_restored(self):
+        self.assertFalse(self.addon.navigation_lod.active)
+        self.assertEqual(self.settings(), ORIGINAL)
+        self.assertIsNone(self.addon._drag_owner)
+
+    def test_release_restores(self):
+        self.begin_drag()
+        self.h.release(*self.roll_zone)
+        self.assert_restored()
+
+    def test_esc_restores(self):
+        self.begin_drag()
+        self.h.event('ESC', 'PRESS', *self.roll_zone)
+        self.assert_restored()
+
+    def test_listener_cancel_restores(self):
+        self.begin_drag()
+        listener = self.addon.get_listener(context.window)
+        with context.temp_override(window=context.window, area=None, region=None): listener.cancel(context)
+        self.assert_restored()
+
+    def test_failing_restore_entry_restores_the_rest(self):
+        self.begin_drag()
+        broken = _BrokenOwner()
+        self.addon.navigation_lod.saved.insert(1, (broken, "value", 0))
+        before = self.addon.event_log.counts.get("lod_restore", 0)
+        self.h.release(*self.roll_zone)
+        self.assert_restored()
+        self.assertEqual(self.addon.event_log.counts.get("lod_restore", 0), before + 1)
+
+    def test_file_load_mid_drag_restores(self):
+        self.begin_drag()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for handler in list(self.addon.bpy.app.handlers.load_post): handler(None)
+        self.assert_restored()
+        self.h.move(self.roll_zone[0], self.roll_zone[1] + 20) # The old listener exits on its next event
+        self.h.release(*self.roll_zone)
+        self.assert_restored()
+
+    def test_drag_without_fast_navigate_changes_nothing(self):
+        context.preferences.addons[self.addon.__name__].preferences.navigation_lod = False
+        x, y = self.roll_zone
+        self.h.press(x, y); self.h.move(x, y + 10)
+        self.assertFalse(self.addon.navigation_lod.active)
+        self.assertEqual(self.settings(), ORIGINAL)
+        self.h.release(x, y + 10)
+        self.assert_restored()
+
+if __name__ == "__main__":
+    unittest.main()